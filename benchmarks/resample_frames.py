@@ -0,0 +1,62 @@
+# CPU per captured frame when resampling to the 16 kHz ASR rate.
+#
+#     uv run python benchmarks/resample_frames.py
+#
+# One-shot resample_poly redesigns the filter and zero-pads every frame; the
+# streaming resampler reuses cached taps and carries history across frames.
+import argparse
+import math
+import time
+
+import numpy as np
+from scipy.signal import resample_poly
+
+from real_time_captions.audio.resample import StreamingResampler
+
+
+def _one_shot(frames: list[np.ndarray], source_rate: int) -> float:
+    divisor = math.gcd(source_rate, 16_000)
+    started = time.perf_counter()
+    for frame in frames:
+        resample_poly(frame, 16_000 // divisor, source_rate // divisor)
+    return time.perf_counter() - started
+
+
+def _streaming(frames: list[np.ndarray], source_rate: int) -> float:
+    resampler = StreamingResampler(source_rate)
+    started = time.perf_counter()
+    for frame in frames:
+        resampler.process(frame)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--source-rates', type=int, nargs='+', default=[44_100, 48_000]
+    )
+    parser.add_argument('--frame-ms', type=float, default=10.0)
+    parser.add_argument('--seconds', type=float, default=30.0)
+    args = parser.parse_args()
+
+    for source_rate in args.source_rates:
+        size = round(source_rate * args.frame_ms / 1000)
+        samples = (
+            np.random.default_rng(source_rate)
+            .standard_normal(round(source_rate * args.seconds))
+            .astype(np.float32)
+        )
+        frames = [
+            samples[start : start + size]
+            for start in range(0, len(samples), size)
+        ]
+        print(f'{source_rate} Hz, {args.frame_ms:g} ms frames')
+        for name, spent in (
+            ('one-shot', _one_shot(frames, source_rate)),
+            ('streaming', _streaming(frames, source_rate)),
+        ):
+            print(f'{name:>12}: {spent / len(frames) * 1e6:9.1f} us/frame')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# Bytes copied per second of audio on the inference-window path.
+#
+#     uv run python benchmarks/window_copies.py
+#
+# Audio arrives in 10 ms chunks on a simulated session clock while every ASR
+# call occupies the backend for --latency seconds of that clock.
+import argparse
+import time
+
+import numpy as np
+
+from real_time_captions.audio.ring_buffer import AudioRingBuffer
+from real_time_captions.contracts import (
+    AsrHypothesis,
+    InferenceRequest,
+    TargetLanguage,
+)
+from real_time_captions.core import RealtimeCaptionCore
+
+
+class _CountingAsrBackend:
+    def __init__(self) -> None:
+        self.bytes = 0
+
+    def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+        self.bytes += request.samples.nbytes
+        return AsrHypothesis(
+            request.session_id, request.sequence, (), 'en', 1.0, request.audio_end
+        )
+
+
+class _NullTranslationBackend:
+    def translate(self, request: object) -> object:
+        raise AssertionError('native captions never translate')
+
+
+def _legacy(chunks: list[np.ndarray], capacity: int) -> tuple[int, float]:
+    # Previous path: latest() copied the context and InferenceRequest copied
+    # it again for every submitted chunk, coalesced or not.
+    ring = AudioRingBuffer(capacity)
+    copied = 0
+    started = time.perf_counter()
+    for sequence, chunk in enumerate(chunks, start=1):
+        ring.append(chunk)
+        window = ring.latest(ring.size)
+        samples = np.array(window, copy=True)
+        InferenceRequest('bench', sequence, samples, 0.0)
+        copied += window.nbytes + samples.nbytes
+    return copied, time.perf_counter() - started
+
+
+def _handles(
+    chunks: list[np.ndarray], sample_rate: int, context: int, latency: float
+) -> tuple[int, float]:
+    asr = _CountingAsrBackend()
+    core = RealtimeCaptionCore(
+        'bench',
+        asr,
+        _NullTranslationBackend(),  # type: ignore[arg-type]
+        TargetLanguage.NATIVE,
+        sample_rate,
+        context,
+    )
+    busy_until = 0.0
+    audio_end = 0.0
+    spent = 0.0
+    for chunk in chunks:
+        audio_end += len(chunk) / sample_rate
+        started = time.perf_counter()
+        core.enqueue_audio(chunk, audio_end)
+        if audio_end >= busy_until and core.has_ready_work:
+            core.process_next()
+            busy_until = audio_end + latency
+        spent += time.perf_counter() - started
+    return asr.bytes, spent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sample-rate', type=int, default=16_000)
+    parser.add_argument('--context', type=int, default=10)
+    parser.add_argument('--seconds', type=float, default=60.0)
+    parser.add_argument('--latency', type=float, default=0.4)
+    args = parser.parse_args()
+
+    chunk = args.sample_rate // 100
+    chunks = [
+        np.random.default_rng(index).standard_normal(chunk).astype(np.float32)
+        for index in range(round(args.seconds * 100))
+    ]
+    capacity = args.sample_rate * args.context
+    results = {
+        'legacy double copy': _legacy(chunks, capacity),
+        'window handles': _handles(
+            chunks, args.sample_rate, args.context, args.latency
+        ),
+    }
+    print(
+        f'{args.sample_rate} Hz x {args.context} s context, 10 ms chunks, '
+        f'{args.latency * 1000:.0f} ms ASR latency, {args.seconds:g} s audio'
+    )
+    for name, (copied, spent) in results.items():
+        print(
+            f'{name:>20}: {copied / args.seconds / 1e6:10.2f} MB copied/s'
+            f'  {spent / args.seconds * 1000:8.3f} ms CPU/s'
+        )
+
+
+if __name__ == '__main__':
+    main()
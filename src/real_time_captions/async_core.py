@@ -0,0 +1,95 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import numpy as np
+
+from real_time_captions.contracts import CaptionSnapshot
+from real_time_captions.core import RealtimeCaptionCore
+
+# How long close() waits for a worker still inside a backend call.
+_STOP_TIMEOUT = 2.0
+
+
+class AsyncCaptionCore:
+    def __init__(self, core: RealtimeCaptionCore) -> None:
+        self._core = core
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._subscribers: set[
+            asyncio.Queue[CaptionSnapshot | Exception | None]
+        ] = set()
+
+    async def __aenter__(self) -> 'AsyncCaptionCore':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._loop is not None:
+            raise RuntimeError('async core is already started')
+        self._loop = asyncio.get_running_loop()
+        self._core.start_worker(
+            on_snapshot=self._from_worker, on_error=self._from_worker
+        )
+
+    async def close(self, timeout: float = _STOP_TIMEOUT) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        await loop.run_in_executor(None, self._core.stop_worker, timeout)
+        self._loop = None
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+        # A failure no iterator was open to receive is raised here instead.
+        error = self._core.take_worker_error()
+        if error is not None:
+            raise error
+
+    async def submit_audio(
+        self, samples: np.ndarray, audio_end: float
+    ) -> CaptionSnapshot:
+        self._require_started()
+        return self._core.submit_audio(samples, audio_end)
+
+    async def finalize(self) -> CaptionSnapshot:
+        loop = self._require_started()
+        return await loop.run_in_executor(None, self._core.finalize)
+
+    def snapshot(self) -> CaptionSnapshot:
+        return self._core.snapshot()
+
+    def snapshots(self) -> AsyncIterator[CaptionSnapshot]:
+        self._require_started()
+        queue: asyncio.Queue[CaptionSnapshot | Exception | None] = (
+            asyncio.Queue()
+        )
+        self._subscribers.add(queue)
+        return self._stream(queue)
+
+    async def _stream(
+        self, queue: asyncio.Queue[CaptionSnapshot | Exception | None]
+    ) -> AsyncIterator[CaptionSnapshot]:
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self._subscribers.discard(queue)
+
+    def _require_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            raise RuntimeError('async core is not started')
+        return self._loop
+
+    def _from_worker(self, item: CaptionSnapshot | Exception) -> None:
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._broadcast, item)
+
+    def _broadcast(self, item: CaptionSnapshot | Exception) -> None:
+        if isinstance(item, Exception) and self._subscribers:
+            self._core.take_worker_error()
+        for queue in self._subscribers:
+            queue.put_nowait(item)
@@ -0,0 +1,73 @@
+from threading import Lock
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+
+class SampleLease:
+    __slots__ = ('_pool', '_slot', '_released')
+
+    def __init__(self, pool: 'SampleBufferPool', slot: int) -> None:
+        self._pool = pool
+        self._slot = slot
+        self._released = False
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        self._pool._return(self._slot)
+
+
+class SampleBufferPool:
+    def __init__(
+        self,
+        buffers: int,
+        buffer_samples: int,
+        dtype: DTypeLike = np.float32,
+    ) -> None:
+        if isinstance(buffers, bool) or buffers <= 0:
+            raise ValueError('buffers must be a positive integer')
+        if isinstance(buffer_samples, bool) or buffer_samples <= 0:
+            raise ValueError('buffer_samples must be a positive integer')
+        # One slab allocated up front; leased buffers are row views into it.
+        self._slab = np.empty((buffers, buffer_samples), dtype=dtype)
+        self._free = list(range(buffers))
+        self._lock = Lock()
+        self._misses = 0
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._slab.dtype
+
+    @property
+    def buffer_samples(self) -> int:
+        return self._slab.shape[1]
+
+    @property
+    def available(self) -> int:
+        with self._lock:
+            return len(self._free)
+
+    @property
+    def misses(self) -> int:
+        with self._lock:
+            return self._misses
+
+    def acquire(self, count: int) -> tuple[np.ndarray, SampleLease | None]:
+        # Falls back to a fresh unpooled array when the pool is exhausted or
+        # the request exceeds the slot size; such buffers carry no lease.
+        with self._lock:
+            if count <= self._slab.shape[1] and self._free:
+                slot = self._free.pop()
+                return self._slab[slot, :count], SampleLease(self, slot)
+            self._misses += 1
+        return np.empty(count, dtype=self._slab.dtype), None
+
+    def _return(self, slot: int) -> None:
+        with self._lock:
+            self._free.append(slot)
@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
 
+from .buffer_pool import SampleLease
+
 
 @dataclass(frozen=True, slots=True)
 class AudioFrame:
@@ -12,8 +14,24 @@ class AudioFrame:
     sequence: int
     # Session-relative seconds from the start of the current capture session.
     captured_at: float
+    # Set when samples are a pooled buffer the frame adopts without copying;
+    # release() hands it back once the consumer is done with the samples.
+    lease: SampleLease | None = field(default=None, compare=False, repr=False)
 
     def __post_init__(self) -> None:
-        owned = np.array(self.samples, copy=True)
+        if self.lease is None:
+            owned = np.array(self.samples, copy=True)
+        else:
+            owned = self.samples.view()
         owned.setflags(write=False)
         object.__setattr__(self, 'samples', owned)
+
+    def release(self) -> None:
+        # The slot may be handed out again at once, so the frame stops
+        # viewing it: released samples read as empty instead of changing.
+        if self.lease is None or self.lease.released:
+            return
+        empty = np.empty(0, dtype=self.samples.dtype)
+        empty.setflags(write=False)
+        object.__setattr__(self, 'samples', empty)
+        self.lease.release()
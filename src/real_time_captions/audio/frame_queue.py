@@ -1,9 +1,33 @@
 from collections import deque
 from threading import Condition
+from time import monotonic, sleep
+from typing import Protocol
 
 from real_time_captions.audio.frame import AudioFrame
 
 
+class FrameQueue(Protocol):
+    @property
+    def size(self) -> int: ...
+
+    @property
+    def dropped_frames(self) -> int: ...
+
+    def put(self, frame: AudioFrame) -> None: ...
+
+    def get(self, timeout: float | None = None) -> AudioFrame | None: ...
+
+    def get_many(
+        self, max_frames: int | None = None, timeout: float | None = None
+    ) -> list[AudioFrame]: ...
+
+    def drain_into(self, frames: list[AudioFrame]) -> int: ...
+
+    def clear(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
 class BoundedFrameQueue:
     def __init__(self, max_frames: int) -> None:
         if isinstance(max_frames, bool) or max_frames <= 0:
@@ -25,11 +49,14 @@ class BoundedFrameQueue:
             return self._dropped_frames
 
     def put(self, frame: AudioFrame) -> None:
+        # Frames the queue discards never reach a consumer, so their pooled
+        # buffers are released here.
         with self._condition:
             if self._closed:
+                frame.release()
                 return
             if len(self._frames) == self._max_frames:
-                self._frames.popleft()
+                self._frames.popleft().release()
                 self._dropped_frames += 1
             self._frames.append(frame)
             self._condition.notify()
@@ -43,12 +70,148 @@ class BoundedFrameQueue:
                 )
             return self._frames.popleft() if self._frames else None
 
-    def clear(self) -> None:
+    def get_many(
+        self, max_frames: int | None = None, timeout: float | None = None
+    ) -> list[AudioFrame]:
+        # Waits like get() for the first frame, then takes up to max_frames
+        # queued frames under the same lock acquisition.
+        _check_max_frames(max_frames)
+        with self._condition:
+            if not self._frames and not self._closed:
+                self._condition.wait_for(
+                    lambda: bool(self._frames) or self._closed,
+                    timeout=timeout,
+                )
+            return _take(self._frames, max_frames)
+
+    def drain_into(self, frames: list[AudioFrame]) -> int:
         with self._condition:
+            count = len(self._frames)
+            frames.extend(self._frames)
             self._frames.clear()
+            return count
+
+    def clear(self) -> None:
+        with self._condition:
+            self._release_all()
 
     def close(self) -> None:
         with self._condition:
             self._closed = True
-            self._frames.clear()
+            self._release_all()
             self._condition.notify_all()
+
+    def _release_all(self) -> None:
+        while self._frames:
+            self._frames.popleft().release()
+
+
+class SpscFrameQueue:
+    # One producer (the capture callback) and one consumer. The producer only
+    # performs deque appends and pops, which CPython runs atomically, so it
+    # never waits on a lock or notifies; the consumer polls and drains
+    # everything that accumulated since its last wake.
+    def __init__(self, max_frames: int, *, poll_interval: float = 0.01) -> None:
+        if isinstance(max_frames, bool) or max_frames <= 0:
+            raise ValueError('max_frames must be a positive integer')
+        if poll_interval <= 0:
+            raise ValueError('poll_interval must be positive')
+        self._max_frames = max_frames
+        self._poll_interval = poll_interval
+        self._frames: deque[AudioFrame] = deque()
+        self._closed = False
+        # Written only by the producer.
+        self._dropped_frames = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._frames)
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._dropped_frames
+
+    def put(self, frame: AudioFrame) -> None:
+        if self._closed:
+            frame.release()
+            return
+        if len(self._frames) >= self._max_frames:
+            # The consumer may take the head first; popleft hands each frame
+            # to exactly one side, and the queue never exceeds its bound.
+            try:
+                dropped = self._frames.popleft()
+            except IndexError:
+                pass
+            else:
+                dropped.release()
+                self._dropped_frames += 1
+        self._frames.append(frame)
+        if self._closed:
+            self._release_all()
+
+    def get(self, timeout: float | None = None) -> AudioFrame | None:
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            try:
+                return self._frames.popleft()
+            except IndexError:
+                pass
+            if self._closed:
+                return None
+            wait = self._poll_interval
+            if deadline is not None:
+                wait = min(wait, deadline - monotonic())
+                if wait <= 0:
+                    return None
+            sleep(wait)
+
+    def get_many(
+        self, max_frames: int | None = None, timeout: float | None = None
+    ) -> list[AudioFrame]:
+        _check_max_frames(max_frames)
+        first = self.get(timeout)
+        if first is None:
+            return []
+        frames = [first]
+        if max_frames is not None:
+            max_frames -= 1
+        frames.extend(_take(self._frames, max_frames))
+        return frames
+
+    def drain_into(self, frames: list[AudioFrame]) -> int:
+        taken = _take(self._frames, None)
+        frames.extend(taken)
+        return len(taken)
+
+    def clear(self) -> None:
+        self._release_all()
+
+    def close(self) -> None:
+        self._closed = True
+        self._release_all()
+
+    def _release_all(self) -> None:
+        while True:
+            try:
+                self._frames.popleft().release()
+            except IndexError:
+                return
+
+
+def _check_max_frames(max_frames: int | None) -> None:
+    if max_frames is not None and (
+        isinstance(max_frames, bool) or max_frames <= 0
+    ):
+        raise ValueError('max_frames must be a positive integer')
+
+
+def _take(source: deque[AudioFrame], limit: int | None) -> list[AudioFrame]:
+    # popleft per frame so the SPSC producer can keep appending and dropping
+    # from the same deque while frames are taken.
+    taken: list[AudioFrame] = []
+    while limit is None or len(taken) < limit:
+        try:
+            taken.append(source.popleft())
+        except IndexError:
+            break
+    return taken
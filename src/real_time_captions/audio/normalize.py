@@ -1,12 +1,138 @@
 import math
+from collections.abc import Sequence
+from functools import lru_cache
 
 import numpy as np
-from scipy.signal import resample_poly
 
 from .frame import AudioFrame
+from .resample import StreamingResampler
+from .ring_buffer import AudioRingBuffer
 
 
-def normalize_frame(frame: AudioFrame, target_rate: int = 16_000) -> np.ndarray:
+def normalize_frame(
+    frame: AudioFrame,
+    target_rate: int = 16_000,
+    *,
+    resampler: StreamingResampler | None = None,
+) -> np.ndarray:
+    _validate(frame, target_rate, resampler)
+    return _normalize(
+        np.asarray(frame.samples),
+        frame.sample_rate,
+        frame.channels,
+        target_rate,
+        resampler,
+    )
+
+
+def normalize_frames(
+    frames: Sequence[AudioFrame],
+    target_rate: int = 16_000,
+    *,
+    resampler: StreamingResampler | None = None,
+) -> np.ndarray:
+    if not frames:
+        return np.zeros(0, dtype=np.float32)
+    first = frames[0]
+    _validate(first, target_rate, resampler)
+    dtype = np.asarray(first.samples).dtype
+    for frame in frames[1:]:
+        if (
+            frame.sample_rate != first.sample_rate
+            or frame.channels != first.channels
+            or np.asarray(frame.samples).dtype != dtype
+        ):
+            raise ValueError(
+                'frames must share sample rate, channels, and dtype'
+            )
+    for frame in frames:
+        if frame.samples.size % first.channels:
+            raise ValueError('frame samples do not fit the channel count')
+    # One concatenation, then a single pass of conversion, downmix, and
+    # resampling over the whole batch.
+    samples = np.concatenate(
+        [np.asarray(frame.samples).reshape(-1) for frame in frames]
+    )
+    return _normalize(
+        samples, first.sample_rate, first.channels, target_rate, resampler
+    )
+
+
+class FrameWriter:
+    def __init__(self, target_rate: int = 16_000) -> None:
+        if (
+            not isinstance(target_rate, (int, np.integer))
+            or isinstance(target_rate, bool)
+            or target_rate <= 0
+        ):
+            raise ValueError('sample rates and channels must be positive')
+        self.target_rate = int(target_rate)
+        self._resampler: StreamingResampler | None = None
+        # Downmixed input for frames that still need resampling; grown on
+        # demand and reused for the rest of the session.
+        self._scratch = np.zeros(0, dtype=np.float32)
+
+    def reset(self) -> None:
+        if self._resampler is not None:
+            self._resampler.reset()
+
+    def write(
+        self,
+        frame: AudioFrame,
+        ring: AudioRingBuffer,
+        audio_end: float | None = None,
+    ) -> int:
+        _validate(frame, self.target_rate, None)
+        samples = np.asarray(frame.samples)
+        if samples.size % frame.channels:
+            raise ValueError('frame samples do not fit the channel count')
+        interleaved = samples.reshape(-1, frame.channels)
+        # Compact rings convert on store, so they take whole arrays rather
+        # than handing out float32 slots to write into.
+        direct = ring.dtype == np.float32
+        if frame.sample_rate == self.target_rate:
+            count = len(interleaved)
+            if not direct or count > ring.capacity:
+                ring.append(
+                    _normalize(
+                        samples,
+                        frame.sample_rate,
+                        frame.channels,
+                        self.target_rate,
+                        None,
+                    ),
+                    audio_end,
+                )
+                return count
+            _downmix_into(interleaved, *ring.reserve(count))
+            ring.commit(count, audio_end)
+            return count
+        resampler = self._resampler
+        if resampler is None or resampler.source_rate != frame.sample_rate:
+            resampler = self._resampler = StreamingResampler(
+                frame.sample_rate, self.target_rate
+            )
+        if len(self._scratch) < len(interleaved):
+            self._scratch = np.empty(
+                max(len(interleaved), 2 * len(self._scratch)),
+                dtype=np.float32,
+            )
+        mono = self._scratch[: len(interleaved)]
+        _downmix_into(interleaved, mono)
+        count = resampler.output_count(len(mono))
+        if not direct or count > ring.capacity:
+            ring.append(resampler.process(mono), audio_end)
+        else:
+            resampler.process_into(mono, ring.reserve(count))
+            ring.commit(count, audio_end)
+        return count
+
+
+def _validate(
+    frame: AudioFrame,
+    target_rate: int,
+    resampler: StreamingResampler | None,
+) -> None:
     rates_and_channels = (frame.sample_rate, frame.channels, target_rate)
     if not all(
         isinstance(value, (int, np.integer))
@@ -15,25 +141,61 @@ def normalize_frame(frame: AudioFrame, target_rate: int = 16_000) -> np.ndarray:
         for value in rates_and_channels
     ):
         raise ValueError('sample rates and channels must be positive')
+    if resampler is not None and (
+        resampler.source_rate,
+        resampler.target_rate,
+    ) != (frame.sample_rate, target_rate):
+        raise ValueError('resampler rates do not match the frame')
 
-    samples = np.asarray(frame.samples)
-    if np.issubdtype(samples.dtype, np.integer):
-        limits = np.iinfo(samples.dtype)
-        is_unsigned = np.issubdtype(samples.dtype, np.unsignedinteger)
-        samples = samples.astype(np.float32)
-        if is_unsigned:
-            midpoint = float(limits.max // 2 + 1)
-            samples = (samples - midpoint) / midpoint
-        else:
-            limit = float(max(abs(limits.min), limits.max))
-            samples = samples / limit
-    else:
-        samples = samples.astype(np.float32, copy=False)
-
-    samples = samples.reshape(-1, frame.channels).mean(axis=1)
-    if frame.sample_rate != target_rate:
-        divisor = math.gcd(frame.sample_rate, target_rate)
-        samples = resample_poly(
-            samples, target_rate // divisor, frame.sample_rate // divisor
+
+def _normalize(
+    samples: np.ndarray,
+    sample_rate: int,
+    channels: int,
+    target_rate: int,
+    resampler: StreamingResampler | None,
+) -> np.ndarray:
+    interleaved = samples.reshape(-1, channels)
+    mono = np.empty(len(interleaved), dtype=np.float32)
+    _downmix_into(interleaved, mono)
+    if resampler is not None:
+        return resampler.process(mono)
+    if sample_rate != target_rate:
+        # One-shot resampling zero-pads every frame edge; pass a
+        # StreamingResampler to carry filter history across frames.
+        from scipy.signal import resample_poly
+
+        divisor = math.gcd(sample_rate, target_rate)
+        return resample_poly(
+            mono, target_rate // divisor, sample_rate // divisor
         ).astype(np.float32)
-    return np.ascontiguousarray(samples)
+    return mono
+
+
+def _downmix_into(samples: np.ndarray, *outputs: np.ndarray) -> None:
+    # Converts and averages frames-by-channels PCM into consecutive float32
+    # outputs without materializing a float copy of the interleaved input.
+    scale, shift = _pcm_scale(samples.dtype, samples.shape[1])
+    offset = 0
+    for out in outputs:
+        part = samples[offset : offset + len(out)]
+        offset += len(out)
+        np.copyto(out, part[:, 0], casting='unsafe')
+        for channel in range(1, part.shape[1]):
+            np.add(out, part[:, channel], out=out, casting='unsafe')
+        if scale != 1.0:
+            out *= scale
+        if shift:
+            out -= shift
+
+
+@lru_cache(maxsize=None)
+def _pcm_scale(dtype: np.dtype, channels: int) -> tuple[float, float]:
+    if dtype.kind == 'u':
+        midpoint = float(np.iinfo(dtype).max // 2 + 1)
+        return 1.0 / (channels * midpoint), 1.0
+    if dtype.kind == 'i':
+        limits = np.iinfo(dtype)
+        limit = float(max(abs(limits.min), limits.max))
+        return 1.0 / (channels * limit), 0.0
+    return 1.0 / channels, 0.0
@@ -0,0 +1,167 @@
+import math
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# Outputs per filter phase above which strided views beat one gather.
+_STRIDED_PHASE_OUTPUTS = 8
+
+
+@lru_cache(maxsize=None)
+def _polyphase_bank(up: int, down: int) -> tuple[np.ndarray, int]:
+    # scipy.signal takes most of a second to import; loading it on first
+    # use keeps it off the core import path that every worker spawn pays.
+    from scipy.signal import firwin
+
+    # The same filter and centering padding scipy.signal.resample_poly
+    # designs, split into `up` phases so each output is one dot product.
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    taps = firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+    pre_pad = down - half_len % down
+    taps = np.concatenate((np.zeros(pre_pad), taps * up))
+    width = -(-len(taps) // up)
+    padded = np.zeros(width * up)
+    padded[: len(taps)] = taps
+    bank = np.ascontiguousarray(padded.reshape(width, up).T)
+    bank.setflags(write=False)
+    return bank, (half_len + pre_pad) // down
+
+
+class StreamingResampler:
+    def __init__(self, source_rate: int, target_rate: int = 16_000) -> None:
+        if not all(
+            isinstance(value, (int, np.integer))
+            and not isinstance(value, bool)
+            and value > 0
+            for value in (source_rate, target_rate)
+        ):
+            raise ValueError('sample rates must be positive')
+        self.source_rate = int(source_rate)
+        self.target_rate = int(target_rate)
+        divisor = math.gcd(self.source_rate, self.target_rate)
+        self._up = self.target_rate // divisor
+        self._down = self.source_rate // divisor
+        self._bank: np.ndarray | None = None
+        self._offset = 0
+        if (self._up, self._down) != (1, 1):
+            self._bank, self._offset = _polyphase_bank(self._up, self._down)
+        self.reset()
+
+    def reset(self) -> None:
+        width = 1 if self._bank is None else self._bank.shape[1]
+        self._history = width - 1
+        # Reused staging area: the last `history` input samples, with zeros
+        # standing in for audio before the stream started, then new input.
+        self._buffer = np.zeros(max(self._history, 1) * 2)
+        self._received = 0
+        self._emitted = 0
+
+    def output_count(self, count: int) -> int:
+        if self._bank is None:
+            return count
+        received = self._received + count
+        ready = -(-received * self._up // self._down) - self._offset
+        return max(ready - self._emitted, 0)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        values = np.asarray(samples).reshape(-1)
+        output = np.empty(self.output_count(len(values)), dtype=np.float32)
+        self.process_into(values, (output,))
+        return output
+
+    def process_into(
+        self, samples: np.ndarray, outputs: Sequence[np.ndarray]
+    ) -> int:
+        # Fills `outputs` in order with exactly output_count(len(samples))
+        # resampled values; their lengths must add up to that count.
+        values = np.asarray(samples).reshape(-1)
+        count = self.output_count(len(values))
+        if sum(len(output) for output in outputs) != count:
+            raise ValueError('outputs must hold exactly the produced samples')
+        if self._bank is None:
+            offset = 0
+            for output in outputs:
+                output[:] = values[offset : offset + len(output)]
+                offset += len(output)
+            return count
+        buffer = self._stage(values)
+        base = self._received - self._history
+        self._received += len(values)
+        for output in outputs:
+            self._filter(buffer, base, self._emitted + len(output), output)
+        self._keep_history(len(buffer))
+        return count
+
+    def flush(self) -> np.ndarray:
+        # Emits the tail as if the stream were zero-padded, matching a
+        # one-shot resample of everything processed, then starts over.
+        if self._bank is None:
+            self.reset()
+            return np.zeros(0, dtype=np.float32)
+        total = -(-self._received * self._up // self._down)
+        last = ((total - 1 + self._offset) * self._down) // self._up
+        tail = max(last - self._received + 1, 0)
+        buffer = self._stage(np.zeros(tail))
+        output = np.empty(max(total - self._emitted, 0), dtype=np.float32)
+        self._filter(buffer, self._received - self._history, total, output)
+        self.reset()
+        return output
+
+    def _stage(self, values: np.ndarray) -> np.ndarray:
+        size = self._history + len(values)
+        if size > len(self._buffer):
+            grown = np.zeros(max(size, 2 * len(self._buffer)))
+            grown[: self._history] = self._buffer[: self._history]
+            self._buffer = grown
+        self._buffer[self._history : size] = values
+        return self._buffer[:size]
+
+    def _keep_history(self, size: int) -> None:
+        self._buffer[: self._history] = self._buffer[
+            size - self._history : size
+        ]
+
+    def _filter(
+        self,
+        buffer: np.ndarray,
+        base: int,
+        stop: int,
+        output: np.ndarray,
+    ) -> None:
+        assert self._bank is not None
+        start = self._emitted
+        self._emitted = max(stop, self._emitted)
+        if stop <= start:
+            return
+        width = self._bank.shape[1]
+        if stop - start < _STRIDED_PHASE_OUTPUTS * self._up:
+            position = (np.arange(start, stop) + self._offset) * self._down
+            columns = (position // self._up - base)[:, None] - np.arange(width)
+            np.einsum(
+                'ij,ij->i',
+                self._bank[position % self._up],
+                buffer[columns],
+                out=output,
+                casting='same_kind',
+            )
+            return
+        # Large batches: outputs `up` apart share a filter phase and their
+        # input windows sit `down` apart, so each phase is one strided
+        # matrix-vector product over a view instead of a gathered copy.
+        windows = sliding_window_view(buffer, width)[:, ::-1]
+        for first in range(start, min(start + self._up, stop)):
+            position = (first + self._offset) * self._down
+            oldest = position // self._up - base - width + 1
+            last = oldest + (len(range(first, stop, self._up)) - 1) * (
+                self._down
+            )
+            np.matmul(
+                windows[oldest : last + 1 : self._down],
+                self._bank[position % self._up],
+                out=output[first - start :: self._up],
+                casting='same_kind',
+            )
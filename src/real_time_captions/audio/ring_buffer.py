@@ -1,33 +1,299 @@
+from dataclasses import dataclass
+
 import numpy as np
+from numpy.typing import DTypeLike
+
+
+# Compact storage trades precision for half the memory. Materialized float32
+# samples within [-1, 1] differ from the input by at most 0.5 / 32767 with
+# int16 storage (values beyond full scale are clipped) and by at most 2**-11
+# of their magnitude, or 2**-25 near zero, with float16 storage.
+_STORAGE_DTYPES = tuple(map(np.dtype, (np.float32, np.float16, np.int16)))
+_INT16_SCALE = 32767.0
+
+
+class AudioRangeEvicted(RuntimeError):
+    pass
 
 
 class AudioRingBuffer:
-    def __init__(self, capacity_samples: int) -> None:
+    def __init__(
+        self,
+        capacity_samples: int,
+        *,
+        sample_rate: int | None = None,
+        dtype: DTypeLike = np.float32,
+    ) -> None:
         if capacity_samples <= 0:
             raise ValueError('capacity_samples must be positive')
-        self._data = np.zeros(capacity_samples, dtype=np.float32)
+        if sample_rate is not None and sample_rate <= 0:
+            raise ValueError('sample_rate must be positive')
+        if np.dtype(dtype) not in _STORAGE_DTYPES:
+            raise ValueError(
+                'storage dtype must be float32, float16, or int16'
+            )
+        self.sample_rate = sample_rate
+        self._data = np.zeros(capacity_samples, dtype=dtype)
         self._write = 0
         self._size = 0
+        # Absolute number of samples ever appended; window handles address
+        # audio on this counter so they survive later appends.
+        self._total = 0
+        # Session-clock time of the newest sample, recorded with the append
+        # that wrote it; time lookups count back from here.
+        self._anchor: tuple[int, float] | None = None
+        self._readers: dict[str, AudioReader] = {}
 
     @property
     def size(self) -> int:
         return self._size
 
-    def append(self, samples: np.ndarray) -> None:
+    @property
+    def dtype(self) -> np.dtype:
+        return self._data.dtype
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    @property
+    def total_samples(self) -> int:
+        return self._total
+
+    @property
+    def readers(self) -> tuple[str, ...]:
+        return tuple(self._readers)
+
+    def add_reader(
+        self, name: str, *, from_oldest: bool = False
+    ) -> 'AudioReader':
+        if name in self._readers:
+            raise ValueError(f'reader already exists: {name}')
+        position = self._total - self._size if from_oldest else self._total
+        reader = AudioReader(self, name, position)
+        self._readers[name] = reader
+        return reader
+
+    def reader(self, name: str) -> 'AudioReader':
+        return self._readers[name]
+
+    def remove_reader(self, name: str) -> None:
+        if self._readers.pop(name, None) is None:
+            raise KeyError(name)
+
+    def append(
+        self, samples: np.ndarray, audio_end: float | None = None
+    ) -> None:
         values = np.asarray(samples, dtype=np.float32).reshape(-1)
+        self._total += len(values)
+        if audio_end is not None:
+            self._anchor = (self._total, audio_end)
         if len(values) >= len(self._data):
             values = values[-len(self._data) :]
         first = min(len(values), len(self._data) - self._write)
-        self._data[self._write : self._write + first] = values[:first]
+        head = self._data[self._write : self._write + first]
+        self._store(head, values[:first])
         rest = len(values) - first
-        self._data[:rest] = values[first:]
+        if rest:
+            self._store(self._data[:rest], values[first:])
         self._write = (self._write + len(values)) % len(self._data)
         self._size = min(len(self._data), self._size + len(values))
 
+    def reserve(self, count: int) -> tuple[np.ndarray, np.ndarray]:
+        # Writable views over the next `count` slots in append order; the
+        # samples become part of the buffer only once commit(count) runs.
+        if self._data.dtype != np.float32:
+            raise ValueError('reserve requires float32 storage')
+        if not 0 <= count <= len(self._data):
+            raise ValueError('count must be within the buffer capacity')
+        first = min(count, len(self._data) - self._write)
+        return (
+            self._data[self._write : self._write + first],
+            self._data[: count - first],
+        )
+
+    def commit(self, count: int, audio_end: float | None = None) -> None:
+        if not 0 <= count <= len(self._data):
+            raise ValueError('count must be within the buffer capacity')
+        self._total += count
+        if audio_end is not None:
+            self._anchor = (self._total, audio_end)
+        self._write = (self._write + count) % len(self._data)
+        self._size = min(len(self._data), self._size + count)
+
+    def restore(self, samples: np.ndarray, total_samples: int) -> None:
+        values = np.asarray(samples, dtype=np.float32).reshape(-1)
+        if len(values) > total_samples:
+            raise ValueError('retained samples exceed total_samples')
+        values = values[-len(self._data) :]
+        self._store(self._data[: len(values)], values)
+        self._write = len(values) % len(self._data)
+        self._size = len(values)
+        self._total = total_samples
+        self._anchor = None
+
     def latest(self, count: int) -> np.ndarray:
         count = min(max(count, 0), self._size)
-        start = (self._write - count) % len(self._data)
-        if start + count <= len(self._data):
-            return self._data[start : start + count].copy()
-        split = len(self._data) - start
-        return np.concatenate((self._data[start:], self._data[: count - split]))
+        return self._copy(self._total - count, self._total)
+
+    def window(self, count: int) -> 'AudioWindow':
+        count = min(max(count, 0), self._size)
+        return AudioWindow(self, self._total - count, self._total)
+
+    def range(self, start_sample: int, end_sample: int) -> 'AudioWindow':
+        if start_sample > end_sample:
+            raise ValueError('range start must not follow its end')
+        if end_sample > self._total:
+            raise ValueError(
+                f'range ends at sample {end_sample}, after the newest sample '
+                f'{self._total}'
+            )
+        oldest = self._total - self._size
+        if start_sample < oldest:
+            raise AudioRangeEvicted(
+                f'samples {start_sample} to {oldest} were already evicted'
+            )
+        return AudioWindow(self, start_sample, end_sample)
+
+    def time_range(
+        self, start_seconds: float, end_seconds: float
+    ) -> 'AudioWindow':
+        return self.range(
+            self.sample_at(start_seconds), self.sample_at(end_seconds)
+        )
+
+    def sample_at(self, seconds: float) -> int:
+        total, audio_end, sample_rate = self._time_anchor()
+        return total - round((audio_end - seconds) * sample_rate)
+
+    def time_of(self, sample: int) -> float:
+        total, audio_end, sample_rate = self._time_anchor()
+        return audio_end - (total - sample) / sample_rate
+
+    def _time_anchor(self) -> tuple[int, float, int]:
+        if self.sample_rate is None:
+            raise ValueError('time lookups require a sample_rate')
+        if self._anchor is None:
+            raise RuntimeError('no session time recorded for this buffer')
+        return (*self._anchor, self.sample_rate)
+
+    def _views(self, start: int, stop: int) -> tuple[np.ndarray, np.ndarray]:
+        head, tail = self._segments(start, stop)
+        if self._data.dtype != np.float32:
+            # Compact storage cannot be handed out as float32 without
+            # converting, so these are copies rather than views.
+            head = self._load(head, np.empty(len(head), dtype=np.float32))
+            tail = self._load(tail, np.empty(len(tail), dtype=np.float32))
+        head.flags.writeable = False
+        tail.flags.writeable = False
+        return head, tail
+
+    def _copy(self, start: int, stop: int) -> np.ndarray:
+        # One allocation; each stored segment is converted into its slice.
+        head, tail = self._segments(start, stop)
+        samples = np.empty(stop - start, dtype=np.float32)
+        self._load(head, samples[: len(head)])
+        self._load(tail, samples[len(head) :])
+        return samples
+
+    def _segments(
+        self, start: int, stop: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        count = stop - start
+        offset = (self._write - (self._total - start)) % len(self._data)
+        first = min(count, len(self._data) - offset)
+        return (
+            self._data[offset : offset + first],
+            self._data[: count - first],
+        )
+
+    @staticmethod
+    def _store(target: np.ndarray, values: np.ndarray) -> None:
+        if target.dtype == np.int16:
+            scaled = np.multiply(values, _INT16_SCALE, dtype=np.float32)
+            np.minimum(scaled, _INT16_SCALE, out=scaled)
+            np.maximum(scaled, -_INT16_SCALE, out=scaled)
+            np.rint(scaled, out=target, casting='unsafe')
+        else:
+            target[:] = values
+
+    @staticmethod
+    def _load(stored: np.ndarray, target: np.ndarray) -> np.ndarray:
+        if stored.dtype == np.int16:
+            np.multiply(
+                stored, 1.0 / _INT16_SCALE, out=target, dtype=np.float32
+            )
+        else:
+            np.copyto(target, stored)
+        return target
+
+
+@dataclass(frozen=True, slots=True)
+class AudioWindow:
+    buffer: AudioRingBuffer
+    # Absolute sample positions on the buffer's append counter.
+    start: int
+    stop: int
+
+    def materialize(self) -> np.ndarray:
+        oldest = self.buffer.total_samples - self.buffer.size
+        start = min(max(self.start, oldest), self.stop)
+        samples = self.buffer._copy(start, self.stop)
+        samples.setflags(write=False)
+        return samples
+
+
+@dataclass(frozen=True, slots=True)
+class RingChunk:
+    # Absolute position of the first sample in head.
+    start: int
+    # Read-only views of ring storage in order; tail is empty unless the
+    # chunk wraps. They alias the ring and are overwritten once the writer
+    # laps them, so consumers copy what they keep.
+    head: np.ndarray
+    tail: np.ndarray
+    # Samples the reader missed because the writer lapped it.
+    lost: int = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.head) + len(self.tail)
+
+
+class AudioReader:
+    def __init__(
+        self, buffer: AudioRingBuffer, name: str, position: int
+    ) -> None:
+        self._buffer = buffer
+        self.name = name
+        self._position = position
+        self.overruns = 0
+        self.lost_samples = 0
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    @property
+    def available(self) -> int:
+        buffer = self._buffer
+        oldest = buffer.total_samples - buffer.size
+        return buffer.total_samples - max(self._position, oldest)
+
+    def read(self, max_samples: int | None = None) -> RingChunk:
+        buffer = self._buffer
+        total = buffer.total_samples
+        oldest = total - buffer.size
+        # A restore can move the counter backwards past this reader.
+        self._position = min(self._position, total)
+        lost = max(oldest - self._position, 0)
+        if lost:
+            self.overruns += 1
+            self.lost_samples += lost
+        start = self._position + lost
+        stop = total
+        if max_samples is not None:
+            stop = min(total, start + max(max_samples, 0))
+        self._position = stop
+        head, tail = buffer._views(start, stop)
+        return RingChunk(start, head, tail, lost)
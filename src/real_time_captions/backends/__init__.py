@@ -1,3 +1,8 @@
-from real_time_captions.backends.protocols import AsrBackend, AudioSource
+from real_time_captions.backends.protocols import (
+    AsrBackend,
+    AudioSource,
+    BatchAsrBackend,
+    StreamingAsrBackend,
+)
 
-__all__ = ['AsrBackend', 'AudioSource']
+__all__ = ['AsrBackend', 'AudioSource', 'BatchAsrBackend', 'StreamingAsrBackend']
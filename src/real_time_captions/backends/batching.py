@@ -0,0 +1,108 @@
+from collections.abc import Callable, Sequence
+from threading import Condition
+from time import monotonic
+
+from real_time_captions.backends.protocols import AsrBackend
+from real_time_captions.contracts import AsrHypothesis, InferenceRequest
+
+
+_BatchCall = Callable[[Sequence[InferenceRequest]], Sequence[AsrHypothesis]]
+
+
+def _key(item: InferenceRequest | AsrHypothesis) -> tuple[str, int]:
+    return item.session_id, item.sequence
+
+
+class BatchingAsrBackend:
+    def __init__(
+        self, backend: AsrBackend, max_batch_size: int, max_wait: float
+    ) -> None:
+        if isinstance(max_batch_size, bool) or max_batch_size <= 0:
+            raise ValueError('max_batch_size must be a positive integer')
+        if max_wait < 0:
+            raise ValueError('max_wait must not be negative')
+        self._backend = backend
+        self._transcribe_batch: _BatchCall | None = getattr(
+            backend, 'transcribe_batch', None
+        )
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._condition = Condition()
+        self._pending: list[InferenceRequest] = []
+        self._results: dict[tuple[str, int], AsrHypothesis | Exception] = {}
+        self._collecting = False
+        self.dispatched_batches = 0
+        self.dispatched_requests = 0
+
+    @property
+    def batching(self) -> bool:
+        return self._transcribe_batch is not None
+
+    @property
+    def restart(self) -> Callable[[], None] | None:
+        # None when the wrapped backend cannot restart, so a watchdog keeps
+        # refusing calls while a timed-out one still runs.
+        return getattr(self._backend, 'restart', None)
+
+    def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+        transcribe_batch = self._transcribe_batch
+        if transcribe_batch is None:
+            return self._backend.transcribe(request)
+
+        key = _key(request)
+        with self._condition:
+            if self._is_pending(key):
+                raise ValueError('request is already waiting for a batch')
+            self._pending.append(request)
+            self._condition.notify_all()
+            while key not in self._results:
+                if self._collecting or not self._is_pending(key):
+                    self._condition.wait()
+                    continue
+                batch = self._collect()
+                self._condition.release()
+                try:
+                    results = self._run(transcribe_batch, batch)
+                finally:
+                    self._condition.acquire()
+                self._results.update(results)
+                self.dispatched_batches += 1
+                self.dispatched_requests += len(batch)
+                self._condition.notify_all()
+            result = self._results.pop(key)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _is_pending(self, key: tuple[str, int]) -> bool:
+        return any(_key(pending) == key for pending in self._pending)
+
+    def _collect(self) -> list[InferenceRequest]:
+        self._collecting = True
+        deadline = monotonic() + self._max_wait
+        while len(self._pending) < self._max_batch_size:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            self._condition.wait(remaining)
+        batch = self._pending[: self._max_batch_size]
+        del self._pending[: self._max_batch_size]
+        self._collecting = False
+        return batch
+
+    @staticmethod
+    def _run(
+        transcribe_batch: _BatchCall, batch: list[InferenceRequest]
+    ) -> dict[tuple[str, int], AsrHypothesis | Exception]:
+        try:
+            hypotheses = transcribe_batch(batch)
+        except Exception as error:
+            return {_key(request): error for request in batch}
+        by_key = {_key(hypothesis): hypothesis for hypothesis in hypotheses}
+        return {
+            _key(request): by_key.get(
+                _key(request),
+                ValueError('batch result is missing for request'),
+            )
+            for request in batch
+        }
@@ -0,0 +1,244 @@
+import multiprocessing
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from typing import Any
+
+import numpy as np
+
+from real_time_captions.captions.translation import (
+    TranslationRequest,
+    TranslationResult,
+)
+from real_time_captions.contracts import AsrHypothesis, InferenceRequest
+from real_time_captions.diagnostics import RuntimeMetrics
+
+
+class WorkerCrashed(RuntimeError):
+    pass
+
+
+def _serve(factory: Callable[[], Any], connection: Connection) -> None:
+    backend = factory()
+    connection.send(('ready', None))
+    segment: SharedMemory | None = None
+    try:
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                return
+            if message[0] == 'stop':
+                return
+            try:
+                if message[0] == 'transcribe':
+                    (
+                        _,
+                        session_id,
+                        sequence,
+                        audio_end,
+                        audio_start,
+                        name,
+                        length,
+                    ) = message
+                    if segment is None or segment.name != name:
+                        if segment is not None:
+                            segment.close()
+                        segment = SharedMemory(name=name)
+                    samples = np.ndarray(
+                        (length,), dtype=np.float32, buffer=segment.buf
+                    )
+                    request = InferenceRequest(
+                        session_id, sequence, samples, audio_end, audio_start
+                    )
+                    del samples
+                    result = backend.transcribe(request)
+                else:
+                    result = backend.translate(message[1])
+                connection.send(('ok', result))
+            except Exception as error:
+                try:
+                    connection.send(('error', error))
+                except Exception:
+                    connection.send(('error', RuntimeError(repr(error))))
+    finally:
+        if segment is not None:
+            segment.close()
+
+
+class ProcessWorkerBackend:
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        metrics: RuntimeMetrics | None = None,
+        *,
+        start_method: str = 'spawn',
+        poll_interval: float = 0.05,
+    ) -> None:
+        self._factory = factory
+        self._metrics = metrics
+        self._context = multiprocessing.get_context(start_method)
+        self._poll_interval = poll_interval
+        self._lock = Lock()
+        self._process: BaseProcess | None = None
+        self._connection: Connection | None = None
+        self._segment: SharedMemory | None = None
+        # A process killed by restart() under a hung call; its exit is not a
+        # crash.
+        self._abandoned: BaseProcess | None = None
+
+    @property
+    def pid(self) -> int | None:
+        process = self._process
+        return None if process is None else process.pid
+
+    def __enter__(self) -> 'ProcessWorkerBackend':
+        self.start()
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._process is None:
+                self._spawn()
+
+    def restart(self) -> None:
+        # Returns once a replacement worker has loaded its backend, so the
+        # load never runs inside the next call's watchdog budget.
+        if self._lock.acquire(blocking=False):
+            try:
+                self._terminate(grace=0.0)
+                self._spawn()
+            finally:
+                self._lock.release()
+            return
+        # A call holds the lock and may be hung: killing its process makes
+        # that call fail and release the lock without respawning.
+        process = self._process
+        if process is not None:
+            self._abandoned = process
+            process.kill()
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                self._terminate(grace=0.0)
+                self._spawn()
+
+    def close(self) -> None:
+        with self._lock:
+            connection = self._connection
+            if connection is not None:
+                try:
+                    connection.send(('stop',))
+                except (BrokenPipeError, OSError):
+                    pass
+            self._terminate(grace=1.0)
+            if self._segment is not None:
+                self._segment.close()
+                self._segment.unlink()
+                self._segment = None
+
+    def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+        with self._lock:
+            if self._process is None:
+                self._spawn()
+            samples = request.samples
+            segment = self._reserve(samples.nbytes)
+            np.ndarray(
+                samples.shape, dtype=np.float32, buffer=segment.buf
+            )[:] = samples
+            return self._call(
+                (
+                    'transcribe',
+                    request.session_id,
+                    request.sequence,
+                    request.audio_end,
+                    request.audio_start,
+                    segment.name,
+                    len(samples),
+                )
+            )
+
+    def translate(self, request: TranslationRequest) -> TranslationResult:
+        with self._lock:
+            if self._process is None:
+                self._spawn()
+            return self._call(('translate', request))
+
+    def _reserve(self, size: int) -> SharedMemory:
+        segment = self._segment
+        if segment is not None and segment.size >= size:
+            return segment
+        if segment is not None:
+            segment.close()
+            segment.unlink()
+        self._segment = SharedMemory(create=True, size=max(size, 1))
+        return self._segment
+
+    def _call(self, message: tuple[Any, ...]) -> Any:
+        process = self._process
+        connection = self._connection
+        assert process is not None and connection is not None
+        try:
+            connection.send(message)
+            while not connection.poll(self._poll_interval):
+                if not process.is_alive():
+                    raise EOFError
+            status, payload = connection.recv()
+        except (EOFError, BrokenPipeError, ConnectionResetError) as error:
+            self._respawn_after_crash()
+            raise WorkerCrashed('AI worker process exited') from error
+        if status == 'error':
+            raise payload
+        return payload
+
+    def _respawn_after_crash(self) -> None:
+        crashed = self._process is not self._abandoned
+        self._abandoned = None
+        self._terminate(grace=0.0)
+        if not crashed:
+            # restart() killed it and spawns the replacement itself.
+            return
+        self._spawn()
+        if self._metrics is not None:
+            self._metrics.record_worker_restart()
+
+    def _spawn(self) -> None:
+        parent, child = self._context.Pipe()
+        process = self._context.Process(
+            target=_serve,
+            args=(self._factory, child),
+            name='caption-ai-worker',
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        # The child reports once its factory returned; calls are only
+        # accepted after that.
+        try:
+            while not parent.poll(self._poll_interval):
+                if not process.is_alive():
+                    raise EOFError
+            parent.recv()
+        except (EOFError, ConnectionResetError) as error:
+            parent.close()
+            process.join()
+            raise WorkerCrashed(
+                'AI worker process exited before it was ready'
+            ) from error
+        self._process = process
+        self._connection = parent
+
+    def _terminate(self, grace: float) -> None:
+        process, self._process = self._process, None
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+        if process is not None:
+            process.join(timeout=grace)
+            if process.is_alive():
+                process.kill()
+                process.join()
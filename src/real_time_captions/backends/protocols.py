@@ -1,8 +1,9 @@
-from typing import Protocol
+from collections.abc import Sequence
+from typing import Protocol, runtime_checkable
 
 from real_time_captions.audio.capture import CaptureDiagnostics
 from real_time_captions.audio.frame import AudioFrame
-from real_time_captions.contracts import AsrHypothesis, InferenceRequest
+from real_time_captions.contracts import AsrHypothesis, InferenceRequest, Word
 
 
 class AudioSource(Protocol):
@@ -13,6 +14,12 @@ class AudioSource(Protocol):
 
     def read(self, timeout: float | None = None) -> AudioFrame | None: ...
 
+    def read_many(
+        self, max_frames: int | None = None, timeout: float | None = None
+    ) -> list[AudioFrame]: ...
+
+    def drain_into(self, frames: list[AudioFrame]) -> int: ...
+
     def stop(self) -> None: ...
 
     def diagnostics(self) -> CaptureDiagnostics: ...
@@ -20,3 +27,20 @@ class AudioSource(Protocol):
 
 class AsrBackend(Protocol):
     def transcribe(self, request: InferenceRequest) -> AsrHypothesis: ...
+
+
+class BatchAsrBackend(AsrBackend, Protocol):
+    def transcribe_batch(
+        self, requests: Sequence[InferenceRequest]
+    ) -> Sequence[AsrHypothesis]: ...
+
+
+@runtime_checkable
+class StreamingAsrBackend(Protocol):
+    # request.samples holds only the audio appended since the previous call;
+    # the hypothesis still covers the whole current utterance.
+    def transcribe_delta(self, request: InferenceRequest) -> AsrHypothesis: ...
+
+    def reset_stream(self, session_id: str) -> None: ...
+
+    def finalize_stream(self, session_id: str) -> tuple[Word, ...]: ...
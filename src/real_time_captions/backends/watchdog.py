@@ -0,0 +1,135 @@
+from collections.abc import Callable
+from threading import Condition, Event, Lock, Thread, current_thread
+from time import monotonic
+from typing import Any, TypeVar
+
+from real_time_captions.diagnostics import RuntimeMetrics
+
+ResultT = TypeVar('ResultT')
+
+# An idle worker thread exits after this long; the next call starts another.
+_WORKER_IDLE_SECONDS = 5.0
+
+
+class BackendTimeout(RuntimeError):
+    pass
+
+
+class BackendWatchdog:
+    def __init__(
+        self,
+        timeout: float,
+        *,
+        restart: Callable[[], None] | None = None,
+        metrics: RuntimeMetrics | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if not timeout > 0:
+            raise ValueError('timeout must be positive')
+        self.timeout = timeout
+        self._restart = restart
+        self._metrics = metrics
+        self._clock = clock
+        self._lock = Lock()
+        # Calls take turns on one worker thread, so a backend never sees
+        # two of them at once.
+        self._turn = Lock()
+        self._condition = Condition()
+        self._job: Callable[[], None] | None = None
+        self._worker: Thread | None = None
+        # Completion of a timed-out call the backend could not be restarted
+        # out of; no new call starts until it is set.
+        self._hung: Event | None = None
+        # When the first unrecovered timeout fired; cleared by the next
+        # successful call.
+        self._failed_at: float | None = None
+
+    def call(self, function: Callable[..., ResultT], *args: Any) -> ResultT:
+        outcome: list[tuple[bool, Any]] = []
+        done = Event()
+
+        def run() -> None:
+            try:
+                outcome.append((True, function(*args)))
+            except BaseException as error:
+                outcome.append((False, error))
+            finally:
+                done.set()
+
+        with self._turn:
+            self._await_hung()
+            self._dispatch(run)
+            if not done.wait(self.timeout):
+                self._expire(done)
+                raise BackendTimeout(
+                    f'backend call exceeded {self.timeout:g} s timeout'
+                )
+        succeeded, value = outcome[0]
+        if not succeeded:
+            raise value
+        self._recovered()
+        return value
+
+    def _await_hung(self) -> None:
+        # A call the backend could not be restarted out of may still finish;
+        # the next call gives it one more timeout before being refused.
+        with self._condition:
+            hung = self._hung
+        if hung is None:
+            return
+        if not hung.wait(self.timeout):
+            raise BackendTimeout('backend is still running a timed-out call')
+        with self._condition:
+            self._hung = None
+
+    def _dispatch(self, job: Callable[[], None]) -> None:
+        with self._condition:
+            self._job = job
+            if self._worker is None:
+                # A daemon thread: a hung call never blocks interpreter
+                # shutdown.
+                self._worker = Thread(
+                    target=self._work, name='caption-backend-call', daemon=True
+                )
+                self._worker.start()
+            else:
+                self._condition.notify_all()
+
+    def _work(self) -> None:
+        worker = current_thread()
+        with self._condition:
+            while self._worker is worker:
+                if self._job is None:
+                    self._condition.wait(_WORKER_IDLE_SECONDS)
+                    if self._job is None and self._worker is worker:
+                        self._worker = None
+                    continue
+                job, self._job = self._job, None
+                self._condition.release()
+                try:
+                    job()
+                finally:
+                    self._condition.acquire()
+
+    def _expire(self, done: Event) -> None:
+        with self._lock:
+            if self._failed_at is None:
+                self._failed_at = self._clock()
+        with self._condition:
+            if self._restart is None:
+                self._hung = done
+            else:
+                # The hung call is abandoned with its worker; the next call
+                # starts a fresh one against the restarted backend.
+                self._worker = None
+        if self._restart is None:
+            return
+        self._restart()
+        if self._metrics is not None:
+            self._metrics.record_worker_restart()
+
+    def _recovered(self) -> None:
+        with self._lock:
+            failed_at, self._failed_at = self._failed_at, None
+        if failed_at is not None and self._metrics is not None:
+            self._metrics.record_recovery_latency(self._clock() - failed_at)
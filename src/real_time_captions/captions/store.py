@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from real_time_captions.captions.translation import (
     TranslationRequest,
     TranslationResult,
@@ -13,6 +15,21 @@ def _append_text(existing: str, addition: str) -> str:
     return ' '.join(part for part in (existing, addition.strip()) if part)
 
 
+@dataclass(frozen=True, slots=True)
+class CaptionStoreState:
+    sequence: int
+    language: str | None
+    source_committed: str
+    source_provisional: str
+    translation_committed: str
+    translation_provisional: str
+    committed_words: tuple[str, ...]
+    pending_committed_words: tuple[str, ...]
+    pending_segment_id: int | None
+    pending_source_language: str | None
+    next_segment_id: int
+
+
 class CaptionStore:
     def __init__(self, session_id: str, target: TargetLanguage) -> None:
         self.session_id = session_id
@@ -139,6 +156,34 @@ class CaptionStore:
         self.translation_provisional = result.provisional
         return True
 
+    def state(self) -> CaptionStoreState:
+        return CaptionStoreState(
+            self.sequence,
+            self.language,
+            self.source_committed,
+            self.source_provisional,
+            self.translation_committed,
+            self.translation_provisional,
+            self._committed_words,
+            self._pending_committed_words,
+            self._pending_segment_id,
+            self._pending_source_language,
+            self._next_segment_id,
+        )
+
+    def restore(self, state: CaptionStoreState) -> None:
+        self.sequence = state.sequence
+        self.language = state.language
+        self.source_committed = state.source_committed
+        self.source_provisional = state.source_provisional
+        self.translation_committed = state.translation_committed
+        self.translation_provisional = state.translation_provisional
+        self._committed_words = state.committed_words
+        self._pending_committed_words = state.pending_committed_words
+        self._pending_segment_id = state.pending_segment_id
+        self._pending_source_language = state.pending_source_language
+        self._next_segment_id = state.next_segment_id
+
     def snapshot(self) -> CaptionSnapshot:
         return CaptionSnapshot(
             self.session_id,
@@ -0,0 +1,122 @@
+import json
+import struct
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+
+from real_time_captions.captions.store import CaptionStoreState
+from real_time_captions.contracts import Word
+from real_time_captions.streaming.language import LanguageState
+from real_time_captions.streaming.stabilizer import StabilizerState
+
+
+_SCHEMA_VERSION = 1
+_HEADER = struct.Struct('<I')
+
+
+@dataclass(frozen=True, slots=True)
+class CoreCheckpoint:
+    session_id: str
+    asr_sequence: int
+    source_revision: int
+    utterance_id: int
+    utterance_active: bool
+    last_words: tuple[Word, ...]
+    store: CaptionStoreState
+    stabilizer: StabilizerState
+    language: LanguageState
+    # Retained ring samples, oldest first, and the ring's absolute append
+    # counter; audio is None when the checkpoint omits audio context.
+    audio: np.ndarray | None = None
+    total_samples: int = 0
+
+    def to_bytes(self) -> bytes:
+        document = {
+            'schema_version': _SCHEMA_VERSION,
+            'session_id': self.session_id,
+            'asr_sequence': self.asr_sequence,
+            'source_revision': self.source_revision,
+            'utterance_id': self.utterance_id,
+            'utterance_active': self.utterance_active,
+            'last_words': _encode_words(self.last_words),
+            'store': asdict(self.store),
+            'stabilizer': {
+                'committed': _encode_words(self.stabilizer.committed),
+                'previous': _encode_words(self.stabilizer.previous),
+                'counts': list(self.stabilizer.counts),
+                'last_committed_end': self.stabilizer.last_committed_end,
+            },
+            'language': asdict(self.language),
+            'audio_samples': None if self.audio is None else len(self.audio),
+            'total_samples': self.total_samples,
+        }
+        header = json.dumps(
+            document, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+        audio = (
+            b''
+            if self.audio is None
+            else np.asarray(self.audio, dtype='<f4').tobytes()
+        )
+        return _HEADER.pack(len(header)) + header + audio
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CoreCheckpoint':
+        try:
+            (length,) = _HEADER.unpack_from(data)
+            raw = json.loads(data[_HEADER.size : _HEADER.size + length])
+        except (struct.error, ValueError) as error:
+            raise ValueError('invalid checkpoint') from error
+        if not isinstance(raw, dict) or raw.get('schema_version') != (
+            _SCHEMA_VERSION
+        ):
+            raise ValueError('unsupported checkpoint schema')
+        try:
+            return cls._decode(raw, data[_HEADER.size + length :])
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError('invalid checkpoint') from error
+
+    @classmethod
+    def _decode(cls, raw: dict[str, Any], payload: bytes) -> 'CoreCheckpoint':
+        audio = None
+        if raw['audio_samples'] is not None:
+            audio = np.frombuffer(
+                payload, dtype='<f4', count=raw['audio_samples']
+            ).astype(np.float32)
+        store = raw['store']
+        stabilizer = raw['stabilizer']
+        return cls(
+            session_id=raw['session_id'],
+            asr_sequence=raw['asr_sequence'],
+            source_revision=raw['source_revision'],
+            utterance_id=raw['utterance_id'],
+            utterance_active=raw['utterance_active'],
+            last_words=_decode_words(raw['last_words']),
+            store=CaptionStoreState(
+                **{
+                    **store,
+                    'committed_words': tuple(store['committed_words']),
+                    'pending_committed_words': tuple(
+                        store['pending_committed_words']
+                    ),
+                }
+            ),
+            stabilizer=StabilizerState(
+                _decode_words(stabilizer['committed']),
+                _decode_words(stabilizer['previous']),
+                tuple(stabilizer['counts']),
+                stabilizer['last_committed_end'],
+            ),
+            language=LanguageState(**raw['language']),
+            audio=audio,
+            total_samples=raw['total_samples'],
+        )
+
+
+def _encode_words(words: tuple[Word, ...]) -> list[list[Any]]:
+    return [[word.text, word.start, word.end] for word in words]
+
+
+def _decode_words(values: list[list[Any]]) -> tuple[Word, ...]:
+    return tuple(Word(text, start, end) for text, start, end in values)
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
+from threading import Event
 
 import numpy as np
 
@@ -31,6 +32,26 @@ class Word:
     end: float
 
 
+class InferenceCancelled(RuntimeError):
+    pass
+
+
+class CancellationToken:
+    def __init__(self) -> None:
+        self._event = Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise InferenceCancelled('inference request was superseded')
+
+
 @dataclass(frozen=True, slots=True)
 class InferenceRequest:
     session_id: str
@@ -38,11 +59,30 @@ class InferenceRequest:
     samples: np.ndarray
     # Session-relative end of the represented audio window, in seconds.
     audio_end: float
+    # Session-relative time of the first sample, when the sender tracks it.
+    audio_start: float | None = None
+    # Set once a newer window makes this one not worth finishing; backends
+    # may check it between decode steps and raise InferenceCancelled.
+    cancellation: CancellationToken | None = field(
+        default=None, compare=False
+    )
 
     def __post_init__(self) -> None:
-        owned = np.array(self.samples, copy=True)
-        owned.setflags(write=False)
-        object.__setattr__(self, 'samples', owned)
+        object.__setattr__(self, 'samples', _read_only_owned(self.samples))
+
+
+def _read_only_owned(samples: np.ndarray) -> np.ndarray:
+    # A read-only array that owns its memory is adopted as-is; anything else
+    # is copied so a retained source array cannot mutate the message.
+    if (
+        isinstance(samples, np.ndarray)
+        and samples.flags.owndata
+        and not samples.flags.writeable
+    ):
+        return samples
+    owned = np.array(samples, copy=True)
+    owned.setflags(write=False)
+    return owned
 
 
 @dataclass(frozen=True, slots=True)
@@ -1,77 +1,509 @@
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Condition, RLock, Thread
+from time import monotonic
+
 import numpy as np
+from numpy.typing import DTypeLike
 
-from real_time_captions.audio.ring_buffer import AudioRingBuffer
-from real_time_captions.backends.protocols import AsrBackend
+from real_time_captions.audio.frame import AudioFrame
+from real_time_captions.audio.normalize import FrameWriter
+from real_time_captions.audio.ring_buffer import (
+    AudioRingBuffer,
+    AudioWindow,
+    RingChunk,
+)
+from real_time_captions.backends.protocols import (
+    AsrBackend,
+    StreamingAsrBackend,
+)
+from real_time_captions.backends.watchdog import BackendWatchdog
 from real_time_captions.captions.store import CaptionStore
 from real_time_captions.captions.translation import TranslationBackend
+from real_time_captions.checkpoint import CoreCheckpoint
 from real_time_captions.contracts import (
+    AsrHypothesis,
+    CancellationToken,
     CaptionSnapshot,
+    InferenceCancelled,
     InferenceRequest,
     StabilizedText,
     TargetLanguage,
     Word,
 )
+from real_time_captions.diagnostics import RuntimeMetrics
+from real_time_captions.streaming.adaptive import AdaptiveWindowController
 from real_time_captions.streaming.language import LanguageSmoother
-from real_time_captions.streaming.scheduler import LatestWindowScheduler
+from real_time_captions.streaming.scheduler import (
+    CadenceScheduler,
+    LatestWindowScheduler,
+)
 from real_time_captions.streaming.stabilizer import HypothesisStabilizer
 
 
+@dataclass(frozen=True, slots=True)
+class _PendingWindow:
+    session_id: str
+    sequence: int
+    window: AudioWindow
+    audio_end: float
+
+
 class RealtimeCaptionCore:
     def __init__(
         self,
         session_id: str,
-        asr: AsrBackend,
+        asr: AsrBackend | StreamingAsrBackend,
         translator: TranslationBackend,
         target: TargetLanguage,
         sample_rate: int,
         context_seconds: int,
+        *,
+        update_interval: float | None = None,
+        max_lag: float | None = None,
+        pipeline_depth: int = 1,
+        supersede_after: float | None = None,
+        asr_timeout: float | None = None,
+        window_controller: AdaptiveWindowController | None = None,
+        commit_overlap: float | None = None,
+        audio_dtype: DTypeLike = np.float32,
+        metrics: RuntimeMetrics | None = None,
+        clock: Callable[[], float] = monotonic,
     ) -> None:
+        if (
+            window_controller is not None
+            and window_controller.max_seconds > context_seconds
+        ):
+            raise ValueError('adaptive window cannot exceed context_seconds')
+        if commit_overlap is not None and commit_overlap < 0:
+            raise ValueError('commit_overlap must be non-negative')
+        if pipeline_depth > 1 and isinstance(asr, StreamingAsrBackend):
+            raise ValueError('streaming backends require pipeline_depth 1')
         self._session_id = session_id
         self._asr = asr
+        self._stream = asr if isinstance(asr, StreamingAsrBackend) else None
+        # Absolute ring position up to which audio was sent to a streaming
+        # backend.
+        self._streamed = 0
         self._translator = translator
         self._asr_sequence = 0
         self._source_revision = 0
         self._utterance_id = 1
         self._utterance_active = False
         self._last_words: tuple[Word, ...] = ()
-        self._audio = AudioRingBuffer(sample_rate * context_seconds)
-        self._scheduler = LatestWindowScheduler()
+        self._sample_rate = sample_rate
+        self._audio = AudioRingBuffer(
+            sample_rate * context_seconds,
+            sample_rate=sample_rate,
+            dtype=audio_dtype,
+        )
+        self._frames = FrameWriter(sample_rate)
+        self._window_controller = window_controller
+        self._commit_overlap = commit_overlap
+        self._metrics = metrics
+        self._clock = clock
+        self._watchdog = (
+            None
+            if asr_timeout is None
+            else BackendWatchdog(
+                asr_timeout,
+                restart=getattr(asr, 'restart', None),
+                metrics=metrics,
+                clock=clock,
+            )
+        )
+        self._scheduler: LatestWindowScheduler[_PendingWindow] = (
+            LatestWindowScheduler(
+                max_lag, depth=pipeline_depth, supersede_after=supersede_after
+            )
+            if update_interval is None
+            else CadenceScheduler(
+                update_interval,
+                max_lag,
+                depth=pipeline_depth,
+                supersede_after=supersede_after,
+            )
+        )
         self._language = LanguageSmoother(2, 0.60)
         self._stabilizer = HypothesisStabilizer(2, 0.8)
         self._store = CaptionStore(session_id, target)
+        # Audio, scheduling and publication state; never held across a
+        # backend call so ingest stays flat while inference is in flight.
+        self._state = Condition()
+        # Serializes stabilizer, store and translation mutations.
+        self._processing = RLock()
+        # Dispatched requests in sequence order, waiting for a processor.
+        self._ready: deque[InferenceRequest] = deque()
+        # Tokens of dispatched, not yet settled requests by ASR sequence.
+        self._cancellations: dict[int, CancellationToken] = {}
+        self._running = 0
+        self._published = self._store.snapshot()
+        self._on_snapshot: Callable[[CaptionSnapshot], None] | None = None
+        self._on_error: Callable[[Exception], None] | None = None
+        self._workers: list[Thread] = []
+        self._stopping = False
+        self._worker_error: Exception | None = None
+
+    @property
+    def session_id(self) -> str:
+        return self._session_id
+
+    @property
+    def worker_running(self) -> bool:
+        return bool(self._workers)
+
+    @property
+    def has_ready_work(self) -> bool:
+        with self._state:
+            return bool(self._ready)
+
+    @property
+    def queue_depth(self) -> int:
+        with self._state:
+            return self._scheduler.queue_depth
+
+    def start_worker(
+        self,
+        on_snapshot: Callable[[CaptionSnapshot], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        with self._state:
+            if self._workers:
+                raise RuntimeError('worker is already running')
+            self._stopping = False
+            self._worker_error = None
+            self._on_snapshot = on_snapshot
+            self._on_error = on_error
+            # One thread per pipeline slot so every in-flight window has a
+            # backend call running.
+            self._workers = [
+                Thread(
+                    target=self._work,
+                    name=f'caption-core-{self._session_id}',
+                    daemon=True,
+                )
+                for _ in range(self._scheduler.depth)
+            ]
+            for worker in self._workers:
+                worker.start()
+
+    def stop_worker(self, timeout: float | None = None) -> None:
+        with self._state:
+            workers = self._workers
+            if not workers:
+                return
+            self._stopping = True
+            self._state.notify_all()
+        for worker in workers:
+            worker.join(timeout)
+        with self._state:
+            self._workers = []
+            self._on_snapshot = None
+            self._on_error = None
+            self._state.notify_all()
 
     def submit_audio(
         self, samples: np.ndarray, audio_end: float
     ) -> CaptionSnapshot:
-        self._audio.append(samples)
+        self.enqueue_audio(samples, audio_end)
+        if not self._workers:
+            while self.process_next() is not None:
+                pass
+        return self.snapshot()
+
+    def submit_frame(
+        self, frame: AudioFrame, audio_end: float
+    ) -> CaptionSnapshot:
+        self.enqueue_frame(frame, audio_end)
+        if not self._workers:
+            while self.process_next() is not None:
+                pass
+        return self.snapshot()
+
+    def enqueue_audio(self, samples: np.ndarray, audio_end: float) -> bool:
+        with self._state:
+            self._audio.append(samples, audio_end)
+            return self._enqueue_window(audio_end)
+
+    def enqueue_frame(self, frame: AudioFrame, audio_end: float) -> bool:
+        # Converts, downmixes and resamples straight into the context ring,
+        # then releases the frame's pooled buffer back to its capture source.
+        try:
+            with self._state:
+                self._frames.write(frame, self._audio, audio_end)
+                return self._enqueue_window(audio_end)
+        finally:
+            frame.release()
+
+    def _enqueue_window(self, audio_end: float) -> bool:
+        # Runs under _state, after the new audio reached the ring.
         self._asr_sequence += 1
-        request = InferenceRequest(
+        pending = _PendingWindow(
             self._session_id,
             self._asr_sequence,
-            self._audio.latest(self._audio.size),
+            self._audio.window(self._audio.size),
             audio_end,
         )
-        active = self._scheduler.submit(request)
+        active = self._scheduler.submit(pending)
+        if active is None and not self._workers:
+            active = self._displace_waiting()
+        self._cancel_superseded()
         if active is None:
-            return self.snapshot()
+            return False
+        self._ready.append(self._dispatch(active))
+        self._state.notify_all()
+        return True
 
-        try:
-            snapshot = self._process(active)
-            pending = self._scheduler.complete(
-                active.session_id, active.sequence
-            )
-            while pending is not None:
-                snapshot = self._process(pending)
-                pending = self._scheduler.complete(
-                    pending.session_id, pending.sequence
+    def audio_range(
+        self, start_seconds: float, end_seconds: float
+    ) -> np.ndarray:
+        # A copy of just that span of retained context on the session clock;
+        # raises AudioRangeEvicted once the ring no longer holds its start.
+        with self._state:
+            return self._audio.time_range(
+                start_seconds, end_seconds
+            ).materialize()
+
+    def add_audio_reader(
+        self, name: str, *, from_oldest: bool = False
+    ) -> None:
+        # A level meter, recorder or VAD consumes the normalized context
+        # audio through read_audio() instead of keeping its own copy.
+        with self._state:
+            self._audio.add_reader(name, from_oldest=from_oldest)
+
+    def remove_audio_reader(self, name: str) -> None:
+        with self._state:
+            self._audio.remove_reader(name)
+
+    def read_audio(
+        self, name: str, max_samples: int | None = None
+    ) -> RingChunk:
+        # Reads under _state so they never observe a half-finished append;
+        # the chunk aliases the ring until a capacity's worth of new audio.
+        with self._state:
+            return self._audio.reader(name).read(max_samples)
+
+    def process_next(self) -> CaptionSnapshot | None:
+        with self._state:
+            # A ready window can age while its host is busy elsewhere.
+            while self._ready and self._scheduler.is_stale(self._ready[0]):
+                stale = self._ready.popleft()
+                self._cancellations.pop(stale.sequence, None)
+                self._undeliver(stale)
+                promoted = self._scheduler.expire(
+                    stale.session_id, stale.sequence
                 )
-            return snapshot
+                if promoted is not None:
+                    self._ready.append(self._dispatch(promoted))
+                self._state.notify_all()
+            if not self._ready:
+                return None
+            request = self._ready.popleft()
+            self._running += 1
+
+        try:
+            snapshot = self._process(request)
+        except InferenceCancelled:
+            with self._state:
+                self._undeliver(request)
+            self._settle(request)
+            if self._metrics is not None:
+                self._metrics.record_cancelled_request()
+            return self.snapshot()
         except Exception:
-            self._scheduler.reset()
+            self._settle(None)
             raise
+        self._settle(request)
+        return snapshot
+
+    def wait_for_snapshot(
+        self, previous: CaptionSnapshot, timeout: float | None = None
+    ) -> CaptionSnapshot | None:
+        with self._state:
+            self._state.wait_for(
+                lambda: self._published != previous
+                or self._worker_error is not None,
+                timeout=timeout,
+            )
+            error, self._worker_error = self._worker_error, None
+            if error is not None:
+                raise error
+            return self._published if self._published != previous else None
+
+    def take_worker_error(self) -> Exception | None:
+        with self._state:
+            error, self._worker_error = self._worker_error, None
+            return error
+
+    def _work(self) -> None:
+        while True:
+            with self._state:
+                self._state.wait_for(
+                    lambda: self._stopping or bool(self._ready)
+                )
+                if self._stopping:
+                    return
+            try:
+                self.process_next()
+            except Exception as error:
+                with self._state:
+                    self._worker_error = error
+                    callback = self._on_error
+                    self._state.notify_all()
+                if callback is not None:
+                    callback(error)
+
+    def _settle(self, completed: InferenceRequest | None) -> None:
+        with self._state:
+            self._running -= 1
+            if completed is None:
+                self._scheduler.reset()
+                self._ready.clear()
+                for token in self._cancellations.values():
+                    token.cancel()
+                self._cancellations.clear()
+            else:
+                self._cancellations.pop(completed.sequence, None)
+                if (
+                    self._scheduler.position(
+                        completed.session_id, completed.sequence
+                    )
+                    is not None
+                ):
+                    promoted = self._scheduler.complete(
+                        completed.session_id, completed.sequence
+                    )
+                    if promoted is not None:
+                        self._ready.append(self._dispatch(promoted))
+            self._state.notify_all()
+
+    def _displace_waiting(self) -> _PendingWindow | None:
+        # Runs under _state. A dispatched window no processor has taken yet
+        # is older than the one just queued. Without worker threads of our
+        # own nothing may take it soon, for example under a busy shared
+        # pool, so the newer window takes its slot.
+        for waiting in self._ready:
+            promoted = self._scheduler.displace(
+                waiting.session_id, waiting.sequence
+            )
+            if promoted is not None:
+                self._ready.remove(waiting)
+                self._cancellations.pop(waiting.sequence, None)
+                self._undeliver(waiting)
+                return promoted
+        return None
+
+    def _cancel_superseded(self) -> None:
+        for sequence, token in self._cancellations.items():
+            if not token.cancelled and self._scheduler.is_superseded(
+                self._session_id, sequence
+            ):
+                token.cancel()
+
+    def _dispatch(self, pending: _PendingWindow) -> InferenceRequest:
+        # The only copy of a window: coalesced windows are never materialized.
+        window = pending.window
+        if self._stream is not None:
+            window = AudioWindow(self._audio, self._streamed, window.stop)
+            self._streamed = window.stop
+        else:
+            window = AudioWindow(
+                self._audio, self._trimmed_start(pending), window.stop
+            )
+        samples = window.materialize()
+        token = CancellationToken()
+        self._cancellations[pending.sequence] = token
+        return InferenceRequest(
+            pending.session_id,
+            pending.sequence,
+            samples,
+            pending.audio_end,
+            pending.audio_end - len(samples) / self._sample_rate,
+            token,
+        )
+
+    def _undeliver(self, request: InferenceRequest) -> None:
+        # Runs under _state. A dispatched delta the backend never received
+        # rewinds the stream so the next delta re-sends its audio; streaming
+        # runs one request at a time, so it is always the newest delta.
+        if self._stream is not None:
+            self._streamed -= len(request.samples)
+
+    def _trimmed_start(self, pending: _PendingWindow) -> int:
+        start = pending.window.start
+        stop = pending.window.stop
+        if self._window_controller is not None:
+            seconds = self._window_controller.window_seconds
+            start = max(start, stop - int(seconds * self._sample_rate))
+        committed_end = self._stabilizer.last_committed_end
+        if self._commit_overlap is not None and committed_end is not None:
+            # Audio before the last committed word only re-decodes final
+            # text; keep a short overlap so the boundary word stays whole.
+            resume = committed_end - self._commit_overlap
+            behind = round((pending.audio_end - resume) * self._sample_rate)
+            start = max(start, min(stop - behind, stop))
+        return start
 
     def _process(self, request: InferenceRequest) -> CaptionSnapshot:
-        hypothesis = self._asr.transcribe(request)
+        if request.cancellation is not None:
+            request.cancellation.raise_if_cancelled()
+        if self._stream is not None:
+            hypothesis = self._call_asr(self._stream.transcribe_delta, request)
+        else:
+            started = self._clock()
+            hypothesis = self._call_asr(self._asr.transcribe, request)
+            elapsed = self._clock() - started
+            self._observe_rtf(elapsed, len(request.samples) / self._sample_rate)
+        if not self._await_turn(request):
+            with self._processing:
+                return self._store.snapshot()
+        with self._processing:
+            return self._apply_hypothesis(request, hypothesis)
+
+    def _call_asr(
+        self,
+        transcribe: Callable[[InferenceRequest], AsrHypothesis],
+        request: InferenceRequest,
+    ) -> AsrHypothesis:
+        # A timeout surfaces as an ordinary ASR failure: the scheduler is
+        # reset while ring, stabilizer and store state are kept.
+        if self._watchdog is None:
+            return transcribe(request)
+        return self._watchdog.call(transcribe, request)
+
+    def _await_turn(self, request: InferenceRequest) -> bool:
+        # Pipelined windows finish in any order, but the stabilizer counts
+        # agreements between consecutive hypotheses, so each result waits
+        # for every earlier in-flight window. A window reset away by a
+        # failure, or still waiting at shutdown, is superseded.
+        with self._state:
+            self._state.wait_for(
+                lambda: self._stopping
+                or self._scheduler.position(
+                    request.session_id, request.sequence
+                )
+                in (0, None)
+            )
+            return (
+                self._scheduler.position(request.session_id, request.sequence)
+                == 0
+            )
+
+    def _observe_rtf(self, elapsed: float, audio_seconds: float) -> None:
+        controller = self._window_controller
+        if controller is None:
+            return
+        with self._state:
+            window_seconds = controller.observe(elapsed, audio_seconds)
+            rtf = controller.last_rtf
+        if self._metrics is not None and rtf is not None:
+            self._metrics.record_asr_window(window_seconds, rtf)
+
+    def _apply_hypothesis(
+        self, request: InferenceRequest, hypothesis: AsrHypothesis
+    ) -> CaptionSnapshot:
         if (hypothesis.session_id, hypothesis.sequence) != (
             request.session_id,
             request.sequence,
@@ -97,21 +529,114 @@ class RealtimeCaptionCore:
         return self._store.snapshot()
 
     def finalize(self) -> CaptionSnapshot:
-        if not self._utterance_active:
+        endpoint = self._clock()
+        with self._state:
+            final = self._scheduler.escalate()
+            if final is not None or self._scheduler.final_pending:
+                # Interim windows still waiting for a processor would only
+                # delay the final pass, which covers newer audio.
+                for interim in tuple(self._ready):
+                    self._cancellations.pop(interim.sequence, None)
+                    self._undeliver(interim)
+                    promoted = self._scheduler.preempt(
+                        interim.session_id, interim.sequence
+                    )
+                    final = promoted or final
+                self._ready.clear()
+            if final is not None:
+                self._ready.append(self._dispatch(final))
+                self._state.notify_all()
+        if not self._workers:
+            while self.process_next() is not None:
+                pass
+        with self._state:
+            self._state.wait_for(
+                lambda: not self._workers
+                or (self._running == 0 and not self._ready)
+            )
+        with self._processing:
+            if not self._utterance_active:
+                self._translate_current()
+                return self._store.snapshot()
+
+            words = self._last_words
+            if self._stream is not None:
+                words = self._stream.finalize_stream(self._session_id)
+            stable = self._stabilizer.finalize(words)
+            self._apply_source(self._store.language, stable)
+            self._store.finish_utterance()
+            self._last_words = ()
+            self._utterance_active = False
+            self._utterance_id += 1
+            if self._stream is not None:
+                self._stream.reset_stream(self._session_id)
             self._translate_current()
+            if self._metrics is not None:
+                self._metrics.record_endpoint_latency(
+                    self._clock() - endpoint
+                )
             return self._store.snapshot()
 
-        stable = self._stabilizer.finalize(self._last_words)
-        self._apply_source(self._store.language, stable)
-        self._store.finish_utterance()
-        self._last_words = ()
-        self._utterance_active = False
-        self._utterance_id += 1
-        self._translate_current()
-        return self._store.snapshot()
-
     def snapshot(self) -> CaptionSnapshot:
-        return self._store.snapshot()
+        return self._published
+
+    def checkpoint(self, include_audio: bool = False) -> CoreCheckpoint:
+        with self._processing, self._state:
+            return CoreCheckpoint(
+                session_id=self._session_id,
+                asr_sequence=self._asr_sequence,
+                source_revision=self._source_revision,
+                utterance_id=self._utterance_id,
+                utterance_active=self._utterance_active,
+                last_words=self._last_words,
+                store=self._store.state(),
+                stabilizer=self._stabilizer.state(),
+                language=self._language.state(),
+                audio=(
+                    self._audio.latest(self._audio.size)
+                    if include_audio
+                    else None
+                ),
+                total_samples=self._audio.total_samples,
+            )
+
+    def restore(self, checkpoint: CoreCheckpoint) -> CaptionSnapshot:
+        if checkpoint.session_id != self._session_id:
+            raise ValueError(
+                f'checkpoint belongs to session: {checkpoint.session_id}'
+            )
+        with self._processing, self._state:
+            if self._running or self._ready:
+                raise RuntimeError('cannot restore while work is in flight')
+            self._scheduler.reset()
+            self._asr_sequence = checkpoint.asr_sequence
+            self._source_revision = checkpoint.source_revision
+            self._utterance_id = checkpoint.utterance_id
+            self._utterance_active = checkpoint.utterance_active
+            self._last_words = checkpoint.last_words
+            self._store.restore(checkpoint.store)
+            self._stabilizer.restore(checkpoint.stabilizer)
+            self._language.restore(checkpoint.language)
+            if checkpoint.audio is not None:
+                self._audio.restore(checkpoint.audio, checkpoint.total_samples)
+            self._frames.reset()
+            # A restarted streaming backend has no context; replay what the
+            # ring retained.
+            self._streamed = self._audio.total_samples - self._audio.size
+            self._published = self._store.snapshot()
+            self._state.notify_all()
+            return self._published
+
+    def _publish(self) -> None:
+        snapshot = self._store.snapshot()
+        with self._state:
+            changed = snapshot != self._published
+            self._published = snapshot
+            callback = self._on_snapshot
+            if changed:
+                self._state.notify_all()
+        if changed and callback is not None:
+            callback(snapshot)
 
     def _apply_source(
         self, language: str | None, stable: StabilizedText
@@ -124,9 +649,11 @@ class RealtimeCaptionCore:
             stable.provisional,
         ):
             self._source_revision = revision
+            self._publish()
 
     def _translate_current(self) -> None:
         request = self._store.translation_request()
         if request is not None:
             result = self._translator.translate(request)
-            self._store.apply_translation(result)
+            if self._store.apply_translation(result):
+                self._publish()
@@ -9,8 +9,15 @@ class DiagnosticsSnapshot:
     first_caption_p95: float | None
     commit_p50: float | None
     commit_p95: float | None
+    recovery_p50: float | None
+    recovery_p95: float | None
+    endpoint_p50: float | None
+    endpoint_p95: float | None
     coalesced_windows: int
     worker_restarts: int
+    asr_window_seconds: float | None
+    asr_rtf: float | None
+    cancelled_requests: int
 
 
 class RuntimeMetrics:
@@ -19,8 +26,13 @@ class RuntimeMetrics:
             raise ValueError('max_samples must be a positive integer')
         self._first_caption_latencies: deque[float] = deque(maxlen=max_samples)
         self._commit_latencies: deque[float] = deque(maxlen=max_samples)
+        self._recovery_latencies: deque[float] = deque(maxlen=max_samples)
+        self._endpoint_latencies: deque[float] = deque(maxlen=max_samples)
         self._coalesced_windows = 0
         self._worker_restarts = 0
+        self._asr_window_seconds: float | None = None
+        self._asr_rtf: float | None = None
+        self._cancelled_requests = 0
 
     def record_first_caption_latency(self, seconds: float) -> None:
         self._first_caption_latencies.append(self._validated_latency(seconds))
@@ -28,30 +40,55 @@ class RuntimeMetrics:
     def record_commit_latency(self, seconds: float) -> None:
         self._commit_latencies.append(self._validated_latency(seconds))
 
+    def record_recovery_latency(self, seconds: float) -> None:
+        self._recovery_latencies.append(self._validated_latency(seconds))
+
+    def record_endpoint_latency(self, seconds: float) -> None:
+        self._endpoint_latencies.append(self._validated_latency(seconds))
+
     def record_coalesced_window(self) -> None:
         self._coalesced_windows += 1
 
     def record_worker_restart(self) -> None:
         self._worker_restarts += 1
 
+    def record_cancelled_request(self) -> None:
+        self._cancelled_requests += 1
+
+    def record_asr_window(self, window_seconds: float, rtf: float) -> None:
+        window = self._validated_non_negative('window_seconds', window_seconds)
+        self._asr_rtf = self._validated_non_negative('rtf', rtf)
+        self._asr_window_seconds = window
+
     def snapshot(self) -> DiagnosticsSnapshot:
         return DiagnosticsSnapshot(
             first_caption_p50=_nearest_rank(self._first_caption_latencies, 0.50),
             first_caption_p95=_nearest_rank(self._first_caption_latencies, 0.95),
             commit_p50=_nearest_rank(self._commit_latencies, 0.50),
             commit_p95=_nearest_rank(self._commit_latencies, 0.95),
+            recovery_p50=_nearest_rank(self._recovery_latencies, 0.50),
+            recovery_p95=_nearest_rank(self._recovery_latencies, 0.95),
+            endpoint_p50=_nearest_rank(self._endpoint_latencies, 0.50),
+            endpoint_p95=_nearest_rank(self._endpoint_latencies, 0.95),
             coalesced_windows=self._coalesced_windows,
             worker_restarts=self._worker_restarts,
+            asr_window_seconds=self._asr_window_seconds,
+            asr_rtf=self._asr_rtf,
+            cancelled_requests=self._cancelled_requests,
         )
 
+    @classmethod
+    def _validated_latency(cls, seconds: float) -> float:
+        return cls._validated_non_negative('latency', seconds)
+
     @staticmethod
-    def _validated_latency(seconds: float) -> float:
-        if isinstance(seconds, bool) or not isinstance(seconds, (int, float)):
-            raise ValueError('latency must be a finite, non-negative number')
-        latency = float(seconds)
-        if not math.isfinite(latency) or latency < 0:
-            raise ValueError('latency must be a finite, non-negative number')
-        return latency
+    def _validated_non_negative(name: str, value: float) -> float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f'{name} must be a finite, non-negative number')
+        number = float(value)
+        if not math.isfinite(number) or number < 0:
+            raise ValueError(f'{name} must be a finite, non-negative number')
+        return number
 
 
 def _nearest_rank(values: deque[float], quantile: float) -> float | None:
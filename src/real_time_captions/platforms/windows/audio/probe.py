@@ -100,15 +100,14 @@ def probe_source(descriptor_id: str, seconds: float) -> dict[str, Any]:
         started_at = monotonic()
         deadline = started_at + seconds
         while (remaining := deadline - monotonic()) > 0:
-            frame = source.read(min(0.1, remaining))
-            if frame is None:
-                continue
-            frames += 1
-            samples += int(frame.samples.size)
-            sample_rate = frame.sample_rate
-            channels = frame.channels
-            if frame.samples.size:
-                peak = max(peak, float(np.max(np.abs(frame.samples))))
+            for frame in source.read_many(timeout=min(0.1, remaining)):
+                frames += 1
+                samples += int(frame.samples.size)
+                sample_rate = frame.sample_rate
+                channels = frame.channels
+                if frame.samples.size:
+                    peak = max(peak, float(np.max(np.abs(frame.samples))))
+                frame.release()
     finally:
         source.stop()
         close = getattr(source, 'close', None)
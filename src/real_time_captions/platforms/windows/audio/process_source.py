@@ -10,6 +10,8 @@ from real_time_captions.audio.capture import (
     AudioSourceOpenError,
     AudioStreamInterrupted,
 )
+from real_time_captions.audio.frame import AudioFrame
+from real_time_captions.audio.frame_queue import FrameQueue
 from real_time_captions.contracts import SourceState
 from real_time_captions.platforms.windows.audio.processes import ProcessInfo
 from real_time_captions.platforms.windows.audio.flexaudio_api import (
@@ -31,10 +33,13 @@ class ProcessAudioSource(ManagedSourceBase):
         *,
         clock: Callable[[], float] = monotonic,
         session_id_factory: Callable[[], str] | None = None,
+        queue_factory: Callable[[int], FrameQueue] | None = None,
     ) -> None:
         kwargs: dict[str, object] = {'clock': clock}
         if session_id_factory is not None:
             kwargs['session_id_factory'] = session_id_factory
+        if queue_factory is not None:
+            kwargs['queue_factory'] = queue_factory
         super().__init__(config.queue_seconds, **kwargs)  # type: ignore[arg-type]
         self._descriptor = descriptor
         self._resolver = resolver
@@ -68,8 +73,9 @@ class ProcessAudioSource(ManagedSourceBase):
                 frame_count = len(payload) // frame_bytes
                 if reported_frames >= 0 and reported_frames != frame_count:
                     raise AudioStreamInterrupted('helper frame count mismatch')
-                samples = np.frombuffer(payload, dtype=dtype).copy()
-                self._publish(generation, samples, sample_rate, channels)
+                samples, lease = self._acquire(frame_count * channels, dtype)
+                samples[:] = np.frombuffer(payload, dtype=dtype)
+                self._publish(generation, samples, sample_rate, channels, lease)
             except Exception as exc:
                 self._mark_failed(exc)
 
@@ -88,7 +94,7 @@ class ProcessAudioSource(ManagedSourceBase):
                 )
             )
             session_id, generation = self._begin(
-                sample_rate, frames_per_buffer
+                sample_rate, frames_per_buffer, channels=channels, dtype=dtype
             )
             context.update(
                 dtype=dtype,
@@ -109,17 +115,34 @@ class ProcessAudioSource(ManagedSourceBase):
 
     def read(self, timeout: float | None = None):
         frame = super().read(timeout)
+        if frame is None:
+            self._check_tap()
+        return frame
+
+    def read_many(
+        self, max_frames: int | None = None, timeout: float | None = None
+    ) -> list[AudioFrame]:
+        frames = super().read_many(max_frames, timeout)
+        if not frames:
+            self._check_tap()
+        return frames
+
+    def drain_into(self, frames: list[AudioFrame]) -> int:
+        count = super().drain_into(frames)
+        if not count:
+            self._check_tap()
+        return count
+
+    def _check_tap(self) -> None:
         tap = self._tap
         if (
-            frame is None
-            and tap is not None
+            tap is not None
             and not tap.is_running
             and self.diagnostics().state is SourceState.RUNNING
         ):
             self._mark_reconnecting(
                 AudioStreamInterrupted('selected process capture stopped')
             )
-        return frame
 
     def reconnect_once(self) -> bool:
         self._close_tap()
@@ -5,16 +5,19 @@ from typing import Any
 import numpy as np
 
 from real_time_captions.audio.capture import AudioCaptureConfig, AudioSourceDescriptor, AudioSourceKind, AudioSourceNotFound, AudioSourceOpenError
+from real_time_captions.audio.frame_queue import FrameQueue
 from real_time_captions.contracts import SourceState
 from real_time_captions.platforms.windows.audio.pyaudio_api import PyAudioApi, WasapiDevice
 from real_time_captions.platforms.windows.audio.source_base import ManagedSourceBase
 
 
 class WasapiAudioSource(ManagedSourceBase):
-    def __init__(self, descriptor: AudioSourceDescriptor, config: AudioCaptureConfig, api: PyAudioApi, *, clock: Callable[[], float] = monotonic, session_id_factory: Callable[[], str] | None = None) -> None:
+    def __init__(self, descriptor: AudioSourceDescriptor, config: AudioCaptureConfig, api: PyAudioApi, *, clock: Callable[[], float] = monotonic, session_id_factory: Callable[[], str] | None = None, queue_factory: Callable[[int], FrameQueue] | None = None) -> None:
         kwargs: dict[str, Any] = {'clock': clock}
         if session_id_factory is not None:
             kwargs['session_id_factory'] = session_id_factory
+        if queue_factory is not None:
+            kwargs['queue_factory'] = queue_factory
         super().__init__(config.queue_seconds, **kwargs)
         self._descriptor = descriptor
         self._api = api
@@ -23,12 +26,13 @@ class WasapiAudioSource(ManagedSourceBase):
     def start(self) -> str:
         device = self._resolve_device()
         frames_per_buffer = max(1, round(device.sample_rate * 0.04))
-        session_id, generation = self._begin(device.sample_rate, frames_per_buffer)
+        session_id, generation = self._begin(device.sample_rate, frames_per_buffer, channels=device.input_channels)
 
         def callback(payload: bytes, frame_count: int, _time_info: object, _status: int) -> tuple[None, int]:
             count = frame_count * device.input_channels
-            samples = np.frombuffer(payload, dtype=np.float32, count=count).copy()
-            self._publish(generation, samples, device.sample_rate, device.input_channels)
+            samples, lease = self._acquire(count, np.float32)
+            samples[:] = np.frombuffer(payload, dtype=np.float32, count=count)
+            self._publish(generation, samples, device.sample_rate, device.input_channels, lease)
             return None, self._api.continue_token
 
         try:
@@ -4,24 +4,28 @@ from time import monotonic
 from uuid import uuid4
 
 import numpy as np
+from numpy.typing import DTypeLike
 
+from real_time_captions.audio.buffer_pool import SampleBufferPool, SampleLease
 from real_time_captions.audio.capture import CaptureDiagnostics
 from real_time_captions.audio.frame import AudioFrame
-from real_time_captions.audio.frame_queue import BoundedFrameQueue
+from real_time_captions.audio.frame_queue import BoundedFrameQueue, FrameQueue
 from real_time_captions.contracts import SourceState
 
 
 class ManagedSourceBase:
-    def __init__(self, queue_seconds: float, *, clock: Callable[[], float] = monotonic, session_id_factory: Callable[[], str] = lambda: uuid4().hex) -> None:
+    def __init__(self, queue_seconds: float, *, clock: Callable[[], float] = monotonic, session_id_factory: Callable[[], str] = lambda: uuid4().hex, queue_factory: Callable[[int], FrameQueue] = BoundedFrameQueue) -> None:
         self._queue_seconds = queue_seconds
         self._clock = clock
         self._session_id_factory = session_id_factory
+        self._queue_factory = queue_factory
         self._state = SourceState.STOPPED
         self._session_id: str | None = None
         self._session_zero = 0.0
         self._sequence = 0
         self._generation = 0
-        self._queue: BoundedFrameQueue | None = None
+        self._queue: FrameQueue | None = None
+        self._pool: SampleBufferPool | None = None
         self._last_frame_at: float | None = None
         self._last_error: str | None = None
 
@@ -29,7 +33,7 @@ class ManagedSourceBase:
     def session_id(self) -> str | None:
         return self._session_id
 
-    def _begin(self, sample_rate: int, frames_per_buffer: int) -> tuple[str, int]:
+    def _begin(self, sample_rate: int, frames_per_buffer: int, *, channels: int = 1, dtype: DTypeLike = np.float32) -> tuple[str, int]:
         self._generation += 1
         self._state = SourceState.STARTING
         self._session_id = self._session_id_factory()
@@ -38,9 +42,18 @@ class ManagedSourceBase:
         self._last_frame_at = None
         self._last_error = None
         capacity = max(1, ceil(self._queue_seconds * sample_rate / frames_per_buffer))
-        self._queue = BoundedFrameQueue(capacity)
+        self._queue = self._queue_factory(capacity)
+        # Room for a full queue plus as many frames held by the consumer, so
+        # steady capture never allocates sample buffers.
+        self._pool = SampleBufferPool(2 * capacity, frames_per_buffer * channels, dtype)
         return self._session_id, self._generation
 
+    def _acquire(self, count: int, dtype: DTypeLike) -> tuple[np.ndarray, SampleLease | None]:
+        pool = self._pool
+        if pool is None or pool.dtype != np.dtype(dtype):
+            return np.empty(count, dtype=dtype), None
+        return pool.acquire(count)
+
     def _mark_running(self) -> None:
         self._state = SourceState.RUNNING
 
@@ -55,22 +68,30 @@ class ManagedSourceBase:
         if self._queue is not None:
             self._queue.close()
 
-    def _publish(self, generation: int, samples: np.ndarray, sample_rate: int, channels: int) -> None:
-        if generation != self._generation or self._state is not SourceState.RUNNING:
-            return
+    def _publish(self, generation: int, samples: np.ndarray, sample_rate: int, channels: int, lease: SampleLease | None = None) -> None:
         queue = self._queue
         session_id = self._session_id
-        if queue is None or session_id is None:
+        if generation != self._generation or self._state is not SourceState.RUNNING or queue is None or session_id is None:
+            if lease is not None:
+                lease.release()
             return
         now = self._clock()
         self._sequence += 1
         self._last_frame_at = now
-        queue.put(AudioFrame(session_id, samples, sample_rate, channels, self._sequence, max(0.0, now - self._session_zero)))
+        queue.put(AudioFrame(session_id, samples, sample_rate, channels, self._sequence, max(0.0, now - self._session_zero), lease))
 
     def read(self, timeout: float | None = None) -> AudioFrame | None:
         queue = self._queue
         return None if queue is None else queue.get(timeout)
 
+    def read_many(self, max_frames: int | None = None, timeout: float | None = None) -> list[AudioFrame]:
+        queue = self._queue
+        return [] if queue is None else queue.get_many(max_frames, timeout)
+
+    def drain_into(self, frames: list[AudioFrame]) -> int:
+        queue = self._queue
+        return 0 if queue is None else queue.drain_into(frames)
+
     def _stop_session(self) -> None:
         if self._state is SourceState.STOPPED:
             return
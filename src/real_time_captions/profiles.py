@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeProfile:
+    # Minimum session-clock spacing between ASR windows, in seconds.
+    update_interval: float
+    context_seconds: int
+    # Longest a single ASR call may run before the watchdog gives up on it.
+    asr_timeout: float
+    # Ring storage dtype; int16 halves resident audio at a quantization
+    # error of at most 0.5 / 32767 per sample.
+    audio_dtype: str
+
+
+_PROFILES = {
+    'fast': RuntimeProfile(
+        update_interval=0.35,
+        context_seconds=5,
+        asr_timeout=2.0,
+        audio_dtype='int16',
+    ),
+    'balanced': RuntimeProfile(
+        update_interval=0.5,
+        context_seconds=8,
+        asr_timeout=4.0,
+        audio_dtype='int16',
+    ),
+    'quality': RuntimeProfile(
+        update_interval=1.0,
+        context_seconds=10,
+        asr_timeout=8.0,
+        audio_dtype='float32',
+    ),
+}
+
+
+def runtime_profile(name: str) -> RuntimeProfile:
+    try:
+        return _PROFILES[name]
+    except KeyError:
+        raise ValueError(f'no built-in runtime profile: {name}') from None
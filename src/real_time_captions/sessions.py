@@ -0,0 +1,197 @@
+import heapq
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import count
+from threading import Condition, Thread
+
+import numpy as np
+
+from real_time_captions.contracts import CaptionSnapshot
+from real_time_captions.core import RealtimeCaptionCore
+
+
+@dataclass(slots=True)
+class _Session:
+    core: RealtimeCaptionCore
+    weight: int
+    # Stride-scheduling virtual time; advances by 1/weight per served window.
+    pass_value: float = 0.0
+    queued: bool = False
+    running: bool = False
+    delivered: CaptionSnapshot | None = None
+    # Last backend failure not yet taken by the host.
+    error: Exception | None = None
+
+
+class SessionManager:
+    def __init__(
+        self,
+        workers: int,
+        *,
+        on_snapshot: Callable[[CaptionSnapshot], None] | None = None,
+        on_error: Callable[[str, Exception], None] | None = None,
+    ) -> None:
+        if isinstance(workers, bool) or workers <= 0:
+            raise ValueError('workers must be a positive integer')
+        self._worker_count = workers
+        self._on_snapshot = on_snapshot
+        self._on_error = on_error
+        self._sessions: dict[str, _Session] = {}
+        self._runnable: list[tuple[float, int, str]] = []
+        self._order = count()
+        self._virtual_time = 0.0
+        self._condition = Condition()
+        self._workers: list[Thread] = []
+        self._stopping = False
+
+    @property
+    def session_ids(self) -> tuple[str, ...]:
+        with self._condition:
+            return tuple(self._sessions)
+
+    def add_session(self, core: RealtimeCaptionCore, weight: int = 1) -> None:
+        if isinstance(weight, bool) or weight <= 0:
+            raise ValueError('weight must be a positive integer')
+        if core.worker_running:
+            raise ValueError('hosted cores must not run their own worker')
+        with self._condition:
+            if core.session_id in self._sessions:
+                raise ValueError(f'session already hosted: {core.session_id}')
+            session = _Session(core, weight, pass_value=self._virtual_time)
+            self._sessions[core.session_id] = session
+            if core.has_ready_work:
+                self._enqueue(core.session_id, session)
+
+    def remove_session(self, session_id: str) -> RealtimeCaptionCore:
+        with self._condition:
+            session = self._session(session_id)
+            self._condition.wait_for(lambda: not session.running)
+            del self._sessions[session_id]
+            return session.core
+
+    def submit_audio(
+        self, session_id: str, samples: np.ndarray, audio_end: float
+    ) -> CaptionSnapshot:
+        with self._condition:
+            session = self._session(session_id)
+        if session.core.enqueue_audio(samples, audio_end):
+            with self._condition:
+                if self._sessions.get(session_id) is session:
+                    self._enqueue(session_id, session)
+        return session.core.snapshot()
+
+    def finalize(self, session_id: str) -> CaptionSnapshot:
+        with self._condition:
+            session = self._session(session_id)
+            self._condition.wait_for(
+                lambda: not (session.queued or session.running)
+                or not self._workers
+            )
+        return session.core.finalize()
+
+    def snapshot(self, session_id: str) -> CaptionSnapshot:
+        with self._condition:
+            return self._session(session_id).core.snapshot()
+
+    def take_error(self, session_id: str) -> Exception | None:
+        # The session's last failure, reported once; on_error, when set, is
+        # also called as it happens.
+        with self._condition:
+            session = self._session(session_id)
+            error, session.error = session.error, None
+            return error
+
+    def queue_depth(self, session_id: str) -> int:
+        with self._condition:
+            core = self._session(session_id).core
+        return core.queue_depth
+
+    def queue_depths(self) -> dict[str, int]:
+        with self._condition:
+            cores = [session.core for session in self._sessions.values()]
+        return {core.session_id: core.queue_depth for core in cores}
+
+    def start(self) -> None:
+        with self._condition:
+            if self._workers:
+                raise RuntimeError('session manager is already running')
+            self._stopping = False
+            self._workers = [
+                Thread(
+                    target=self._work,
+                    name=f'caption-session-worker-{index}',
+                    daemon=True,
+                )
+                for index in range(self._worker_count)
+            ]
+            for worker in self._workers:
+                worker.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._condition:
+            workers = self._workers
+            self._stopping = True
+            self._condition.notify_all()
+        for worker in workers:
+            worker.join(timeout)
+        with self._condition:
+            self._workers = []
+            self._condition.notify_all()
+
+    def _session(self, session_id: str) -> _Session:
+        try:
+            return self._sessions[session_id]
+        except KeyError:
+            raise KeyError(f'unknown session: {session_id}') from None
+
+    def _enqueue(self, session_id: str, session: _Session) -> None:
+        if session.queued or session.running:
+            return
+        session.queued = True
+        session.pass_value = max(session.pass_value, self._virtual_time)
+        heapq.heappush(
+            self._runnable, (session.pass_value, next(self._order), session_id)
+        )
+        self._condition.notify()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopping or bool(self._runnable)
+                )
+                if self._stopping:
+                    return
+                pass_value, _, session_id = heapq.heappop(self._runnable)
+                session = self._sessions.get(session_id)
+                if session is None or not session.queued:
+                    continue
+                self._virtual_time = max(self._virtual_time, pass_value)
+                session.queued = False
+                session.running = True
+
+            snapshot: CaptionSnapshot | None = None
+            failure: Exception | None = None
+            try:
+                snapshot = session.core.process_next()
+            except Exception as error:
+                failure = error
+                if self._on_error is not None:
+                    self._on_error(session_id, error)
+
+            with self._condition:
+                if failure is not None:
+                    session.error = failure
+                session.running = False
+                session.pass_value += 1 / session.weight
+                delivered = None
+                if snapshot is not None and snapshot != session.delivered:
+                    session.delivered = delivered = snapshot
+                if (
+                    self._sessions.get(session_id) is session
+                    and session.core.has_ready_work
+                ):
+                    self._enqueue(session_id, session)
+                self._condition.notify_all()
+            if delivered is not None and self._on_snapshot is not None:
+                self._on_snapshot(delivered)
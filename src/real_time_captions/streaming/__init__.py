@@ -1,3 +1,3 @@
-from .scheduler import LatestWindowScheduler
+from .scheduler import CadenceScheduler, LatestWindowScheduler
 
-__all__ = ["LatestWindowScheduler"]
+__all__ = ["CadenceScheduler", "LatestWindowScheduler"]
@@ -0,0 +1,56 @@
+import math
+
+
+class AdaptiveWindowController:
+    def __init__(
+        self,
+        min_seconds: float,
+        max_seconds: float,
+        target_rtf: float,
+        *,
+        grow_seconds: float = 0.5,
+        headroom: float = 0.5,
+    ) -> None:
+        if not 0 < min_seconds <= max_seconds:
+            raise ValueError('window bounds must satisfy 0 < min <= max')
+        if target_rtf <= 0:
+            raise ValueError('target_rtf must be positive')
+        if grow_seconds <= 0:
+            raise ValueError('grow_seconds must be positive')
+        if not 0 < headroom < 1:
+            raise ValueError('headroom must be between 0 and 1')
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.target_rtf = target_rtf
+        self._grow_seconds = grow_seconds
+        self._headroom = headroom
+        self._window_seconds = max_seconds
+        self._last_rtf: float | None = None
+
+    @property
+    def window_seconds(self) -> float:
+        return self._window_seconds
+
+    @property
+    def last_rtf(self) -> float | None:
+        return self._last_rtf
+
+    def observe(self, elapsed: float, audio_seconds: float) -> float:
+        if not math.isfinite(elapsed) or elapsed < 0:
+            raise ValueError('elapsed must be a finite, non-negative number')
+        if audio_seconds <= 0:
+            return self._window_seconds
+        rtf = elapsed / audio_seconds
+        self._last_rtf = rtf
+        if rtf > self.target_rtf:
+            # Decoder attention makes per-second cost grow with context, so
+            # rtf scales roughly with window length.
+            window = audio_seconds * self.target_rtf / rtf
+        elif rtf < self.target_rtf * self._headroom:
+            window = self._window_seconds + self._grow_seconds
+        else:
+            return self._window_seconds
+        self._window_seconds = min(
+            max(window, self.min_seconds), self.max_seconds
+        )
+        return self._window_seconds
@@ -1,3 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class LanguageState:
+    current: str | None
+    candidate: str | None
+    count: int
+    utterance: str | None
+    confirmed_for_utterance: bool
+    locked: str | None
+
+
 class LanguageSmoother:
     def __init__(self, confirmations: int, minimum_confidence: float) -> None:
         self.confirmations = confirmations
@@ -28,6 +41,24 @@ class LanguageSmoother:
             self._confirmed_for_utterance = True
         return self.current if self._confirmed_for_utterance else None
 
+    def state(self) -> LanguageState:
+        return LanguageState(
+            self.current,
+            self._candidate,
+            self._count,
+            self._utterance,
+            self._confirmed_for_utterance,
+            self._locked,
+        )
+
+    def restore(self, state: LanguageState) -> None:
+        self.current = state.current
+        self._candidate = state.candidate
+        self._count = state.count
+        self._utterance = state.utterance
+        self._confirmed_for_utterance = state.confirmed_for_utterance
+        self._locked = state.locked
+
     def lock(self, language: str) -> None:
         self._locked = language
         self.current = language
@@ -1,37 +1,245 @@
-from real_time_captions.contracts import InferenceRequest
+from typing import Generic, Protocol, TypeVar
 
 
-class LatestWindowScheduler:
-    def __init__(self) -> None:
-        self._active: InferenceRequest | None = None
-        self._pending: InferenceRequest | None = None
+class ScheduledWork(Protocol):
+    @property
+    def session_id(self) -> str: ...
+
+    @property
+    def sequence(self) -> int: ...
+
+    @property
+    def audio_end(self) -> float: ...
+
+
+WorkT = TypeVar('WorkT', bound=ScheduledWork)
+
+
+class LatestWindowScheduler(Generic[WorkT]):
+    def __init__(
+        self,
+        max_lag: float | None = None,
+        *,
+        depth: int = 1,
+        supersede_after: float | None = None,
+    ) -> None:
+        if max_lag is not None and max_lag < 0:
+            raise ValueError("max_lag must be non-negative")
+        if supersede_after is not None and supersede_after < 0:
+            raise ValueError("supersede_after must be non-negative")
+        if isinstance(depth, bool) or depth <= 0:
+            raise ValueError("depth must be a positive integer")
+        self.depth = depth
+        # In-flight requests in issue (and therefore sequence) order.
+        self._active: list[WorkT] = []
+        self._pending: WorkT | None = None
+        # Endpoint work promoted ahead of any interim pending request.
+        self._final: WorkT | None = None
+        self._escalated: tuple[str, int] | None = None
         self.coalesced_count = 0
+        self.preempted_count = 0
+        self.max_lag = max_lag
+        self.supersede_after = supersede_after
+        self.stale_count = 0
+        # Newest audio_end ever submitted; the freshness reference.
+        self._newest: float | None = None
 
     @property
     def in_flight(self) -> bool:
-        return self._active is not None
+        return bool(self._active)
 
-    def submit(self, request: InferenceRequest) -> InferenceRequest | None:
-        if self._active is None:
-            self._active = request
+    @property
+    def queue_depth(self) -> int:
+        return (
+            len(self._active)
+            + (self._pending is not None)
+            + (self._final is not None)
+        )
+
+    @property
+    def final_pending(self) -> bool:
+        return self._final is not None
+
+    def submit(self, request: WorkT) -> WorkT | None:
+        self._observe(request)
+        if len(self._active) < self.depth:
+            self._active.append(request)
             return request
         if self._pending is not None:
             self.coalesced_count += 1
         self._pending = request
         return None
 
-    def complete(self, session_id: str, sequence: int) -> InferenceRequest | None:
-        if self._active is None or (
-            self._active.session_id,
-            self._active.sequence,
-        ) != (session_id, sequence):
+    def complete(self, session_id: str, sequence: int) -> WorkT | None:
+        position = self.position(session_id, sequence)
+        if position is None:
             raise ValueError("completion does not match active request")
+        del self._active[position]
 
-        promoted = self._pending
-        self._active = promoted
-        self._pending = None
+        if self._final is not None:
+            promoted, self._final = self._final, None
+            self._active.append(promoted)
+            return promoted
+        promoted = self._take_pending()
+        if promoted is not None and self.is_stale(promoted):
+            self.stale_count += 1
+            promoted = None
+        if promoted is not None:
+            self._active.append(promoted)
         return promoted
 
+    def escalate(self) -> WorkT | None:
+        # The newest queued interim request becomes endpoint work: it skips
+        # freshness checks and is promoted before any later interim request.
+        final = self._take_queued()
+        if final is None:
+            return None
+        self._escalated = (final.session_id, final.sequence)
+        if len(self._active) < self.depth:
+            self._active.append(final)
+            return final
+        self._final = final
+        return None
+
+    def preempt(self, session_id: str, sequence: int) -> WorkT | None:
+        if self.position(session_id, sequence) is None:
+            raise ValueError("preemption does not match active request")
+        self.preempted_count += 1
+        return self.complete(session_id, sequence)
+
+    def displace(self, session_id: str, sequence: int) -> WorkT | None:
+        # An active request that has not started yet gives its slot to the
+        # newer pending window; it counts as coalesced, like a replaced
+        # pending window. Final work is never displaced.
+        if self.position(session_id, sequence) is None:
+            raise ValueError("displacement does not match active request")
+        if (
+            self._pending is None
+            or self._final is not None
+            or (session_id, sequence) == self._escalated
+        ):
+            return None
+        self.coalesced_count += 1
+        return self.complete(session_id, sequence)
+
+    def expire(self, session_id: str, sequence: int) -> WorkT | None:
+        position = self.position(session_id, sequence)
+        if position is None:
+            raise ValueError("expiry does not match active request")
+        if not self.is_stale(self._active[position]):
+            raise ValueError("active request is not stale")
+        self.stale_count += 1
+        return self.complete(session_id, sequence)
+
+    def is_superseded(self, session_id: str, sequence: int) -> bool:
+        position = self.position(session_id, sequence)
+        if position is None:
+            return True
+        if (session_id, sequence) == self._escalated:
+            return False
+        pending = self._pending
+        return (
+            self.supersede_after is not None
+            and pending is not None
+            and pending.audio_end - self._active[position].audio_end
+            > self.supersede_after + 1e-9
+        )
+
+    def position(self, session_id: str, sequence: int) -> int | None:
+        # Index among in-flight requests in issue order; None once the
+        # request completed or was reset away.
+        for index, active in enumerate(self._active):
+            if (active.session_id, active.sequence) == (session_id, sequence):
+                return index
+        return None
+
+    def is_stale(self, request: ScheduledWork) -> bool:
+        return (
+            (request.session_id, request.sequence) != self._escalated
+            and self.max_lag is not None
+            and self._newest is not None
+            and self._newest - request.audio_end > self.max_lag + 1e-9
+        )
+
+    def _take_pending(self) -> WorkT | None:
+        pending, self._pending = self._pending, None
+        return pending
+
+    def _take_queued(self) -> WorkT | None:
+        pending, self._pending = self._pending, None
+        return pending
+
     def reset(self) -> None:
-        self._active = None
+        self._active = []
         self._pending = None
+        self._final = None
+        self._escalated = None
+        self._newest = None
+
+    def _observe(self, request: WorkT) -> None:
+        if self._newest is None or request.audio_end > self._newest:
+            self._newest = request.audio_end
+
+
+class CadenceScheduler(LatestWindowScheduler[WorkT]):
+    def __init__(
+        self,
+        update_interval: float,
+        max_lag: float | None = None,
+        *,
+        depth: int = 1,
+        supersede_after: float | None = None,
+    ) -> None:
+        if not update_interval > 0:
+            raise ValueError("update_interval must be positive")
+        super().__init__(
+            max_lag, depth=depth, supersede_after=supersede_after
+        )
+        self.update_interval = update_interval
+        self.skipped_count = 0
+        # Session-relative audio_end of the last window let through.
+        self._last_issued: float | None = None
+        self._deferred: WorkT | None = None
+
+    def submit(self, request: WorkT) -> WorkT | None:
+        self._observe(request)
+        if (
+            self._last_issued is not None
+            and request.audio_end - self._last_issued
+            < self.update_interval - 1e-9
+        ):
+            if self._deferred is not None:
+                self.skipped_count += 1
+            self._deferred = request
+            return None
+        if self._deferred is not None:
+            self.skipped_count += 1
+        self._deferred = None
+        self._last_issued = request.audio_end
+        return super().submit(request)
+
+    def _take_pending(self) -> WorkT | None:
+        # A window held back behind the queued one is fresher: it replaces
+        # the queued window instead of waiting for the next submission.
+        pending = super()._take_pending()
+        if pending is None or self._deferred is None:
+            return pending
+        deferred, self._deferred = self._deferred, None
+        self.coalesced_count += 1
+        self._last_issued = deferred.audio_end
+        return deferred
+
+    def _take_queued(self) -> WorkT | None:
+        pending = super()._take_queued()
+        deferred, self._deferred = self._deferred, None
+        if deferred is None:
+            return pending
+        if pending is not None:
+            self.preempted_count += 1
+        self._last_issued = deferred.audio_end
+        return deferred
+
+    def reset(self) -> None:
+        super().reset()
+        self._deferred = None
+        self._last_issued = None
@@ -1,5 +1,6 @@
 import math
 import unicodedata
+from dataclasses import dataclass
 
 from real_time_captions.contracts import StabilizedText, Word
 
@@ -25,6 +26,15 @@ def _is_committed_duplicate(left: Word, right: Word) -> bool:
     return overlaps and _key(left) == _key(right)
 
 
+@dataclass(frozen=True, slots=True)
+class StabilizerState:
+    committed: tuple[Word, ...]
+    previous: tuple[Word, ...]
+    # Agreement count for each word in previous.
+    counts: tuple[int, ...]
+    last_committed_end: float
+
+
 class HypothesisStabilizer:
     def __init__(self, required_agreements: int, guard_seconds: float) -> None:
         self.required_agreements = required_agreements
@@ -34,6 +44,10 @@ class HypothesisStabilizer:
         self._counts: tuple[int, ...] = ()
         self._last_committed_end = -1.0
 
+    @property
+    def last_committed_end(self) -> float | None:
+        return self._last_committed_end if self._committed else None
+
     def update(self, words: tuple[Word, ...], audio_end: float) -> StabilizedText:
         current = self._uncommitted(words)
         common = 0
@@ -70,6 +84,22 @@ class HypothesisStabilizer:
         self._counts = ()
         return StabilizedText(self._committed, ())
 
+    def state(self) -> StabilizerState:
+        return StabilizerState(
+            self._committed,
+            self._previous,
+            self._counts,
+            self._last_committed_end,
+        )
+
+    def restore(self, state: StabilizerState) -> None:
+        if len(state.counts) != len(state.previous):
+            raise ValueError('every previous word needs an agreement count')
+        self._committed = state.committed
+        self._previous = state.previous
+        self._counts = state.counts
+        self._last_committed_end = state.last_committed_end
+
     def reset(self) -> None:
         self._committed = ()
         self._previous = ()
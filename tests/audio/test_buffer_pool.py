@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from real_time_captions.audio.buffer_pool import SampleBufferPool
+from real_time_captions.audio.frame import AudioFrame
+
+
+def test_pool_reuses_released_buffers_without_allocating() -> None:
+    pool = SampleBufferPool(buffers=2, buffer_samples=4)
+
+    first, lease = pool.acquire(3)
+    first[:] = [1, 2, 3]
+    assert lease is not None
+    lease.release()
+    second, _ = pool.acquire(4)
+
+    assert np.shares_memory(first, second)
+    assert second.dtype == np.float32
+    assert pool.misses == 0
+
+
+def test_pool_falls_back_to_unpooled_arrays_when_exhausted_or_too_small() -> None:
+    pool = SampleBufferPool(buffers=1, buffer_samples=4, dtype=np.int16)
+    pool.acquire(4)
+
+    exhausted, no_slot = pool.acquire(2)
+    oversized, too_long = pool.acquire(5)
+
+    assert (no_slot, too_long) == (None, None)
+    assert (len(exhausted), len(oversized)) == (2, 5)
+    assert oversized.dtype == np.int16
+    assert pool.misses == 2
+    assert pool.available == 0
+
+
+def test_pool_ignores_a_second_release_of_the_same_lease() -> None:
+    pool = SampleBufferPool(buffers=2, buffer_samples=4)
+    _, lease = pool.acquire(4)
+    assert lease is not None
+
+    lease.release()
+    lease.release()
+
+    assert lease.released
+    assert pool.available == 2
+
+
+@pytest.mark.parametrize(('buffers', 'samples'), [(0, 4), (4, 0), (True, 4)])
+def test_pool_rejects_non_positive_sizes(buffers: int, samples: int) -> None:
+    with pytest.raises(ValueError, match='must be a positive integer'):
+        SampleBufferPool(buffers, samples)
+
+
+def test_audio_frame_adopts_leased_samples_without_copying() -> None:
+    pool = SampleBufferPool(buffers=1, buffer_samples=4)
+    samples, lease = pool.acquire(2)
+    samples[:] = [0.25, 0.5]
+
+    frame = AudioFrame('s1', samples, 16_000, 1, 1, 0.0, lease)
+
+    assert np.shares_memory(frame.samples, samples)
+    assert not frame.samples.flags.writeable
+    assert pool.available == 0
+    frame.release()
+    assert pool.available == 1
+
+
+def test_released_frame_stops_viewing_a_slot_that_is_handed_out_again() -> None:
+    pool = SampleBufferPool(buffers=1, buffer_samples=2)
+    samples, lease = pool.acquire(2)
+    samples[:] = [0.25, 0.5]
+    frame = AudioFrame('s1', samples, 16_000, 1, 1, 0.0, lease)
+
+    frame.release()
+    reused, _ = pool.acquire(2)
+    reused[:] = [1.0, 1.0]
+    frame.release()
+
+    assert len(frame.samples) == 0
+    assert frame.samples.dtype == np.float32
+    assert not frame.samples.flags.writeable
+    assert pool.available == 0
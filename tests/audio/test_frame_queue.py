@@ -3,8 +3,18 @@ from threading import Event, Thread
 import numpy as np
 import pytest
 
+from real_time_captions.audio.buffer_pool import SampleBufferPool
 from real_time_captions.audio.frame import AudioFrame
-from real_time_captions.audio.frame_queue import BoundedFrameQueue
+from real_time_captions.audio.frame_queue import (
+    BoundedFrameQueue,
+    SpscFrameQueue,
+)
+
+
+QueueType = type[BoundedFrameQueue] | type[SpscFrameQueue]
+QUEUE_TYPES = pytest.mark.parametrize(
+    'queue_type', [BoundedFrameQueue, SpscFrameQueue]
+)
 
 
 def frame(sequence: int) -> AudioFrame:
@@ -18,8 +28,9 @@ def frame(sequence: int) -> AudioFrame:
     )
 
 
-def test_full_queue_drops_oldest_frame() -> None:
-    queue = BoundedFrameQueue(max_frames=2)
+@QUEUE_TYPES
+def test_full_queue_drops_oldest_frame(queue_type: QueueType) -> None:
+    queue = queue_type(max_frames=2)
     queue.put(frame(1))
     queue.put(frame(2))
     queue.put(frame(3))
@@ -29,13 +40,17 @@ def test_full_queue_drops_oldest_frame() -> None:
     assert queue.dropped_frames == 1
 
 
-def test_get_times_out_without_a_frame() -> None:
-    queue = BoundedFrameQueue(max_frames=1)
+@QUEUE_TYPES
+def test_get_times_out_without_a_frame(queue_type: QueueType) -> None:
+    queue = queue_type(max_frames=1)
     assert queue.get(0) is None
 
 
-def test_close_rejects_late_frames_and_returns_none() -> None:
-    queue = BoundedFrameQueue(max_frames=1)
+@QUEUE_TYPES
+def test_close_rejects_late_frames_and_returns_none(
+    queue_type: QueueType
+) -> None:
+    queue = queue_type(max_frames=1)
     queue.close()
     queue.put(frame(1))
 
@@ -43,8 +58,9 @@ def test_close_rejects_late_frames_and_returns_none() -> None:
     assert queue.size == 0
 
 
-def test_close_unblocks_waiting_consumer() -> None:
-    queue = BoundedFrameQueue(max_frames=1)
+@QUEUE_TYPES
+def test_close_unblocks_waiting_consumer(queue_type: QueueType) -> None:
+    queue = queue_type(max_frames=1)
     finished = Event()
     results: list[AudioFrame | None] = []
 
@@ -61,8 +77,11 @@ def test_close_unblocks_waiting_consumer() -> None:
     assert results == [None]
 
 
-def test_clear_removes_frames_without_closing_queue() -> None:
-    queue = BoundedFrameQueue(max_frames=2)
+@QUEUE_TYPES
+def test_clear_removes_frames_without_closing_queue(
+    queue_type: QueueType
+) -> None:
+    queue = queue_type(max_frames=2)
     queue.put(frame(1))
     queue.clear()
     queue.put(frame(2))
@@ -71,6 +90,106 @@ def test_clear_removes_frames_without_closing_queue() -> None:
 
 
 @pytest.mark.parametrize('max_frames', [True, 0, -1])
-def test_queue_rejects_invalid_capacity(max_frames: int) -> None:
+@QUEUE_TYPES
+def test_queue_rejects_invalid_capacity(
+    max_frames: int, queue_type: QueueType
+) -> None:
+    with pytest.raises(ValueError, match='max_frames'):
+        queue_type(max_frames=max_frames)
+
+
+@QUEUE_TYPES
+def test_queue_releases_pooled_frames_it_discards(
+    queue_type: QueueType
+) -> None:
+    pool = SampleBufferPool(buffers=4, buffer_samples=1)
+    queue = queue_type(max_frames=2)
+
+    def pooled(sequence: int) -> AudioFrame:
+        samples, lease = pool.acquire(1)
+        return AudioFrame('s1', samples, 16_000, 1, sequence, 0.0, lease)
+
+    for sequence in range(1, 4):
+        queue.put(pooled(sequence))
+    assert pool.available == 2
+    queue.close()
+    queue.put(pooled(4))
+
+    assert pool.available == 4
+
+
+@QUEUE_TYPES
+def test_get_many_takes_queued_frames_up_to_the_limit(
+    queue_type: QueueType
+) -> None:
+    queue = queue_type(max_frames=4)
+    for sequence in range(1, 4):
+        queue.put(frame(sequence))
+
+    first = queue.get_many(2, timeout=0)
+    rest = queue.get_many(timeout=0)
+
+    assert [item.sequence for item in first] == [1, 2]
+    assert [item.sequence for item in rest] == [3]
+    assert queue.get_many(timeout=0) == []
+
+
+@QUEUE_TYPES
+def test_get_many_waits_for_the_first_frame(queue_type: QueueType) -> None:
+    queue = queue_type(max_frames=4)
+    results: list[list[AudioFrame]] = []
+    consumer = Thread(target=lambda: results.append(queue.get_many(None, 1)))
+    consumer.start()
+
+    queue.put(frame(1))
+    consumer.join(timeout=2)
+
+    assert [[item.sequence for item in batch] for batch in results] == [[1]]
+
+
+@QUEUE_TYPES
+def test_drain_into_appends_everything_without_waiting(
+    queue_type: QueueType
+) -> None:
+    queue = queue_type(max_frames=4)
+    queue.put(frame(1))
+    queue.put(frame(2))
+    drained = [frame(0)]
+
+    count = queue.drain_into(drained)
+
+    assert count == 2
+    assert [item.sequence for item in drained] == [0, 1, 2]
+    assert queue.drain_into(drained) == 0
+    assert queue.size == 0
+
+
+@QUEUE_TYPES
+def test_get_many_rejects_non_positive_limit(queue_type: QueueType) -> None:
     with pytest.raises(ValueError, match='max_frames'):
-        BoundedFrameQueue(max_frames=max_frames)
+        queue_type(max_frames=1).get_many(0, timeout=0)
+
+
+def test_spsc_queue_hands_every_frame_to_a_polling_consumer_in_order() -> None:
+    queue = SpscFrameQueue(max_frames=1_000, poll_interval=0.001)
+    received: list[int] = []
+
+    def consume() -> None:
+        while (item := queue.get(1.0)) is not None:
+            received.append(item.sequence)
+            if item.sequence == 500:
+                return
+
+    consumer = Thread(target=consume)
+    consumer.start()
+    for sequence in range(1, 501):
+        queue.put(frame(sequence))
+    consumer.join(timeout=5)
+
+    assert received == list(range(1, 501))
+    assert queue.dropped_frames == 0
+
+
+def test_spsc_queue_rejects_non_positive_poll_interval() -> None:
+    with pytest.raises(ValueError, match='poll_interval'):
+        SpscFrameQueue(max_frames=1, poll_interval=0)
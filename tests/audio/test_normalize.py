@@ -1,8 +1,15 @@
 import numpy as np
 import pytest
+from scipy.signal import resample_poly
 
 from real_time_captions.audio.frame import AudioFrame
-from real_time_captions.audio.normalize import normalize_frame
+from real_time_captions.audio.normalize import (
+    FrameWriter,
+    normalize_frame,
+    normalize_frames,
+)
+from real_time_captions.audio.resample import StreamingResampler
+from real_time_captions.audio.ring_buffer import AudioRingBuffer
 
 
 def make_frame(
@@ -100,3 +107,190 @@ def test_audio_frame_owns_a_read_only_sample_snapshot() -> None:
     )
     with pytest.raises(ValueError, match='read-only'):
         frame.samples[0] = 1.0
+
+
+def test_normalize_frame_carries_resampler_state_across_frames() -> None:
+    samples = np.sin(np.arange(9_600) / 7.0).astype(np.float32)
+    resampler = StreamingResampler(48_000)
+
+    parts = [
+        normalize_frame(
+            make_frame(samples[start : start + 480], sample_rate=48_000),
+            resampler=resampler,
+        )
+        for start in range(0, len(samples), 480)
+    ]
+
+    expected = resample_poly(samples.astype(np.float64), 1, 3)
+    result = np.concatenate([*parts, resampler.flush()])
+    np.testing.assert_allclose(result, expected, atol=1e-6)
+
+
+def test_normalize_frame_rejects_mismatched_resampler() -> None:
+    frame = make_frame(np.zeros(480, dtype=np.float32), sample_rate=48_000)
+
+    with pytest.raises(ValueError, match='resampler rates do not match'):
+        normalize_frame(frame, resampler=StreamingResampler(44_100))
+
+
+def test_normalize_frames_matches_frame_by_frame_conversion() -> None:
+    rng = np.random.default_rng(5)
+    frames = [
+        make_frame(
+            rng.integers(-32768, 32767, size=(160, 2), dtype=np.int16),
+            channels=2,
+        )
+        for _ in range(4)
+    ]
+
+    result = normalize_frames(frames)
+
+    expected = np.concatenate([normalize_frame(frame) for frame in frames])
+    np.testing.assert_array_equal(result, expected)
+    assert result.dtype == np.float32
+    assert result.flags.c_contiguous
+
+
+def test_normalize_frames_resamples_batch_through_streaming_resampler() -> None:
+    samples = np.sin(np.arange(4_800) / 5.0).astype(np.float32)
+    frames = [
+        make_frame(samples[start : start + 480], sample_rate=48_000)
+        for start in range(0, len(samples), 480)
+    ]
+    batched = StreamingResampler(48_000)
+    framewise = StreamingResampler(48_000)
+
+    result = normalize_frames(frames[:6], resampler=batched)
+    result = np.concatenate(
+        [result, normalize_frames(frames[6:], resampler=batched)]
+    )
+
+    expected = np.concatenate(
+        [normalize_frame(frame, resampler=framewise) for frame in frames]
+    )
+    np.testing.assert_allclose(result, expected, atol=1e-6)
+
+
+def test_normalize_frames_returns_empty_block_for_no_frames() -> None:
+    result = normalize_frames([])
+
+    assert result.dtype == np.float32
+    assert len(result) == 0
+
+
+@pytest.mark.parametrize(
+    'other',
+    [
+        make_frame(np.zeros(4, dtype=np.float32), sample_rate=8_000),
+        make_frame(np.zeros(4, dtype=np.float32), channels=2),
+        make_frame(np.zeros(4, dtype=np.int16)),
+    ],
+)
+def test_normalize_frames_rejects_incompatible_frames(
+    other: AudioFrame,
+) -> None:
+    frames = [make_frame(np.zeros(4, dtype=np.float32)), other]
+
+    with pytest.raises(ValueError, match='frames must share'):
+        normalize_frames(frames)
+
+
+def test_normalize_frames_rejects_frame_that_does_not_fit_channels() -> None:
+    frames = [
+        make_frame(np.zeros(4, dtype=np.float32), channels=2),
+        make_frame(np.zeros(3, dtype=np.float32), channels=2),
+    ]
+
+    with pytest.raises(ValueError, match='do not fit the channel count'):
+        normalize_frames(frames)
+
+
+@pytest.mark.parametrize(
+    ('dtype', 'sample_rate'),
+    [
+        (np.int16, 16_000),
+        (np.uint8, 16_000),
+        (np.float32, 16_000),
+        (np.int16, 48_000),
+        (np.int16, 44_100),
+    ],
+)
+def test_frame_writer_matches_normalize_then_append(
+    dtype: type, sample_rate: int
+) -> None:
+    rng = np.random.default_rng(9)
+    frames = [
+        make_frame(
+            (rng.uniform(-0.5, 0.5, size=(sample_rate // 100, 2)) * 200 + (
+                128 if dtype is np.uint8 else 0
+            )).astype(dtype),
+            sample_rate=sample_rate,
+            channels=2,
+        )
+        for _ in range(12)
+    ]
+    writer = FrameWriter()
+    resampler = (
+        None if sample_rate == 16_000 else StreamingResampler(sample_rate)
+    )
+    fused = AudioRingBuffer(700)
+    reference = AudioRingBuffer(700)
+
+    for frame in frames:
+        written = writer.write(frame, fused)
+        expected = normalize_frame(frame, resampler=resampler)
+        reference.append(expected)
+        assert written == len(expected)
+
+    assert fused.total_samples == reference.total_samples
+    np.testing.assert_allclose(
+        fused.latest(700), reference.latest(700), atol=1e-6
+    )
+
+
+def test_frame_writer_keeps_only_the_tail_of_an_oversized_frame() -> None:
+    ring = AudioRingBuffer(4)
+    frame = make_frame(np.arange(6, dtype=np.float32))
+
+    written = FrameWriter().write(frame, ring)
+
+    assert written == 6
+    assert ring.total_samples == 6
+    np.testing.assert_array_equal(
+        ring.latest(4), np.array([2, 3, 4, 5], dtype=np.float32)
+    )
+
+
+@pytest.mark.parametrize('sample_rate', [16_000, 48_000])
+def test_frame_writer_stores_into_compact_ring(sample_rate: int) -> None:
+    rng = np.random.default_rng(25)
+    frames = [
+        make_frame(
+            rng.uniform(-0.9, 0.9, size=sample_rate // 100).astype(
+                np.float32
+            ),
+            sample_rate=sample_rate,
+        )
+        for _ in range(12)
+    ]
+    writer = FrameWriter()
+    exact_writer = FrameWriter()
+    compact = AudioRingBuffer(700, dtype=np.int16)
+    exact = AudioRingBuffer(700)
+
+    for frame in frames:
+        assert writer.write(frame, compact) == exact_writer.write(
+            frame, exact
+        )
+
+    assert compact.total_samples == exact.total_samples
+    np.testing.assert_allclose(
+        compact.latest(700), exact.latest(700), atol=0.5 / 32767 + 1e-7
+    )
+
+
+def test_frame_writer_rejects_frame_that_does_not_fit_channels() -> None:
+    frame = make_frame(np.zeros(3, dtype=np.float32), channels=2)
+
+    with pytest.raises(ValueError, match='do not fit the channel count'):
+        FrameWriter().write(frame, AudioRingBuffer(8))
@@ -0,0 +1,95 @@
+import math
+
+import numpy as np
+import pytest
+from scipy.signal import resample_poly
+
+from real_time_captions.audio.resample import (
+    StreamingResampler,
+    _polyphase_bank,
+)
+
+
+def _stream(
+    resampler: StreamingResampler, samples: np.ndarray, frame: int
+) -> np.ndarray:
+    parts = [
+        resampler.process(samples[start : start + frame])
+        for start in range(0, len(samples), frame)
+    ]
+    parts.append(resampler.flush())
+    return np.concatenate(parts)
+
+
+@pytest.mark.parametrize(
+    ('source_rate', 'frame'),
+    [
+        (48_000, 480),
+        (44_100, 441),
+        (44_100, 1_000),
+        (44_100, 22_050),
+        (8_000, 160),
+    ],
+)
+def test_streaming_resampler_matches_one_shot_resampling(
+    source_rate: int, frame: int
+) -> None:
+    samples = (
+        np.random.default_rng(3).standard_normal(source_rate // 2)
+    ).astype(np.float32)
+    divisor = math.gcd(source_rate, 16_000)
+
+    result = _stream(StreamingResampler(source_rate), samples, frame)
+
+    expected = resample_poly(
+        samples.astype(np.float64),
+        16_000 // divisor,
+        source_rate // divisor,
+    )
+    assert result.dtype == np.float32
+    assert len(result) == len(expected)
+    np.testing.assert_allclose(result, expected, atol=1e-6)
+
+
+def test_streaming_resampler_reuses_filter_taps_per_ratio() -> None:
+    first = StreamingResampler(48_000)
+    second = StreamingResampler(96_000, 32_000)
+
+    assert first._bank is second._bank
+    assert _polyphase_bank(1, 3) is _polyphase_bank(1, 3)
+    assert not first._bank.flags.writeable
+
+
+def test_streaming_resampler_passes_matching_rates_through() -> None:
+    resampler = StreamingResampler(16_000)
+    samples = np.array([0.25, -0.5], dtype=np.float64)
+
+    result = resampler.process(samples)
+
+    np.testing.assert_array_equal(result, samples.astype(np.float32))
+    assert result.dtype == np.float32
+    assert len(resampler.flush()) == 0
+
+
+def test_streaming_resampler_flush_starts_a_new_stream() -> None:
+    resampler = StreamingResampler(48_000)
+    samples = np.linspace(-1.0, 1.0, 4_800, dtype=np.float32)
+
+    first = _stream(resampler, samples, 480)
+    second = _stream(resampler, samples, 480)
+    resampler.process(samples)
+    resampler.reset()
+    third = _stream(resampler, samples, 480)
+
+    np.testing.assert_array_equal(first, second)
+    np.testing.assert_array_equal(first, third)
+
+
+@pytest.mark.parametrize(
+    ('source_rate', 'target_rate'), [(0, 16_000), (48_000, -1), (True, 1)]
+)
+def test_streaming_resampler_rejects_non_positive_rates(
+    source_rate: int, target_rate: int
+) -> None:
+    with pytest.raises(ValueError, match='sample rates must be positive'):
+        StreamingResampler(source_rate, target_rate)
@@ -1,7 +1,12 @@
+import tracemalloc
+
 import numpy as np
 import pytest
 
-from real_time_captions.audio.ring_buffer import AudioRingBuffer
+from real_time_captions.audio.ring_buffer import (
+    AudioRangeEvicted,
+    AudioRingBuffer,
+)
 
 
 def test_ring_buffer_discards_oldest_samples_at_capacity() -> None:
@@ -63,3 +68,303 @@ def test_ring_buffer_clamps_requested_count_to_available_samples() -> None:
 def test_ring_buffer_rejects_non_positive_capacity(capacity_samples: int) -> None:
     with pytest.raises(ValueError, match="capacity_samples must be positive"):
         AudioRingBuffer(capacity_samples=capacity_samples)
+
+
+def test_window_handle_materializes_its_range_after_later_appends() -> None:
+    buffer = AudioRingBuffer(capacity_samples=6)
+    buffer.append(np.array([1, 2, 3, 4], dtype=np.float32))
+    window = buffer.window(3)
+    buffer.append(np.array([5], dtype=np.float32))
+
+    result = window.materialize()
+
+    np.testing.assert_array_equal(result, np.array([2, 3, 4], dtype=np.float32))
+    assert (window.start, window.stop) == (1, 4)
+    assert result.flags.owndata
+    with pytest.raises(ValueError, match='read-only'):
+        result[0] = 9
+
+
+def test_window_handle_keeps_only_the_retained_part_of_an_evicted_head() -> None:
+    buffer = AudioRingBuffer(capacity_samples=4)
+    buffer.append(np.array([1, 2, 3, 4], dtype=np.float32))
+    window = buffer.window(4)
+    buffer.append(np.array([5, 6], dtype=np.float32))
+
+    np.testing.assert_array_equal(
+        window.materialize(), np.array([3, 4], dtype=np.float32)
+    )
+    buffer.append(np.array([7, 8, 9, 10], dtype=np.float32))
+    assert len(window.materialize()) == 0
+
+
+def test_window_handle_reads_across_wrapped_storage() -> None:
+    buffer = AudioRingBuffer(capacity_samples=5)
+    buffer.append(np.array([1, 2, 3, 4], dtype=np.float32))
+    buffer.append(np.array([5, 6, 7], dtype=np.float32))
+
+    window = buffer.window(10)
+
+    assert buffer.total_samples == 7
+    np.testing.assert_array_equal(
+        window.materialize(), np.array([3, 4, 5, 6, 7], dtype=np.float32)
+    )
+
+
+def test_ring_buffer_restore_keeps_absolute_positions() -> None:
+    buffer = AudioRingBuffer(capacity_samples=3)
+    buffer.append(np.array([9.0], dtype=np.float32))
+
+    buffer.restore(np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32), 10)
+    buffer.append(np.array([5.0], dtype=np.float32))
+
+    assert buffer.total_samples == 11
+    np.testing.assert_array_equal(buffer.latest(3), np.array([3.0, 4.0, 5.0]))
+    window = buffer.window(2)
+    assert (window.start, window.stop) == (9, 11)
+
+
+def test_ring_buffer_restore_rejects_more_samples_than_total() -> None:
+    buffer = AudioRingBuffer(capacity_samples=3)
+
+    with pytest.raises(ValueError, match='exceed total_samples'):
+        buffer.restore(np.ones(2, dtype=np.float32), 1)
+
+
+def test_ring_buffer_reserve_exposes_wrapped_slots_until_commit() -> None:
+    buffer = AudioRingBuffer(capacity_samples=5)
+    buffer.append(np.array([1, 2, 3, 4], dtype=np.float32))
+
+    head, tail = buffer.reserve(3)
+    head[:] = [5]
+    tail[:] = [6, 7]
+
+    assert buffer.total_samples == 4
+    buffer.commit(3)
+    np.testing.assert_array_equal(
+        buffer.latest(5), np.array([3, 4, 5, 6, 7], dtype=np.float32)
+    )
+    assert buffer.total_samples == 7
+
+
+def test_ring_buffer_reserve_rejects_counts_beyond_capacity() -> None:
+    buffer = AudioRingBuffer(capacity_samples=3)
+
+    with pytest.raises(ValueError, match='within the buffer capacity'):
+        buffer.reserve(4)
+    with pytest.raises(ValueError, match='within the buffer capacity'):
+        buffer.commit(-1)
+
+
+def test_readers_consume_the_same_samples_independently() -> None:
+    buffer = AudioRingBuffer(capacity_samples=8)
+    meter = buffer.add_reader('meter')
+    recorder = buffer.add_reader('recorder')
+    buffer.append(np.array([1, 2, 3], dtype=np.float32))
+
+    first = meter.read()
+    buffer.append(np.array([4, 5], dtype=np.float32))
+    second = meter.read()
+    both = recorder.read()
+
+    np.testing.assert_array_equal(first.head, [1, 2, 3])
+    np.testing.assert_array_equal(second.head, [4, 5])
+    assert (first.start, second.start) == (0, 3)
+    np.testing.assert_array_equal(both.head, [1, 2, 3, 4, 5])
+    assert meter.read().size == 0
+    assert buffer.readers == ('meter', 'recorder')
+
+
+def test_reader_returns_zero_copy_read_only_segments_across_wrap() -> None:
+    buffer = AudioRingBuffer(capacity_samples=5)
+    buffer.append(np.array([1, 2, 3, 4], dtype=np.float32))
+    reader = buffer.add_reader('vad', from_oldest=True)
+    reader.read(2)
+    buffer.append(np.array([5, 6], dtype=np.float32))
+
+    chunk = reader.read()
+
+    np.testing.assert_array_equal(chunk.head, [3, 4, 5])
+    np.testing.assert_array_equal(chunk.tail, [6])
+    assert np.shares_memory(chunk.head, buffer._data)
+    assert not chunk.head.flags.writeable
+    assert not chunk.tail.flags.writeable
+    assert (chunk.start, chunk.size, chunk.lost) == (2, 4, 0)
+
+
+def test_lapped_reader_reports_overrun_and_resumes_at_oldest_sample() -> None:
+    buffer = AudioRingBuffer(capacity_samples=4)
+    reader = buffer.add_reader('slow')
+    buffer.append(np.arange(10, dtype=np.float32))
+
+    assert reader.available == 4
+    chunk = reader.read()
+
+    assert chunk.lost == 6
+    assert chunk.start == 6
+    np.testing.assert_array_equal(
+        np.concatenate((chunk.head, chunk.tail)), [6, 7, 8, 9]
+    )
+    assert (reader.overruns, reader.lost_samples) == (1, 6)
+    assert reader.read().lost == 0
+
+
+def test_reader_names_are_unique_and_removable() -> None:
+    buffer = AudioRingBuffer(capacity_samples=4)
+    buffer.add_reader('asr')
+
+    with pytest.raises(ValueError, match='reader already exists: asr'):
+        buffer.add_reader('asr')
+    buffer.remove_reader('asr')
+    with pytest.raises(KeyError):
+        buffer.remove_reader('asr')
+    assert buffer.readers == ()
+
+
+def test_range_addresses_retained_audio_by_absolute_sample() -> None:
+    buffer = AudioRingBuffer(capacity_samples=5)
+    buffer.append(np.array([1, 2, 3, 4], dtype=np.float32))
+    buffer.append(np.array([5, 6, 7], dtype=np.float32))
+
+    window = buffer.range(3, 6)
+
+    assert (window.start, window.stop) == (3, 6)
+    np.testing.assert_array_equal(window.materialize(), [4, 5, 6])
+
+
+def test_range_reports_evicted_and_future_samples() -> None:
+    buffer = AudioRingBuffer(capacity_samples=4)
+    buffer.append(np.arange(6, dtype=np.float32))
+
+    with pytest.raises(AudioRangeEvicted, match='samples 1 to 2'):
+        buffer.range(1, 4)
+    with pytest.raises(ValueError, match='after the newest sample 6'):
+        buffer.range(3, 7)
+    with pytest.raises(ValueError, match='must not follow its end'):
+        buffer.range(5, 4)
+
+
+def test_time_lookups_count_back_from_the_newest_append() -> None:
+    buffer = AudioRingBuffer(capacity_samples=40, sample_rate=10)
+    buffer.append(np.arange(10, dtype=np.float32), audio_end=11.0)
+    head, tail = buffer.reserve(10)
+    head[:] = np.arange(10, 20)
+    buffer.commit(10, audio_end=12.0)
+
+    window = buffer.time_range(10.5, 11.2)
+
+    np.testing.assert_array_equal(window.materialize(), np.arange(5, 12))
+    assert buffer.sample_at(10.0) == 0
+    assert buffer.time_of(15) == pytest.approx(11.5)
+    with pytest.raises(AudioRangeEvicted):
+        buffer.time_range(9.0, 10.5)
+
+
+def test_time_lookups_need_a_rate_and_a_recorded_time() -> None:
+    untimed = AudioRingBuffer(capacity_samples=4)
+    timed = AudioRingBuffer(capacity_samples=4, sample_rate=2)
+    timed.append(np.ones(2, dtype=np.float32), audio_end=1.0)
+    timed.restore(np.ones(2, dtype=np.float32), total_samples=8)
+
+    with pytest.raises(ValueError, match='require a sample_rate'):
+        untimed.sample_at(0.0)
+    with pytest.raises(RuntimeError, match='no session time recorded'):
+        timed.time_of(7)
+
+
+@pytest.mark.parametrize(
+    ('dtype', 'rtol', 'atol'),
+    [
+        (np.int16, 0.0, 0.5 / 32767),
+        (np.float16, 2**-11, 2**-25),
+    ],
+)
+def test_compact_storage_materializes_float32_within_error_bound(
+    dtype: type, rtol: float, atol: float
+) -> None:
+    rng = np.random.default_rng(25)
+    exact = AudioRingBuffer(capacity_samples=1_000)
+    compact = AudioRingBuffer(capacity_samples=1_000, dtype=dtype)
+    for _ in range(7):
+        samples = rng.uniform(-1.0, 1.0, size=300).astype(np.float32)
+        exact.append(samples)
+        compact.append(samples)
+
+    for actual, expected in (
+        (compact.latest(1_000), exact.latest(1_000)),
+        (compact.window(640).materialize(), exact.window(640).materialize()),
+        (
+            compact.range(1_500, 1_900).materialize(),
+            exact.range(1_500, 1_900).materialize(),
+        ),
+    ):
+        assert actual.dtype == np.float32
+        np.testing.assert_allclose(
+            actual,
+            expected,
+            rtol=rtol,
+            atol=atol + np.finfo(np.float32).eps,
+        )
+
+
+def test_int16_storage_clips_beyond_full_scale_and_halves_memory() -> None:
+    exact = AudioRingBuffer(capacity_samples=4)
+    compact = AudioRingBuffer(capacity_samples=4, dtype='int16')
+
+    compact.append(np.array([-2.0, -1.0, 1.0, 3.5], dtype=np.float32))
+
+    np.testing.assert_array_equal(compact.latest(4), [-1, -1, 1, 1])
+    assert compact.dtype == np.int16
+    assert compact._data.nbytes * 2 == exact._data.nbytes
+
+
+def test_compact_storage_hands_readers_float32_copies() -> None:
+    buffer = AudioRingBuffer(capacity_samples=5, dtype=np.float16)
+    buffer.append(np.array([1, 2, 3, 4], dtype=np.float32))
+    reader = buffer.add_reader('vad', from_oldest=True)
+    reader.read(2)
+    buffer.append(np.array([5, 6], dtype=np.float32))
+
+    chunk = reader.read()
+
+    np.testing.assert_array_equal(chunk.head, [3, 4, 5])
+    np.testing.assert_array_equal(chunk.tail, [6])
+    assert chunk.head.dtype == chunk.tail.dtype == np.float32
+    assert not np.shares_memory(chunk.head, buffer._data)
+    assert not chunk.head.flags.writeable
+
+
+def test_compact_storage_round_trips_through_restore() -> None:
+    buffer = AudioRingBuffer(capacity_samples=4, dtype=np.int16)
+
+    buffer.restore(np.array([0.25, -0.5, 0.75], dtype=np.float32), 9)
+
+    assert buffer.total_samples == 9
+    np.testing.assert_allclose(
+        buffer.latest(3), [0.25, -0.5, 0.75], atol=0.5 / 32767
+    )
+
+
+def test_compact_storage_rejects_reserve_and_unsupported_dtypes() -> None:
+    with pytest.raises(ValueError, match='reserve requires float32 storage'):
+        AudioRingBuffer(capacity_samples=4, dtype=np.int16).reserve(2)
+    with pytest.raises(ValueError, match='storage dtype must be'):
+        AudioRingBuffer(capacity_samples=4, dtype=np.float64)
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.int16])
+def test_wrapped_window_materializes_into_one_allocation(dtype: type) -> None:
+    buffer = AudioRingBuffer(capacity_samples=100_000, dtype=dtype)
+    for _ in range(2):
+        buffer.append(np.full(60_000, 0.5, dtype=np.float32))
+    window = buffer.window(100_000)
+
+    tracemalloc.start()
+    try:
+        samples = window.materialize()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    np.testing.assert_allclose(samples, 0.5, atol=0.5 / 32767)
+    assert peak < 1.5 * samples.nbytes
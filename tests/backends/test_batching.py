@@ -0,0 +1,163 @@
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from real_time_captions.backends.batching import BatchingAsrBackend
+from real_time_captions.contracts import AsrHypothesis, InferenceRequest, Word
+from tests.fakes import FakeAsrBackend
+
+
+def request(session_id: str, sequence: int = 1) -> InferenceRequest:
+    return InferenceRequest(
+        session_id, sequence, np.zeros(4, dtype=np.float32), float(sequence)
+    )
+
+
+def hypothesis(request: InferenceRequest) -> AsrHypothesis:
+    return AsrHypothesis(
+        request.session_id,
+        request.sequence,
+        (Word(request.session_id, 0.0, 0.1),),
+        'en',
+        1.0,
+        request.audio_end,
+    )
+
+
+class ReversingBatchBackend:
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[tuple[str, int]]] = []
+        self._fail = fail
+
+    def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+        raise AssertionError('batched backend must not be called per request')
+
+    def transcribe_batch(
+        self, requests: Sequence[InferenceRequest]
+    ) -> Sequence[AsrHypothesis]:
+        self.batches.append(
+            [(item.session_id, item.sequence) for item in requests]
+        )
+        if self._fail:
+            raise RuntimeError('batch failed')
+        return [hypothesis(item) for item in reversed(requests)]
+
+
+def test_concurrent_requests_from_sessions_share_one_batch() -> None:
+    backend = ReversingBatchBackend()
+    batching = BatchingAsrBackend(backend, max_batch_size=3, max_wait=5.0)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(
+            pool.map(batching.transcribe, [request(name) for name in 'abc'])
+        )
+
+    assert len(backend.batches) == 1
+    assert sorted(backend.batches[0]) == [('a', 1), ('b', 1), ('c', 1)]
+    assert [result.session_id for result in results] == ['a', 'b', 'c']
+    assert [result.words[0].text for result in results] == ['a', 'b', 'c']
+    assert (batching.dispatched_batches, batching.dispatched_requests) == (1, 3)
+
+
+def test_partial_batch_is_dispatched_after_max_wait() -> None:
+    backend = ReversingBatchBackend()
+    batching = BatchingAsrBackend(backend, max_batch_size=8, max_wait=0.01)
+
+    result = batching.transcribe(request('solo', 7))
+
+    assert (result.session_id, result.sequence) == ('solo', 7)
+    assert backend.batches == [[('solo', 7)]]
+
+
+def test_batches_never_exceed_max_batch_size() -> None:
+    backend = ReversingBatchBackend()
+    batching = BatchingAsrBackend(backend, max_batch_size=2, max_wait=0.05)
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(
+            pool.map(
+                batching.transcribe,
+                [request(f's{index}', index) for index in range(5)],
+            )
+        )
+
+    assert [result.sequence for result in results] == [0, 1, 2, 3, 4]
+    assert all(len(batch) <= 2 for batch in backend.batches)
+    assert sum(len(batch) for batch in backend.batches) == 5
+
+
+def test_batch_failure_is_raised_to_every_caller() -> None:
+    batching = BatchingAsrBackend(
+        ReversingBatchBackend(fail=True), max_batch_size=2, max_wait=5.0
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(batching.transcribe, request(name)) for name in 'ab'
+        ]
+        for future in futures:
+            with pytest.raises(RuntimeError, match='batch failed'):
+                future.result(timeout=5)
+
+
+def test_missing_batch_result_fails_only_that_request() -> None:
+    class DroppingBatchBackend(ReversingBatchBackend):
+        def transcribe_batch(
+            self, requests: Sequence[InferenceRequest]
+        ) -> Sequence[AsrHypothesis]:
+            return [hypothesis(item) for item in requests if item.session_id != 'b']
+
+    batching = BatchingAsrBackend(
+        DroppingBatchBackend(), max_batch_size=2, max_wait=5.0
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        kept = pool.submit(batching.transcribe, request('a'))
+        dropped = pool.submit(batching.transcribe, request('b'))
+
+        assert kept.result(timeout=5).session_id == 'a'
+        with pytest.raises(ValueError, match='batch result is missing'):
+            dropped.result(timeout=5)
+
+
+def test_unbatched_backend_falls_back_to_direct_calls() -> None:
+    backend = FakeAsrBackend(hypotheses=[('cs', ())])
+    batching = BatchingAsrBackend(backend, max_batch_size=4, max_wait=5.0)
+
+    result = batching.transcribe(request('s1', 3))
+
+    assert batching.batching is False
+    assert (result.session_id, result.sequence) == ('s1', 3)
+    assert batching.dispatched_batches == 0
+
+
+def test_restart_is_forwarded_only_when_the_backend_has_one() -> None:
+    class RestartableBatchBackend(ReversingBatchBackend):
+        restarts = 0
+
+        def restart(self) -> None:
+            self.restarts += 1
+
+    backend = RestartableBatchBackend()
+    restartable = BatchingAsrBackend(backend, max_batch_size=2, max_wait=0.0)
+    plain = BatchingAsrBackend(
+        ReversingBatchBackend(), max_batch_size=2, max_wait=0.0
+    )
+
+    assert restartable.restart is not None
+    restartable.restart()
+    assert backend.restarts == 1
+    assert plain.restart is None
+
+
+@pytest.mark.parametrize(
+    ('max_batch_size', 'max_wait', 'message'),
+    [(0, 0.1, 'max_batch_size'), (True, 0.1, 'max_batch_size'), (2, -1, 'max_wait')],
+)
+def test_batching_rejects_invalid_limits(
+    max_batch_size: int, max_wait: float, message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        BatchingAsrBackend(FakeAsrBackend([]), max_batch_size, max_wait)
@@ -0,0 +1,178 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from real_time_captions.backends.process_worker import (
+    ProcessWorkerBackend,
+    WorkerCrashed,
+)
+from real_time_captions.backends.watchdog import (
+    BackendTimeout,
+    BackendWatchdog,
+)
+from real_time_captions.captions.translation import (
+    TranslationRequest,
+    TranslationResult,
+)
+from real_time_captions.contracts import (
+    AsrHypothesis,
+    InferenceRequest,
+    TargetLanguage,
+    Word,
+)
+from real_time_captions.diagnostics import RuntimeMetrics
+
+
+CRASH_SEQUENCE = 99
+FAIL_SEQUENCE = 98
+HANG_SEQUENCE = 97
+
+
+class EchoBackend:
+    def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+        if request.sequence == CRASH_SEQUENCE:
+            os._exit(3)
+        if request.sequence == FAIL_SEQUENCE:
+            raise ValueError('model rejected window')
+        if request.sequence == HANG_SEQUENCE:
+            time.sleep(60)
+        summary = f'{len(request.samples)}:{float(request.samples.sum()):g}'
+        return AsrHypothesis(
+            request.session_id,
+            request.sequence,
+            (Word(summary, 0.0, request.audio_end),),
+            'cs',
+            1.0,
+            request.audio_end,
+        )
+
+    def translate(self, request: TranslationRequest) -> TranslationResult:
+        return TranslationResult(
+            request.session_id,
+            request.sequence,
+            committed=request.committed.upper(),
+            provisional=request.provisional.upper(),
+            committed_segment_id=request.committed_segment_id,
+        )
+
+
+class SlowLoadingBackend(EchoBackend):
+    def __init__(self) -> None:
+        time.sleep(1.0)
+
+
+class BrokenBackend(EchoBackend):
+    def __init__(self) -> None:
+        os._exit(4)
+
+
+def request(sequence: int, samples: np.ndarray) -> InferenceRequest:
+    return InferenceRequest('s1', sequence, samples, 2.0)
+
+
+def test_worker_moves_windows_through_shared_memory() -> None:
+    with ProcessWorkerBackend(EchoBackend) as worker:
+        short = worker.transcribe(request(1, np.ones(4, dtype=np.float32)))
+        grown = worker.transcribe(
+            request(2, np.arange(160_000, dtype=np.float32))
+        )
+        translated = worker.translate(
+            TranslationRequest(
+                's1', 3, 'cs', TargetLanguage.POLISH, 'ahoj', 'svete', 1
+            )
+        )
+
+    assert (short.session_id, short.sequence) == ('s1', 1)
+    assert short.words[0].text == '4:4'
+    assert grown.words[0].text == f'160000:{float(np.arange(160_000).sum()):g}'
+    assert (translated.committed, translated.provisional) == ('AHOJ', 'SVETE')
+    assert translated.committed_segment_id == 1
+
+
+def test_backend_errors_are_reraised_without_restarting_worker() -> None:
+    metrics = RuntimeMetrics(max_samples=4)
+    with ProcessWorkerBackend(EchoBackend, metrics) as worker:
+        pid = worker.pid
+        with pytest.raises(ValueError, match='model rejected window'):
+            worker.transcribe(
+                request(FAIL_SEQUENCE, np.ones(2, dtype=np.float32))
+            )
+        recovered = worker.transcribe(request(1, np.ones(2, dtype=np.float32)))
+
+        assert worker.pid == pid
+    assert recovered.sequence == 1
+    assert metrics.snapshot().worker_restarts == 0
+
+
+def test_crashed_worker_is_respawned_and_counted() -> None:
+    metrics = RuntimeMetrics(max_samples=4)
+    with ProcessWorkerBackend(EchoBackend, metrics) as worker:
+        crashed_pid = worker.pid
+        with pytest.raises(WorkerCrashed, match='AI worker process exited'):
+            worker.transcribe(
+                request(CRASH_SEQUENCE, np.ones(2, dtype=np.float32))
+            )
+        recovered = worker.transcribe(request(1, np.ones(3, dtype=np.float32)))
+
+        assert worker.pid not in (None, crashed_pid)
+    assert recovered.words[0].text == '3:3'
+    assert metrics.snapshot().worker_restarts == 1
+
+
+def test_watchdog_restart_kills_a_hung_worker_without_counting_a_crash() -> None:
+    metrics = RuntimeMetrics(max_samples=4)
+    with ProcessWorkerBackend(EchoBackend) as worker:
+        worker.transcribe(request(1, np.ones(2, dtype=np.float32)))
+        hung_pid = worker.pid
+        watchdog = BackendWatchdog(
+            0.5, restart=worker.restart, metrics=metrics
+        )
+        with pytest.raises(BackendTimeout):
+            watchdog.call(
+                worker.transcribe,
+                request(HANG_SEQUENCE, np.ones(2, dtype=np.float32)),
+            )
+        recovered = watchdog.call(
+            worker.transcribe, request(2, np.ones(3, dtype=np.float32))
+        )
+
+        assert worker.pid not in (None, hung_pid)
+    assert recovered.words[0].text == '3:3'
+    snapshot = metrics.snapshot()
+    assert snapshot.worker_restarts == 1
+    assert snapshot.recovery_p50 is not None
+
+
+def test_restart_waits_for_a_slow_load_outside_the_call_timeout() -> None:
+    metrics = RuntimeMetrics(max_samples=4)
+    with ProcessWorkerBackend(SlowLoadingBackend) as worker:
+        hung_pid = worker.pid
+        watchdog = BackendWatchdog(
+            0.5, restart=worker.restart, metrics=metrics
+        )
+        with pytest.raises(BackendTimeout):
+            watchdog.call(
+                worker.transcribe,
+                request(HANG_SEQUENCE, np.ones(2, dtype=np.float32)),
+            )
+        assert worker.pid not in (None, hung_pid)
+        recovered = [
+            watchdog.call(
+                worker.transcribe,
+                request(sequence, np.ones(3, dtype=np.float32)),
+            )
+            for sequence in (2, 3)
+        ]
+
+    assert [result.sequence for result in recovered] == [2, 3]
+    assert metrics.snapshot().worker_restarts == 1
+
+
+def test_worker_that_dies_while_loading_fails_to_start() -> None:
+    worker = ProcessWorkerBackend(BrokenBackend)
+    with pytest.raises(WorkerCrashed, match='before it was ready'):
+        worker.start()
+    assert worker.pid is None
+    worker.close()
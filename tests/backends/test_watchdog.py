@@ -0,0 +1,116 @@
+from threading import Event, get_ident
+
+import pytest
+
+from real_time_captions.backends.watchdog import (
+    BackendTimeout,
+    BackendWatchdog,
+)
+from real_time_captions.diagnostics import RuntimeMetrics
+
+
+def test_watchdog_returns_results_and_reraises_backend_errors() -> None:
+    watchdog = BackendWatchdog(1.0)
+
+    def reject(value: int) -> int:
+        raise ValueError(f'rejected {value}')
+
+    assert watchdog.call(lambda value: value * 2, 21) == 42
+    with pytest.raises(ValueError, match='rejected 3'):
+        watchdog.call(reject, 3)
+
+
+def test_hung_call_times_out_and_restarts_backend() -> None:
+    release = Event()
+    restarts: list[str] = []
+    metrics = RuntimeMetrics(max_samples=4)
+    watchdog = BackendWatchdog(
+        0.05, restart=lambda: restarts.append('restart'), metrics=metrics
+    )
+    try:
+        with pytest.raises(BackendTimeout, match='0.05 s timeout'):
+            watchdog.call(release.wait, 5)
+    finally:
+        release.set()
+
+    assert restarts == ['restart']
+    assert metrics.snapshot().worker_restarts == 1
+
+
+def test_recovery_latency_spans_first_timeout_to_next_success() -> None:
+    release = Event()
+    finished = Event()
+    ticks = iter([10.0, 12.5])
+    metrics = RuntimeMetrics(max_samples=4)
+    watchdog = BackendWatchdog(
+        0.01, metrics=metrics, clock=lambda: next(ticks)
+    )
+
+    def hang() -> None:
+        release.wait(5)
+        finished.set()
+
+    try:
+        for _ in range(2):
+            with pytest.raises(BackendTimeout):
+                watchdog.call(hang)
+    finally:
+        release.set()
+    assert finished.wait(5)
+
+    assert watchdog.call(lambda value: value, 'ok') == 'ok'
+    assert watchdog.call(lambda value: value, 'again') == 'again'
+    snapshot = metrics.snapshot()
+    assert (snapshot.recovery_p50, snapshot.recovery_p95) == (2.5, 2.5)
+    assert snapshot.worker_restarts == 0
+
+
+def test_calls_share_one_worker_thread_off_the_caller() -> None:
+    watchdog = BackendWatchdog(1.0)
+
+    first = watchdog.call(get_ident)
+    second = watchdog.call(get_ident)
+
+    assert first == second
+    assert first != get_ident()
+
+
+def test_new_calls_are_refused_while_an_unrestartable_call_hangs() -> None:
+    release = Event()
+    calls: list[int] = []
+    watchdog = BackendWatchdog(0.05)
+    try:
+        with pytest.raises(BackendTimeout, match='0.05 s timeout'):
+            watchdog.call(release.wait, 5)
+        with pytest.raises(BackendTimeout, match='still running'):
+            watchdog.call(calls.append, 1)
+    finally:
+        release.set()
+
+    assert watchdog.call(lambda value: value, 'ok') == 'ok'
+    assert calls == []
+
+
+def test_restart_lets_a_new_call_run_beside_the_abandoned_one() -> None:
+    release = Event()
+    started: list[int] = []
+    watchdog = BackendWatchdog(0.05, restart=lambda: None)
+
+    def hang() -> None:
+        started.append(get_ident())
+        release.wait(5)
+
+    try:
+        with pytest.raises(BackendTimeout):
+            watchdog.call(hang)
+        replacement = watchdog.call(get_ident)
+    finally:
+        release.set()
+
+    assert replacement != started[0]
+
+
+@pytest.mark.parametrize('timeout', [0.0, -1.0])
+def test_watchdog_rejects_non_positive_timeout(timeout: float) -> None:
+    with pytest.raises(ValueError, match='timeout must be positive'):
+        BackendWatchdog(timeout)
@@ -0,0 +1,148 @@
+import asyncio
+from threading import Event
+
+import numpy as np
+import pytest
+
+from real_time_captions.async_core import AsyncCaptionCore
+from real_time_captions.contracts import (
+    AsrHypothesis,
+    CaptionSnapshot,
+    InferenceRequest,
+    TargetLanguage,
+    Word,
+)
+from real_time_captions.core import RealtimeCaptionCore
+from tests.fakes import FakeAsrBackend, FakeTranslationBackend
+
+
+class BlockingAsrBackend:
+    def __init__(self) -> None:
+        self.release = Event()
+        self.called = Event()
+
+    def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+        self.called.set()
+        assert self.release.wait(timeout=5)
+        raise RuntimeError('asr failed')
+
+
+def make_core(asr: object) -> RealtimeCaptionCore:
+    return RealtimeCaptionCore(
+        session_id='async',
+        asr=asr,  # type: ignore[arg-type]
+        translator=FakeTranslationBackend({'Ahoj': 'Cze\u015b\u0107'}),
+        target=TargetLanguage.POLISH,
+        sample_rate=10,
+        context_seconds=2,
+    )
+
+
+def test_async_core_streams_only_changed_snapshots() -> None:
+    words = (Word('Ahoj', 0.0, 0.2),)
+    core = make_core(FakeAsrBackend(hypotheses=[('cs', words), ('cs', words)]))
+
+    async def scenario() -> tuple[list[CaptionSnapshot], CaptionSnapshot]:
+        async with AsyncCaptionCore(core) as captions:
+            stream = captions.snapshots()
+            await captions.submit_audio(
+                np.ones(2, dtype=np.float32), audio_end=0.5
+            )
+            received = [await anext(stream)]
+            await captions.submit_audio(
+                np.ones(2, dtype=np.float32), audio_end=1.5
+            )
+            while received[-1].translation_committed == '':
+                received.append(await asyncio.wait_for(anext(stream), 5))
+            finalized = await captions.finalize()
+        return received, finalized
+
+    received, finalized = asyncio.run(scenario())
+
+    assert received[0].source_provisional == 'Ahoj'
+    assert received[-1].source_committed == 'Ahoj'
+    assert received[-1].translation_committed == 'Cze\u015b\u0107'
+    assert all(left != right for left, right in zip(received, received[1:]))
+    assert finalized == received[-1]
+
+
+def test_async_submit_does_not_wait_for_blocking_backend() -> None:
+    asr = BlockingAsrBackend()
+    core = make_core(asr)
+
+    async def scenario() -> None:
+        async with AsyncCaptionCore(core) as captions:
+            stream = captions.snapshots()
+            for index in range(1, 4):
+                await asyncio.wait_for(
+                    captions.submit_audio(
+                        np.ones(2, dtype=np.float32), audio_end=index / 2
+                    ),
+                    timeout=1,
+                )
+            asr.release.set()
+            with pytest.raises(RuntimeError, match='asr failed'):
+                await asyncio.wait_for(anext(stream), 5)
+
+    asyncio.run(scenario())
+    assert core.take_worker_error() is None
+
+
+def test_close_gives_up_on_a_worker_stuck_in_a_backend_call() -> None:
+    asr = BlockingAsrBackend()
+    core = make_core(asr)
+
+    async def scenario() -> float:
+        loop = asyncio.get_running_loop()
+        captions = AsyncCaptionCore(core)
+        await captions.start()
+        await captions.submit_audio(np.ones(2, dtype=np.float32), 0.5)
+        await loop.run_in_executor(None, asr.called.wait, 5)
+        started = loop.time()
+        await captions.close(timeout=0.05)
+        return loop.time() - started
+
+    try:
+        assert asyncio.run(scenario()) < 1
+    finally:
+        asr.release.set()
+    assert core.worker_running is False
+
+
+def test_close_raises_a_worker_failure_no_iterator_received() -> None:
+    asr = BlockingAsrBackend()
+    asr.release.set()
+    core = make_core(asr)
+
+    async def scenario() -> None:
+        loop = asyncio.get_running_loop()
+        captions = AsyncCaptionCore(core)
+        await captions.start()
+        await captions.submit_audio(np.ones(2, dtype=np.float32), 0.5)
+        await loop.run_in_executor(None, asr.called.wait, 5)
+        with pytest.raises(RuntimeError, match='asr failed'):
+            await captions.close()
+
+    asyncio.run(scenario())
+    assert core.take_worker_error() is None
+
+
+def test_snapshot_stream_ends_when_core_closes() -> None:
+    core = make_core(FakeAsrBackend(hypotheses=[]))
+
+    async def scenario() -> list[CaptionSnapshot]:
+        captions = AsyncCaptionCore(core)
+        await captions.start()
+        stream = captions.snapshots()
+        await captions.close()
+        return [snapshot async for snapshot in stream]
+
+    assert asyncio.run(scenario()) == []
+    assert core.worker_running is False
+
+
+def test_async_core_requires_start() -> None:
+    captions = AsyncCaptionCore(make_core(FakeAsrBackend(hypotheses=[])))
+
+    with pytest.raises(RuntimeError, match='not started'):
+        asyncio.run(captions.finalize())
@@ -1,15 +1,25 @@
 from dataclasses import FrozenInstanceError
 
+from threading import Event, Thread
+
 import numpy as np
 import pytest
 
+from real_time_captions.audio.buffer_pool import SampleBufferPool
+from real_time_captions.audio.frame import AudioFrame
+from real_time_captions.audio.normalize import normalize_frame
+from real_time_captions.audio.resample import StreamingResampler
+from real_time_captions.audio.ring_buffer import AudioRangeEvicted
 from real_time_captions.contracts import (
     AsrHypothesis,
     InferenceRequest,
     TargetLanguage,
     Word,
 )
+from real_time_captions.backends.watchdog import BackendTimeout
 from real_time_captions.core import RealtimeCaptionCore
+from real_time_captions.diagnostics import RuntimeMetrics
+from real_time_captions.streaming.adaptive import AdaptiveWindowController
 from tests.fakes import FakeAsrBackend, FakeTranslationBackend
 
 
@@ -173,3 +183,397 @@ def test_asr_receives_only_the_bounded_rolling_audio_context() -> None:
         asr.requests[1].samples,
         np.array([4, 5, 6, 7, 8, 9, 10, 11], dtype=np.float32),
     )
+
+
+def test_cadence_limits_asr_rate_independently_of_chunk_size() -> None:
+    words = (Word('Ahoj', 0.0, 0.2),)
+    asr = FakeAsrBackend(hypotheses=[('cs', words)] * 4)
+    core = RealtimeCaptionCore(
+        session_id='cadence',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=2,
+        update_interval=0.5,
+    )
+
+    for index in range(1, 121):
+        core.submit_audio(np.ones(1, dtype=np.float32), audio_end=index / 100)
+    finalized = core.finalize()
+
+    assert [request.audio_end for request in asr.requests] == pytest.approx(
+        [0.01, 0.51, 1.01, 1.2]
+    )
+    assert len(asr.requests[-1].samples) == 120
+    assert finalized.source_committed == 'Ahoj'
+
+
+def test_adaptive_window_trims_context_when_asr_falls_behind() -> None:
+    words = (Word('Ahoj', 0.0, 0.2),)
+    asr = FakeAsrBackend(hypotheses=[('cs', words)] * 3)
+    # Each transcribe call is timed by two clock reads: start and end.
+    ticks = iter([0.0, 4.0, 10.0, 11.0, 20.0, 20.1])
+    metrics = RuntimeMetrics(max_samples=4)
+    core = RealtimeCaptionCore(
+        session_id='adaptive',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=8,
+        window_controller=AdaptiveWindowController(1.0, 8.0, target_rtf=0.5),
+        metrics=metrics,
+        clock=lambda: next(ticks),
+    )
+
+    for second in range(1, 4):
+        core.submit_audio(np.ones(400, dtype=np.float32), audio_end=4.0 * second)
+
+    assert [len(request.samples) for request in asr.requests] == [400, 200, 200]
+    snapshot = metrics.snapshot()
+    assert snapshot.asr_window_seconds == 2.5
+    assert snapshot.asr_rtf == pytest.approx(0.05)
+
+
+def test_adaptive_window_cannot_exceed_ring_context() -> None:
+    with pytest.raises(ValueError, match='cannot exceed context_seconds'):
+        RealtimeCaptionCore(
+            session_id='adaptive',
+            asr=FakeAsrBackend(hypotheses=[]),
+            translator=FakeTranslationBackend({}),
+            target=TargetLanguage.NATIVE,
+            sample_rate=100,
+            context_seconds=5,
+            window_controller=AdaptiveWindowController(1.0, 8.0, 0.5),
+        )
+
+
+def test_commit_overlap_starts_window_just_before_committed_boundary() -> None:
+    committed = Word('Ahoj', 0.0, 1.0)
+    tail = Word('svete', 2.2, 2.6)
+    asr = FakeAsrBackend(
+        hypotheses=[
+            ('cs', (committed,)),
+            ('cs', (committed,)),
+            ('cs', (Word('Ahoj', 0.75, 1.0), tail)),
+        ]
+    )
+    core = RealtimeCaptionCore(
+        session_id='trim',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=10,
+        commit_overlap=0.25,
+    )
+
+    for second in range(1, 4):
+        snapshot = core.submit_audio(
+            np.ones(100, dtype=np.float32), audio_end=float(second)
+        )
+
+    assert [len(request.samples) for request in asr.requests] == [100, 200, 225]
+    assert [request.audio_start for request in asr.requests] == pytest.approx(
+        [0.0, 0.0, 0.75]
+    )
+    assert snapshot.source_committed == 'Ahoj'
+    assert snapshot.source_provisional == 'svete'
+
+
+def test_commit_overlap_must_be_non_negative() -> None:
+    with pytest.raises(ValueError, match='commit_overlap must be non-negative'):
+        RealtimeCaptionCore(
+            session_id='trim',
+            asr=FakeAsrBackend(hypotheses=[]),
+            translator=FakeTranslationBackend({}),
+            target=TargetLanguage.NATIVE,
+            sample_rate=100,
+            context_seconds=10,
+            commit_overlap=-0.1,
+        )
+
+
+def test_ready_window_that_aged_past_max_lag_is_never_transcribed() -> None:
+    asr = FakeAsrBackend(hypotheses=[('cs', (Word('Ahoj', 1.2, 1.6),))])
+    core = RealtimeCaptionCore(
+        session_id='deadline',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=5,
+        max_lag=0.5,
+    )
+
+    core.enqueue_audio(np.ones(100, dtype=np.float32), audio_end=1.0)
+    core.enqueue_audio(np.ones(100, dtype=np.float32), audio_end=2.0)
+    snapshot = core.process_next()
+
+    assert [request.audio_end for request in asr.requests] == [2.0]
+    assert snapshot is not None and snapshot.source_provisional == 'Ahoj'
+    assert core.process_next() is None
+    assert not core.has_ready_work
+
+
+def test_ready_window_aging_behind_a_cadence_hold_is_expired() -> None:
+    asr = FakeAsrBackend(hypotheses=[('cs', ())])
+    core = RealtimeCaptionCore(
+        session_id='deadline',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=5,
+        update_interval=1.0,
+        max_lag=0.5,
+    )
+
+    core.enqueue_audio(np.ones(100, dtype=np.float32), audio_end=1.0)
+    core.enqueue_audio(np.ones(80, dtype=np.float32), audio_end=1.8)
+
+    assert core.process_next() is None
+    assert not core.has_ready_work
+    assert core.enqueue_audio(np.ones(20, dtype=np.float32), audio_end=2.0)
+    core.process_next()
+    assert [request.audio_end for request in asr.requests] == [2.0]
+
+
+def test_asr_timeout_resets_work_but_keeps_committed_captions() -> None:
+    committed = (Word('Ahoj', 0.0, 0.2),)
+    release = Event()
+    restarts: list[int] = []
+
+    class HangingOnceAsr(FakeAsrBackend):
+        def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+            if len(self.requests) == 2:
+                self.requests.append(request)
+                release.wait(5)
+            return super().transcribe(request)
+
+        def restart(self) -> None:
+            restarts.append(len(self.requests))
+
+    asr = HangingOnceAsr(
+        hypotheses=[('cs', committed)] * 2
+        + [('cs', committed + (Word('svete', 3.0, 3.4),))]
+    )
+    metrics = RuntimeMetrics(max_samples=4)
+    core = RealtimeCaptionCore(
+        session_id='watchdog',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=5,
+        asr_timeout=0.1,
+        metrics=metrics,
+    )
+    try:
+        for second in (1, 2):
+            core.submit_audio(
+                np.ones(100, dtype=np.float32), audio_end=float(second)
+            )
+        with pytest.raises(BackendTimeout):
+            core.submit_audio(np.ones(100, dtype=np.float32), audio_end=3.0)
+        timed_out = core.snapshot()
+        resumed = core.submit_audio(
+            np.ones(100, dtype=np.float32), audio_end=4.0
+        )
+    finally:
+        release.set()
+
+    assert timed_out.source_committed == 'Ahoj'
+    assert core.queue_depth == 0
+    assert resumed.source_committed == 'Ahoj'
+    assert resumed.source_provisional == 'svete'
+    assert len(asr.requests[-1].samples) == 400
+    assert restarts == [3]
+    snapshot = metrics.snapshot()
+    assert snapshot.worker_restarts == 1
+    assert snapshot.recovery_p50 is not None
+
+
+def test_finalize_preempts_queued_interim_window_for_the_final_pass() -> None:
+    words = (Word('Ahoj', 0.0, 0.2), Word('svete', 1.5, 1.9))
+    asr = FakeAsrBackend(hypotheses=[('cs', words)])
+    metrics = RuntimeMetrics(max_samples=4)
+    core = RealtimeCaptionCore(
+        session_id='endpoint',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=5,
+        metrics=metrics,
+    )
+
+    core.enqueue_audio(np.ones(100, dtype=np.float32), audio_end=1.0)
+    core.enqueue_audio(np.ones(100, dtype=np.float32), audio_end=2.0)
+    finalized = core.finalize()
+
+    assert [request.audio_end for request in asr.requests] == [2.0]
+    assert len(asr.requests[0].samples) == 200
+    assert finalized.source_committed == 'Ahoj svete'
+    assert metrics.snapshot().endpoint_p50 is not None
+    assert core.queue_depth == 0
+
+
+def test_core_writes_captured_frames_into_its_context_at_asr_rate() -> None:
+    asr = FakeAsrBackend(hypotheses=[('en', ())])
+    core = RealtimeCaptionCore(
+        session_id='frames',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=16_000,
+        context_seconds=5,
+    )
+    frame = AudioFrame(
+        session_id='capture',
+        samples=np.full((480, 2), 16_384, dtype=np.int16),
+        sample_rate=48_000,
+        channels=2,
+        sequence=1,
+        captured_at=0.0,
+    )
+
+    core.submit_frame(frame, audio_end=0.01)
+
+    (request,) = asr.requests
+    expected = normalize_frame(frame, resampler=StreamingResampler(48_000))
+    assert request.samples.dtype == np.float32
+    np.testing.assert_allclose(request.samples, expected, atol=1e-6)
+    np.testing.assert_allclose(request.samples[-100:], 0.5, atol=1e-3)
+
+
+def test_core_returns_pooled_frame_buffers_once_they_reach_the_ring() -> None:
+    asr = FakeAsrBackend(hypotheses=[('en', ())])
+    core = RealtimeCaptionCore(
+        session_id='pool',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=5,
+    )
+    pool = SampleBufferPool(buffers=4, buffer_samples=10)
+
+    for sequence in range(1, 21):
+        samples, lease = pool.acquire(10)
+        assert lease is not None
+        samples[:] = sequence / 100
+        frame = AudioFrame('capture', samples, 100, 1, sequence, 0.0, lease)
+        core.enqueue_frame(frame, audio_end=sequence / 10)
+        assert len(frame.samples) == 0
+
+    assert pool.misses == 0
+    assert pool.available == 4
+    np.testing.assert_allclose(
+        core.audio_range(1.9, 2.0), np.full(10, 0.2), atol=1e-6
+    )
+
+
+def test_core_returns_retained_audio_for_a_session_time_span() -> None:
+    core = RealtimeCaptionCore(
+        session_id='range',
+        asr=FakeAsrBackend(hypotheses=[]),
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=2,
+    )
+    for second in range(1, 4):
+        core.enqueue_audio(
+            np.full(100, second, dtype=np.float32), audio_end=float(second)
+        )
+
+    span = core.audio_range(1.5, 2.25)
+
+    np.testing.assert_array_equal(span, [2.0] * 50 + [3.0] * 25)
+    with pytest.raises(AudioRangeEvicted):
+        core.audio_range(0.5, 2.0)
+
+
+def test_core_readers_share_the_context_audio() -> None:
+    core = RealtimeCaptionCore(
+        session_id='readers',
+        asr=FakeAsrBackend(hypotheses=[]),
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=2,
+    )
+    core.enqueue_audio(np.full(50, 1, dtype=np.float32), audio_end=0.5)
+    core.add_audio_reader('meter')
+    core.add_audio_reader('vad', from_oldest=True)
+    core.enqueue_audio(np.full(50, 2, dtype=np.float32), audio_end=1.0)
+
+    meter = core.read_audio('meter')
+    vad = core.read_audio('vad', max_samples=80)
+    core.remove_audio_reader('meter')
+
+    np.testing.assert_array_equal(meter.head, [2.0] * 50)
+    np.testing.assert_array_equal(vad.head, [1.0] * 50 + [2.0] * 30)
+    assert (meter.start, vad.start) == (50, 0)
+    with pytest.raises(KeyError):
+        core.read_audio('meter')
+
+
+def test_core_reader_sees_every_sample_while_audio_is_enqueued() -> None:
+    core = RealtimeCaptionCore(
+        session_id='readers',
+        asr=FakeAsrBackend(hypotheses=[]),
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=30,
+    )
+    core.add_audio_reader('recorder')
+    received: list[np.ndarray] = []
+    done = Event()
+
+    def record() -> None:
+        while True:
+            finished = done.is_set()
+            chunk = core.read_audio('recorder')
+            received.extend((chunk.head.copy(), chunk.tail.copy()))
+            if finished:
+                return
+
+    recorder = Thread(target=record)
+    recorder.start()
+    for step in range(200):
+        core.enqueue_audio(
+            np.arange(step * 10, step * 10 + 10, dtype=np.float32),
+            audio_end=(step + 1) / 10,
+        )
+    done.set()
+    recorder.join(5)
+
+    np.testing.assert_array_equal(
+        np.concatenate(received), np.arange(2_000, dtype=np.float32)
+    )
+
+
+def test_core_with_int16_context_sends_float32_windows() -> None:
+    asr = FakeAsrBackend(hypotheses=[('en', ())])
+    core = RealtimeCaptionCore(
+        session_id='compact',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=2,
+        audio_dtype='int16',
+    )
+    samples = np.linspace(-1.0, 1.0, 100, dtype=np.float32)
+
+    core.submit_audio(samples, audio_end=1.0)
+
+    (request,) = asr.requests
+    assert request.samples.dtype == np.float32
+    np.testing.assert_allclose(
+        request.samples, samples, atol=0.5 / 32767 + 1e-7
+    )
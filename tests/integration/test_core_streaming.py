@@ -0,0 +1,175 @@
+import numpy as np
+
+from real_time_captions.backends.protocols import StreamingAsrBackend
+from real_time_captions.contracts import (
+    AsrHypothesis,
+    InferenceRequest,
+    TargetLanguage,
+    Word,
+)
+from real_time_captions.core import RealtimeCaptionCore
+from tests.fakes import FakeAsrBackend, FakeTranslationBackend
+
+
+class RecordingStreamingBackend:
+    def __init__(self) -> None:
+        self.deltas: list[list[float]] = []
+        self.events: list[str] = []
+        self.core: RealtimeCaptionCore | None = None
+        self.nested_audio: list[np.ndarray] = []
+
+    def transcribe_delta(self, request: InferenceRequest) -> AsrHypothesis:
+        self.deltas.append(request.samples.tolist())
+        self.events.append(f'delta:{request.sequence}')
+        while self.nested_audio and self.core is not None:
+            self.core.submit_audio(self.nested_audio.pop(0), audio_end=1.0)
+        return AsrHypothesis(
+            request.session_id,
+            request.sequence,
+            (Word('Ahoj', 0.0, 0.2),),
+            'cs',
+            1.0,
+            request.audio_end,
+        )
+
+    def reset_stream(self, session_id: str) -> None:
+        self.events.append(f'reset:{session_id}')
+
+    def finalize_stream(self, session_id: str) -> tuple[Word, ...]:
+        self.events.append(f'finalize:{session_id}')
+        return (Word('Ahoj', 0.0, 0.2), Word('svete', 0.2, 0.6))
+
+
+class CancellingStreamingBackend(RecordingStreamingBackend):
+    # Newer audio arrives mid-call and the backend honours the token.
+    def transcribe_delta(self, request: InferenceRequest) -> AsrHypothesis:
+        if self.core is not None and self.nested_audio:
+            self.core.enqueue_audio(self.nested_audio.pop(0), audio_end=1.25)
+        assert request.cancellation is not None
+        request.cancellation.raise_if_cancelled()
+        return super().transcribe_delta(request)
+
+
+def make_core(
+    asr: object,
+    sample_rate: int = 4,
+    context_seconds: int = 2,
+    max_lag: float | None = None,
+    supersede_after: float | None = None,
+    update_interval: float | None = None,
+) -> RealtimeCaptionCore:
+    return RealtimeCaptionCore(
+        session_id='stream',
+        asr=asr,  # type: ignore[arg-type]
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=sample_rate,
+        context_seconds=context_seconds,
+        max_lag=max_lag,
+        supersede_after=supersede_after,
+        update_interval=update_interval,
+    )
+
+
+def test_streaming_backend_receives_only_new_samples() -> None:
+    asr = RecordingStreamingBackend()
+    core = make_core(asr)
+
+    core.submit_audio(np.array([1, 2, 3], dtype=np.float32), audio_end=0.75)
+    core.submit_audio(np.array([4, 5], dtype=np.float32), audio_end=1.25)
+
+    assert isinstance(asr, StreamingAsrBackend)
+    assert asr.deltas == [[1, 2, 3], [4, 5]]
+
+
+def test_coalesced_windows_accumulate_into_the_next_delta() -> None:
+    asr = RecordingStreamingBackend()
+    core = make_core(asr)
+    asr.core = core
+    asr.nested_audio = [
+        np.array([2], dtype=np.float32),
+        np.array([3, 4], dtype=np.float32),
+    ]
+
+    core.submit_audio(np.array([1], dtype=np.float32), audio_end=0.25)
+
+    assert asr.deltas == [[1], [2, 3, 4]]
+    assert asr.events == ['delta:1', 'delta:3']
+
+
+def test_expired_delta_audio_is_resent_with_the_next_delta() -> None:
+    asr = RecordingStreamingBackend()
+    core = make_core(
+        asr,
+        sample_rate=10,
+        context_seconds=5,
+        max_lag=0.5,
+        update_interval=1.0,
+    )
+    core.enqueue_audio(np.full(10, 1, dtype=np.float32), audio_end=1.0)
+    core.enqueue_audio(np.full(10, 2, dtype=np.float32), audio_end=1.8)
+
+    assert core.process_next() is None
+    core.enqueue_audio(np.full(10, 3, dtype=np.float32), audio_end=2.0)
+    while core.process_next() is not None:
+        pass
+
+    assert asr.events == ['delta:3']
+    assert asr.deltas == [np.repeat([1.0, 2.0, 3.0], 10).tolist()]
+
+
+def test_finalize_uses_stream_words_and_resets_for_next_utterance() -> None:
+    asr = RecordingStreamingBackend()
+    core = make_core(asr)
+    core.submit_audio(np.ones(2, dtype=np.float32), audio_end=0.5)
+
+    finalized = core.finalize()
+    repeated = core.finalize()
+    core.submit_audio(np.ones(1, dtype=np.float32), audio_end=0.75)
+
+    assert finalized.source_committed == 'Ahoj svete'
+    assert repeated == finalized
+    assert asr.events == [
+        'delta:1',
+        'finalize:stream',
+        'reset:stream',
+        'delta:2',
+    ]
+    assert asr.deltas[-1] == [1.0]
+
+
+def test_cancelled_delta_audio_is_resent_with_the_next_delta() -> None:
+    asr = CancellingStreamingBackend()
+    core = make_core(asr, supersede_after=0.5)
+    asr.core = core
+    asr.nested_audio = [np.array([3, 4, 5], dtype=np.float32)]
+    core.enqueue_audio(np.array([1, 2], dtype=np.float32), audio_end=0.5)
+
+    while core.process_next() is not None:
+        pass
+
+    assert asr.events == ['delta:2']
+    assert asr.deltas == [[1, 2, 3, 4, 5]]
+
+
+def test_final_delta_covers_preempted_interim_audio() -> None:
+    asr = RecordingStreamingBackend()
+    core = make_core(asr)
+    core.enqueue_audio(np.array([1, 2], dtype=np.float32), audio_end=0.5)
+    core.enqueue_audio(np.array([3], dtype=np.float32), audio_end=0.75)
+
+    core.finalize()
+
+    assert asr.events == ['delta:2', 'finalize:stream', 'reset:stream']
+    assert asr.deltas == [[1, 2, 3]]
+
+
+def test_full_window_backends_keep_receiving_the_rolling_context() -> None:
+    asr = FakeAsrBackend(hypotheses=[('cs', ()), ('cs', ())])
+    core = make_core(asr)
+
+    core.submit_audio(np.array([1, 2, 3], dtype=np.float32), audio_end=0.75)
+    core.submit_audio(np.array([4, 5], dtype=np.float32), audio_end=1.25)
+
+    assert not isinstance(asr, StreamingAsrBackend)
+    assert asr.requests[1].samples.tolist() == [1, 2, 3, 4, 5]
@@ -0,0 +1,378 @@
+from collections import defaultdict
+from threading import Condition, Event
+from time import sleep
+
+import numpy as np
+import pytest
+
+from real_time_captions.audio.ring_buffer import AudioWindow
+from real_time_captions.contracts import (
+    AsrHypothesis,
+    InferenceCancelled,
+    InferenceRequest,
+    TargetLanguage,
+    Word,
+)
+from real_time_captions.core import RealtimeCaptionCore
+from real_time_captions.diagnostics import RuntimeMetrics
+from tests.fakes import FakeTranslationBackend
+
+
+class GatedAsrBackend:
+    def __init__(self, fail_first: bool = False) -> None:
+        self.started = Event()
+        self.release = Event()
+        self.sequences: list[int] = []
+        self._fail_first = fail_first
+
+    def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+        self.sequences.append(request.sequence)
+        self.started.set()
+        assert self.release.wait(timeout=5)
+        if self._fail_first and len(self.sequences) == 1:
+            raise RuntimeError('asr failed')
+        return AsrHypothesis(
+            request.session_id,
+            request.sequence,
+            (Word('Ahoj', 0.0, 0.2),),
+            'cs',
+            1.0,
+            request.audio_end,
+        )
+
+
+def make_core(asr: GatedAsrBackend) -> RealtimeCaptionCore:
+    return RealtimeCaptionCore(
+        session_id='worker',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=10,
+        context_seconds=2,
+    )
+
+
+def test_worker_mode_ingests_audio_while_inference_is_in_flight() -> None:
+    asr = GatedAsrBackend()
+    core = make_core(asr)
+    delivered = []
+    core.start_worker(on_snapshot=delivered.append)
+    try:
+        pristine = core.submit_audio(
+            np.ones(2, dtype=np.float32), audio_end=0.2
+        )
+        assert asr.started.wait(timeout=5)
+        for index in range(2, 6):
+            returned = core.submit_audio(
+                np.ones(2, dtype=np.float32), audio_end=index / 5
+            )
+            assert returned == pristine
+        asr.release.set()
+        latest = pristine
+        while not latest.source_committed:
+            waited = core.wait_for_snapshot(latest, timeout=5)
+            assert waited is not None
+            latest = waited
+    finally:
+        asr.release.set()
+        core.stop_worker(timeout=5)
+
+    assert delivered[0].source_provisional == 'Ahoj'
+    assert delivered[-1] == latest
+    assert asr.sequences == [1, 5]
+
+
+def test_worker_mode_delivers_changed_snapshots_to_callback() -> None:
+    asr = GatedAsrBackend()
+    asr.release.set()
+    core = make_core(asr)
+    delivered = []
+    core.start_worker(on_snapshot=delivered.append)
+    pristine = core.snapshot()
+    try:
+        core.submit_audio(np.ones(2, dtype=np.float32), audio_end=0.5)
+        assert core.wait_for_snapshot(pristine, timeout=5) is not None
+        finalized = core.finalize()
+    finally:
+        core.stop_worker(timeout=5)
+
+    assert delivered[0].source_provisional == 'Ahoj'
+    assert delivered[-1] == finalized
+    assert finalized.source_committed == 'Ahoj'
+    assert len(delivered) == len(set(delivered))
+
+
+def test_worker_error_surfaces_to_waiter_and_worker_keeps_running() -> None:
+    asr = GatedAsrBackend(fail_first=True)
+    asr.release.set()
+    core = make_core(asr)
+    core.start_worker()
+    try:
+        pristine = core.submit_audio(
+            np.ones(2, dtype=np.float32), audio_end=0.5
+        )
+        with pytest.raises(RuntimeError, match='asr failed'):
+            core.wait_for_snapshot(pristine, timeout=5)
+        core.submit_audio(np.ones(2, dtype=np.float32), audio_end=1.0)
+        recovered = core.wait_for_snapshot(pristine, timeout=5)
+    finally:
+        core.stop_worker(timeout=5)
+
+    assert recovered is not None and recovered.source_provisional == 'Ahoj'
+
+
+def test_wait_for_snapshot_times_out_without_a_change() -> None:
+    core = make_core(GatedAsrBackend())
+
+    assert core.wait_for_snapshot(core.snapshot(), timeout=0.01) is None
+
+
+def test_stopped_worker_leaves_ready_work_for_synchronous_processing() -> None:
+    asr = GatedAsrBackend()
+    asr.release.set()
+    core = make_core(asr)
+    core.start_worker()
+    core.stop_worker(timeout=5)
+
+    snapshot = core.submit_audio(np.ones(2, dtype=np.float32), audio_end=0.5)
+
+    assert core.worker_running is False
+    assert snapshot.source_provisional == 'Ahoj'
+
+
+def test_starting_a_second_worker_is_rejected() -> None:
+    core = make_core(GatedAsrBackend())
+    core.start_worker()
+    try:
+        with pytest.raises(RuntimeError, match='worker is already running'):
+            core.start_worker()
+    finally:
+        core.stop_worker(timeout=5)
+
+
+def test_coalesced_windows_are_never_materialized(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    materialized: list[int] = []
+    original = AudioWindow.materialize
+
+    def counting(window: AudioWindow) -> np.ndarray:
+        samples = original(window)
+        materialized.append(window.stop)
+        return samples
+
+    monkeypatch.setattr(AudioWindow, 'materialize', counting)
+    asr = GatedAsrBackend()
+    core = make_core(asr)
+    core.start_worker()
+    try:
+        core.submit_audio(np.ones(2, dtype=np.float32), audio_end=0.2)
+        assert asr.started.wait(timeout=5)
+        for index in range(2, 6):
+            core.submit_audio(np.ones(2, dtype=np.float32), audio_end=index / 5)
+        asr.release.set()
+    finally:
+        asr.release.set()
+        core.stop_worker(timeout=5)
+        core.finalize()
+
+    assert materialized == [2, 10]
+
+
+class PerSequenceAsrBackend:
+    def __init__(self, failing: int | None = None) -> None:
+        self.gates: defaultdict[int, Event] = defaultdict(Event)
+        self.started: list[int] = []
+        self._changed = Condition()
+        self._failing = failing
+
+    def wait_started(self, count: int) -> bool:
+        with self._changed:
+            return self._changed.wait_for(
+                lambda: len(self.started) >= count, timeout=5
+            )
+
+    def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+        with self._changed:
+            self.started.append(request.sequence)
+            self._changed.notify_all()
+        assert self.gates[request.sequence].wait(timeout=5)
+        if request.sequence == self._failing:
+            raise RuntimeError('asr failed')
+        texts = ('jedna', 'dva', 'tri')[: request.sequence]
+        return AsrHypothesis(
+            request.session_id,
+            request.sequence,
+            tuple(
+                Word(text, index * 0.05, index * 0.05 + 0.04)
+                for index, text in enumerate(texts)
+            ),
+            'cs',
+            1.0,
+            request.audio_end,
+        )
+
+
+def make_pipelined_core(asr: PerSequenceAsrBackend) -> RealtimeCaptionCore:
+    return RealtimeCaptionCore(
+        session_id='pipelined',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=10,
+        context_seconds=2,
+        pipeline_depth=2,
+    )
+
+
+def test_pipelined_windows_overlap_and_apply_in_sequence_order() -> None:
+    asr = PerSequenceAsrBackend()
+    core = make_pipelined_core(asr)
+    delivered = []
+    core.start_worker(on_snapshot=delivered.append)
+    try:
+        for index in range(1, 4):
+            core.submit_audio(np.ones(2, dtype=np.float32), audio_end=index / 5)
+        assert asr.wait_started(2)
+        assert core.queue_depth == 3
+        asr.gates[2].set()
+        assert core.wait_for_snapshot(core.snapshot(), timeout=0.05) is None
+        asr.gates[1].set()
+        assert asr.wait_started(3)
+        asr.gates[3].set()
+        latest = core.snapshot()
+        while latest.source_provisional != 'jedna dva tri':
+            waited = core.wait_for_snapshot(latest, timeout=5)
+            assert waited is not None
+            latest = waited
+    finally:
+        for gate in (1, 2, 3):
+            asr.gates[gate].set()
+        core.stop_worker(timeout=5)
+
+    assert asr.started[:2] == [1, 2]
+    assert [snapshot.source_provisional for snapshot in delivered] == [
+        'jedna',
+        'jedna dva',
+        'jedna dva tri',
+    ]
+
+
+def test_pipelined_result_behind_a_failed_window_is_superseded() -> None:
+    asr = PerSequenceAsrBackend(failing=1)
+    core = make_pipelined_core(asr)
+    delivered = []
+    core.start_worker(on_snapshot=delivered.append)
+    pristine = core.snapshot()
+    try:
+        core.submit_audio(np.ones(2, dtype=np.float32), audio_end=0.2)
+        core.submit_audio(np.ones(2, dtype=np.float32), audio_end=0.4)
+        assert asr.wait_started(2)
+        asr.gates[2].set()
+        asr.gates[1].set()
+        with pytest.raises(RuntimeError, match='asr failed'):
+            core.wait_for_snapshot(pristine, timeout=5)
+        core.finalize()
+    finally:
+        core.stop_worker(timeout=5)
+
+    assert delivered == []
+    assert core.queue_depth == 0
+
+
+def test_streaming_backends_cannot_be_pipelined() -> None:
+    class Streaming:
+        def transcribe_delta(self, request: InferenceRequest) -> AsrHypothesis:
+            raise NotImplementedError
+
+        def reset_stream(self, session_id: str) -> None:
+            pass
+
+        def finalize_stream(self, session_id: str) -> tuple[Word, ...]:
+            return ()
+
+    with pytest.raises(ValueError, match='pipeline_depth 1'):
+        RealtimeCaptionCore(
+            session_id='pipelined',
+            asr=Streaming(),
+            translator=FakeTranslationBackend({}),
+            target=TargetLanguage.NATIVE,
+            sample_rate=10,
+            context_seconds=2,
+            pipeline_depth=2,
+        )
+
+
+class SteppedAsrBackend:
+    def __init__(self) -> None:
+        self.started = Event()
+        self.sequences: list[int] = []
+
+    def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+        self.sequences.append(request.sequence)
+        self.started.set()
+        assert request.cancellation is not None
+        if len(self.sequences) == 1:
+            # Decode steps of a long first window, checking between steps.
+            for _ in range(500):
+                request.cancellation.raise_if_cancelled()
+                sleep(0.01)
+            raise AssertionError('first request was never cancelled')
+        return AsrHypothesis(
+            request.session_id,
+            request.sequence,
+            (Word('Ahoj', 0.0, 0.2),),
+            'cs',
+            1.0,
+            request.audio_end,
+        )
+
+
+def test_superseded_in_flight_request_is_cancelled_between_decode_steps() -> None:
+    asr = SteppedAsrBackend()
+    metrics = RuntimeMetrics(max_samples=4)
+    core = RealtimeCaptionCore(
+        session_id='cancel',
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=10,
+        context_seconds=2,
+        supersede_after=0.5,
+        metrics=metrics,
+    )
+    core.start_worker()
+    try:
+        pristine = core.submit_audio(
+            np.ones(2, dtype=np.float32), audio_end=0.2
+        )
+        assert asr.started.wait(timeout=5)
+        for index in range(2, 5):
+            core.submit_audio(np.ones(2, dtype=np.float32), audio_end=index / 5)
+        recovered = core.wait_for_snapshot(pristine, timeout=5)
+    finally:
+        core.stop_worker(timeout=5)
+
+    assert recovered is not None and recovered.source_provisional == 'Ahoj'
+    assert asr.sequences == [1, 4]
+    assert metrics.snapshot().cancelled_requests == 1
+
+
+def test_cancelled_request_is_not_reported_as_a_failure() -> None:
+    class Cancelling:
+        def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+            raise InferenceCancelled('inference request was superseded')
+
+    core = RealtimeCaptionCore(
+        session_id='cancel',
+        asr=Cancelling(),
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=10,
+        context_seconds=2,
+    )
+
+    snapshot = core.submit_audio(np.ones(2, dtype=np.float32), audio_end=0.2)
+
+    assert snapshot == core.snapshot()
+    assert core.queue_depth == 0
@@ -0,0 +1,64 @@
+import pytest
+
+from real_time_captions.streaming.adaptive import AdaptiveWindowController
+
+
+def test_window_starts_at_the_upper_bound() -> None:
+    controller = AdaptiveWindowController(2.0, 8.0, target_rtf=0.5)
+
+    assert controller.window_seconds == 8.0
+    assert controller.last_rtf is None
+
+
+def test_slow_inference_shrinks_window_toward_target_rtf() -> None:
+    controller = AdaptiveWindowController(2.0, 8.0, target_rtf=0.5)
+
+    assert controller.observe(elapsed=8.0, audio_seconds=8.0) == 4.0
+    assert controller.last_rtf == 1.0
+
+
+def test_window_never_shrinks_below_lower_bound() -> None:
+    controller = AdaptiveWindowController(2.0, 8.0, target_rtf=0.5)
+
+    assert controller.observe(elapsed=80.0, audio_seconds=8.0) == 2.0
+
+
+def test_fast_inference_grows_window_back_to_upper_bound() -> None:
+    controller = AdaptiveWindowController(
+        2.0, 8.0, target_rtf=0.5, grow_seconds=1.0
+    )
+    controller.observe(elapsed=8.0, audio_seconds=8.0)
+
+    grown = [controller.observe(0.1, controller.window_seconds) for _ in range(6)]
+
+    assert grown == [5.0, 6.0, 7.0, 8.0, 8.0, 8.0]
+
+
+def test_rtf_within_headroom_band_holds_window() -> None:
+    controller = AdaptiveWindowController(2.0, 8.0, target_rtf=0.5)
+    controller.observe(elapsed=8.0, audio_seconds=8.0)
+
+    assert controller.observe(elapsed=1.6, audio_seconds=4.0) == 4.0
+    assert controller.last_rtf == pytest.approx(0.4)
+
+
+def test_empty_window_is_not_measured() -> None:
+    controller = AdaptiveWindowController(2.0, 8.0, target_rtf=0.5)
+
+    assert controller.observe(elapsed=1.0, audio_seconds=0.0) == 8.0
+    assert controller.last_rtf is None
+
+
+@pytest.mark.parametrize(
+    ('arguments', 'message'),
+    [
+        ((0.0, 8.0, 0.5), 'window bounds'),
+        ((9.0, 8.0, 0.5), 'window bounds'),
+        ((2.0, 8.0, 0.0), 'target_rtf must be positive'),
+    ],
+)
+def test_invalid_configuration_is_rejected(
+    arguments: tuple[float, float, float], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        AdaptiveWindowController(*arguments)
@@ -2,11 +2,21 @@ import numpy as np
 import pytest
 
 from real_time_captions.contracts import InferenceRequest
-from real_time_captions.streaming.scheduler import LatestWindowScheduler
+from real_time_captions.streaming.scheduler import (
+    CadenceScheduler,
+    LatestWindowScheduler,
+)
 
 
-def request(sequence: int, session_id: str = "s1") -> InferenceRequest:
-    return InferenceRequest(session_id, sequence, np.array([sequence]), float(sequence))
+def request(
+    sequence: int, session_id: str = "s1", audio_end: float | None = None
+) -> InferenceRequest:
+    return InferenceRequest(
+        session_id,
+        sequence,
+        np.array([sequence]),
+        float(sequence) if audio_end is None else audio_end,
+    )
 
 
 def test_submit_dispatches_immediately_when_idle() -> None:
@@ -85,3 +95,288 @@ def test_pending_request_from_before_reset_cannot_be_promoted_later() -> None:
     assert post_reset is not None and post_reset.sequence == 3
     assert scheduler.complete('s1', 3) is None
     assert scheduler.in_flight is False
+
+
+def test_queue_depth_counts_active_and_latest_pending_request() -> None:
+    scheduler = LatestWindowScheduler()
+    assert scheduler.queue_depth == 0
+
+    scheduler.submit(request(1))
+    assert scheduler.queue_depth == 1
+    scheduler.submit(request(2))
+    scheduler.submit(request(3))
+    assert scheduler.queue_depth == 2
+
+    scheduler.complete('s1', 1)
+    assert scheduler.queue_depth == 1
+
+
+def test_cadence_issues_at_most_one_window_per_update_interval() -> None:
+    scheduler = CadenceScheduler(update_interval=0.5)
+
+    dispatched = []
+    for index in range(1, 102):
+        issued = scheduler.submit(request(index, audio_end=index * 0.01))
+        if issued is not None:
+            dispatched.append(issued.audio_end)
+            scheduler.complete("s1", issued.sequence)
+
+    assert dispatched == pytest.approx([0.01, 0.51, 1.01])
+    assert scheduler.skipped_count == 98
+
+
+def test_cadence_keeps_latest_window_coalescing_while_busy() -> None:
+    scheduler = CadenceScheduler(update_interval=0.5)
+
+    scheduler.submit(request(1, audio_end=0.5))
+    assert scheduler.submit(request(2, audio_end=1.0)) is None
+    assert scheduler.submit(request(3, audio_end=1.5)) is None
+
+    promoted = scheduler.complete("s1", 1)
+
+    assert promoted is not None and promoted.sequence == 3
+    assert scheduler.coalesced_count == 1
+    assert scheduler.skipped_count == 0
+
+
+def test_cadence_completion_promotes_a_newer_deferred_window() -> None:
+    scheduler = CadenceScheduler(update_interval=0.5)
+    scheduler.submit(request(1, audio_end=0.0))
+    assert scheduler.submit(request(2, audio_end=0.5)) is None
+    for sequence, audio_end in enumerate((0.6, 0.7, 0.8, 0.9), start=3):
+        assert scheduler.submit(request(sequence, audio_end=audio_end)) is None
+
+    promoted = scheduler.complete("s1", 1)
+
+    assert promoted is not None and promoted.audio_end == 0.9
+    assert scheduler.escalate() is None
+    assert scheduler.coalesced_count == 1
+    assert scheduler.skipped_count == 3
+
+
+def test_cadence_reset_forgets_deferred_work_and_cadence() -> None:
+    scheduler = CadenceScheduler(update_interval=0.5)
+    scheduler.submit(request(1, audio_end=0.5))
+    scheduler.submit(request(2, audio_end=0.6))
+
+    scheduler.reset()
+
+    assert scheduler.escalate() is None
+    issued = scheduler.submit(request(3, audio_end=0.7))
+    assert issued is not None and issued.sequence == 3
+
+
+@pytest.mark.parametrize("update_interval", [0.0, -0.5])
+def test_cadence_rejects_non_positive_interval(update_interval: float) -> None:
+    with pytest.raises(ValueError, match="update_interval must be positive"):
+        CadenceScheduler(update_interval)
+
+
+def test_stale_pending_request_gives_way_to_fresher_deferred_window() -> None:
+    scheduler = CadenceScheduler(update_interval=1.0, max_lag=0.5)
+    scheduler.submit(request(1, audio_end=1.0))
+    scheduler.submit(request(2, audio_end=2.0))
+    scheduler.submit(request(3, audio_end=2.8))
+
+    promoted = scheduler.complete("s1", 1)
+
+    assert promoted is not None and promoted.sequence == 3
+    assert scheduler.stale_count == 0
+    assert scheduler.coalesced_count == 1
+
+
+def test_fresh_pending_request_is_promoted_under_deadline() -> None:
+    scheduler = LatestWindowScheduler(max_lag=0.5)
+    scheduler.submit(request(1, audio_end=1.0))
+    scheduler.submit(request(2, audio_end=2.0))
+
+    promoted = scheduler.complete("s1", 1)
+
+    assert promoted is not None and promoted.sequence == 2
+    assert scheduler.stale_count == 0
+
+
+def test_expire_drops_stale_active_and_promotes_fresh_pending() -> None:
+    scheduler = LatestWindowScheduler(max_lag=0.5)
+    scheduler.submit(request(1, audio_end=1.0))
+    scheduler.submit(request(2, audio_end=2.0))
+
+    assert scheduler.is_stale(request(1, audio_end=1.0))
+    promoted = scheduler.expire("s1", 1)
+
+    assert promoted is not None and promoted.sequence == 2
+    assert scheduler.stale_count == 1
+
+
+def test_expire_rejects_fresh_or_unknown_active_request() -> None:
+    scheduler = LatestWindowScheduler(max_lag=0.5)
+    scheduler.submit(request(1, audio_end=1.0))
+
+    with pytest.raises(ValueError, match="not stale"):
+        scheduler.expire("s1", 1)
+    with pytest.raises(ValueError, match="does not match"):
+        scheduler.expire("s1", 2)
+
+
+def test_without_deadline_nothing_is_stale() -> None:
+    scheduler = LatestWindowScheduler()
+    scheduler.submit(request(1, audio_end=1.0))
+    scheduler.submit(request(2, audio_end=100.0))
+
+    assert not scheduler.is_stale(request(1, audio_end=1.0))
+
+
+def test_reset_forgets_the_freshness_reference() -> None:
+    scheduler = LatestWindowScheduler(max_lag=0.5)
+    scheduler.submit(request(1, audio_end=5.0))
+    scheduler.reset()
+    scheduler.submit(request(2, audio_end=1.0))
+
+    assert not scheduler.is_stale(request(2, audio_end=1.0))
+
+
+def test_negative_max_lag_is_rejected() -> None:
+    with pytest.raises(ValueError, match="max_lag must be non-negative"):
+        LatestWindowScheduler(max_lag=-0.1)
+
+
+def test_pipelined_depth_keeps_several_requests_in_flight() -> None:
+    scheduler = LatestWindowScheduler(depth=2)
+
+    assert scheduler.submit(request(1)) is not None
+    assert scheduler.submit(request(2)) is not None
+    assert scheduler.submit(request(3)) is None
+    assert scheduler.queue_depth == 3
+    assert [scheduler.position("s1", sequence) for sequence in (1, 2, 3)] == [
+        0,
+        1,
+        None,
+    ]
+
+
+def test_pipelined_completion_in_any_order_promotes_latest_pending() -> None:
+    scheduler = LatestWindowScheduler(depth=2)
+    for sequence in range(1, 5):
+        scheduler.submit(request(sequence))
+
+    promoted = scheduler.complete("s1", 2)
+
+    assert promoted is not None and promoted.sequence == 4
+    assert scheduler.coalesced_count == 1
+    assert [scheduler.position("s1", sequence) for sequence in (1, 4)] == [0, 1]
+    assert scheduler.complete("s1", 1) is None
+    assert scheduler.position("s1", 4) == 0
+
+
+@pytest.mark.parametrize("depth", [0, -1, True])
+def test_pipeline_depth_must_be_a_positive_integer(depth: int) -> None:
+    with pytest.raises(ValueError, match="depth must be a positive integer"):
+        LatestWindowScheduler(depth=depth)
+
+
+def test_active_request_is_superseded_once_pending_audio_runs_ahead() -> None:
+    scheduler = LatestWindowScheduler(supersede_after=0.5)
+    scheduler.submit(request(1, audio_end=1.0))
+    scheduler.submit(request(2, audio_end=1.4))
+
+    assert not scheduler.is_superseded("s1", 1)
+    scheduler.submit(request(3, audio_end=1.6))
+    assert scheduler.is_superseded("s1", 1)
+    assert scheduler.is_superseded("s1", 99)
+
+
+def test_nothing_is_superseded_without_a_bound() -> None:
+    scheduler = LatestWindowScheduler()
+    scheduler.submit(request(1, audio_end=1.0))
+    scheduler.submit(request(2, audio_end=100.0))
+
+    assert not scheduler.is_superseded("s1", 1)
+
+
+def test_escalated_final_is_promoted_before_later_interim_work() -> None:
+    scheduler = LatestWindowScheduler()
+    scheduler.submit(request(1))
+    scheduler.submit(request(2))
+
+    assert scheduler.escalate() is None
+    assert scheduler.final_pending
+    scheduler.submit(request(3))
+    promoted = scheduler.complete("s1", 1)
+
+    assert promoted is not None and promoted.sequence == 2
+    assert scheduler.queue_depth == 2
+    later = scheduler.complete("s1", 2)
+    assert later is not None and later.sequence == 3
+
+
+def test_escalate_dispatches_immediately_when_a_slot_is_free() -> None:
+    scheduler = CadenceScheduler(update_interval=0.5)
+    scheduler.submit(request(1, audio_end=0.5))
+    scheduler.complete("s1", 1)
+    scheduler.submit(request(2, audio_end=0.6))
+
+    final = scheduler.escalate()
+
+    assert final is not None and final.sequence == 2
+    assert scheduler.escalate() is None
+    assert not scheduler.final_pending
+
+
+def test_cadence_escalation_takes_deferred_tail_and_preempts_pending() -> None:
+    scheduler = CadenceScheduler(update_interval=0.5)
+    scheduler.submit(request(1, audio_end=0.5))
+    scheduler.submit(request(2, audio_end=1.0))
+    scheduler.submit(request(3, audio_end=1.2))
+
+    assert scheduler.escalate() is None
+    promoted = scheduler.complete("s1", 1)
+
+    assert promoted is not None and promoted.sequence == 3
+    assert scheduler.preempted_count == 1
+
+
+def test_final_work_is_never_stale_or_superseded() -> None:
+    scheduler = CadenceScheduler(
+        update_interval=0.5, max_lag=0.5, depth=2, supersede_after=0.5
+    )
+    scheduler.submit(request(1, audio_end=1.0))
+    scheduler.submit(request(2, audio_end=1.2))
+    final = scheduler.escalate()
+    scheduler.submit(request(3, audio_end=5.0))
+
+    assert final is not None and final.sequence == 2
+    assert not scheduler.is_stale(final)
+    assert not scheduler.is_superseded("s1", 2)
+    assert scheduler.is_superseded("s1", 1)
+
+
+def test_displace_hands_an_unstarted_slot_to_the_pending_window() -> None:
+    scheduler = LatestWindowScheduler()
+    scheduler.submit(request(1))
+    assert scheduler.displace("s1", 1) is None
+    scheduler.submit(request(2))
+
+    promoted = scheduler.displace("s1", 1)
+
+    assert promoted is not None and promoted.sequence == 2
+    assert scheduler.coalesced_count == 1
+    assert scheduler.position("s1", 1) is None
+    scheduler.submit(request(3))
+    scheduler.escalate()
+    assert scheduler.displace("s1", 2) is None
+    with pytest.raises(ValueError, match="does not match"):
+        scheduler.displace("s1", 1)
+
+
+def test_preempt_drops_interim_request_and_promotes_final() -> None:
+    scheduler = LatestWindowScheduler()
+    scheduler.submit(request(1))
+    scheduler.submit(request(2))
+    scheduler.escalate()
+
+    promoted = scheduler.preempt("s1", 1)
+
+    assert promoted is not None and promoted.sequence == 2
+    assert scheduler.preempted_count == 1
+    with pytest.raises(ValueError, match="does not match"):
+        scheduler.preempt("s1", 1)
@@ -209,3 +209,16 @@ def test_committed_output_is_append_only_across_updates() -> None:
         previous = result.committed
 
     assert [word.text for word in previous] == ["a", "bé", "c"]
+
+
+def test_last_committed_end_tracks_committed_boundary_and_reset() -> None:
+    stabilizer = HypothesisStabilizer(required_agreements=2, guard_seconds=0.0)
+    hypothesis = words(("hranice", 0.2, 0.9))
+
+    assert stabilizer.last_committed_end is None
+    stabilizer.update(hypothesis, audio_end=1.0)
+    stabilizer.update(hypothesis, audio_end=1.0)
+    assert stabilizer.last_committed_end == 0.9
+
+    stabilizer.reset()
+    assert stabilizer.last_committed_end is None
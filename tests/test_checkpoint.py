@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from real_time_captions.checkpoint import CoreCheckpoint
+from real_time_captions.contracts import TargetLanguage, Word
+from real_time_captions.core import RealtimeCaptionCore
+from tests.fakes import FakeAsrBackend, FakeTranslationBackend
+
+
+UTTERANCE = (Word('Dobrý', 0.0, 0.4), Word('den', 0.5, 0.9))
+GROWN = UTTERANCE + (Word('všem', 2.5, 2.9),)
+
+
+def make_core(asr: FakeAsrBackend) -> RealtimeCaptionCore:
+    return RealtimeCaptionCore(
+        session_id='resume',
+        asr=asr,
+        translator=FakeTranslationBackend(
+            {'Dobrý den': 'Dzień dobry', 'všem': 'wszystkim'}
+        ),
+        target=TargetLanguage.POLISH,
+        sample_rate=100,
+        context_seconds=5,
+    )
+
+
+def feed(core: RealtimeCaptionCore, seconds: range) -> None:
+    for second in seconds:
+        core.submit_audio(
+            np.full(100, second, dtype=np.float32), audio_end=float(second)
+        )
+
+
+def test_restored_core_resumes_mid_utterance_without_losing_state() -> None:
+    original_asr = FakeAsrBackend(hypotheses=[('cs', UTTERANCE)] * 2)
+    original = make_core(original_asr)
+    feed(original, range(1, 3))
+    data = original.checkpoint(include_audio=True).to_bytes()
+
+    restored_asr = FakeAsrBackend(hypotheses=[('cs', GROWN)] * 2)
+    restored = make_core(restored_asr)
+    resumed = restored.restore(CoreCheckpoint.from_bytes(data))
+    feed(restored, range(3, 4))
+    finalized = restored.finalize()
+
+    assert resumed == original.snapshot()
+    assert resumed.source_committed == 'Dobrý den'
+    assert resumed.translation_committed == 'Dzień dobry'
+    assert restored_asr.requests[0].sequence == 3
+    np.testing.assert_array_equal(
+        restored_asr.requests[0].samples, np.repeat([1.0, 2.0, 3.0], 100)
+    )
+    assert finalized.source_committed == 'Dobrý den všem'
+    assert finalized.translation_committed == 'Dzień dobry wszystkim'
+
+
+def test_checkpoint_without_audio_keeps_text_state_only() -> None:
+    core = make_core(FakeAsrBackend(hypotheses=[('cs', UTTERANCE)] * 2))
+    feed(core, range(1, 3))
+
+    checkpoint = CoreCheckpoint.from_bytes(core.checkpoint().to_bytes())
+
+    assert checkpoint.audio is None
+    assert checkpoint.stabilizer == core.checkpoint().stabilizer
+    assert checkpoint.language.current == 'cs'
+    assert checkpoint.store.committed_words == ('Dobrý', 'den')
+
+
+def test_checkpoint_from_another_session_is_rejected() -> None:
+    checkpoint = make_core(FakeAsrBackend(hypotheses=[])).checkpoint()
+    other = RealtimeCaptionCore(
+        session_id='other',
+        asr=FakeAsrBackend(hypotheses=[]),
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=100,
+        context_seconds=5,
+    )
+
+    with pytest.raises(ValueError, match='checkpoint belongs to session: resume'):
+        other.restore(checkpoint)
+
+
+@pytest.mark.parametrize(
+    ('data', 'message'),
+    [
+        (b'', 'invalid checkpoint'),
+        (b'\x02\x00\x00\x00{}', 'unsupported checkpoint schema'),
+        (b'\x18\x00\x00\x00{"schema_version":1}    ', 'invalid checkpoint'),
+    ],
+)
+def test_malformed_checkpoint_bytes_are_rejected(data: bytes, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        CoreCheckpoint.from_bytes(data)
@@ -3,7 +3,13 @@ from dataclasses import FrozenInstanceError
 import numpy as np
 import pytest
 
-from real_time_captions.contracts import AsrHypothesis, InferenceRequest, Word
+from real_time_captions.contracts import (
+    AsrHypothesis,
+    CancellationToken,
+    InferenceCancelled,
+    InferenceRequest,
+    Word,
+)
 
 
 def test_asr_hypothesis_is_immutable_and_keeps_sequence_identity() -> None:
@@ -33,3 +39,29 @@ def test_inference_request_owns_a_read_only_sample_snapshot() -> None:
     )
     with pytest.raises(ValueError, match='read-only'):
         request.samples[0] = 1.0
+
+
+def test_inference_request_adopts_read_only_owned_samples_without_copy() -> None:
+    owned = np.array([0.25, 0.5], dtype=np.float32)
+    owned.setflags(write=False)
+    read_only_view = np.array([1.0, 2.0, 3.0], dtype=np.float32)[:2]
+    read_only_view.setflags(write=False)
+
+    adopted = InferenceRequest('session-1', 3, owned, 1.5)
+    copied = InferenceRequest('session-1', 4, read_only_view, 1.5)
+
+    assert adopted.samples is owned
+    assert copied.samples is not read_only_view
+    assert copied.samples.flags.owndata
+
+
+def test_cancellation_token_aborts_only_after_cancel() -> None:
+    token = CancellationToken()
+    request = InferenceRequest('session-1', 3, np.zeros(2), 1.5, 1.3, token)
+
+    request.cancellation.raise_if_cancelled()
+    token.cancel()
+
+    assert token.cancelled
+    with pytest.raises(InferenceCancelled, match='superseded'):
+        request.cancellation.raise_if_cancelled()
@@ -109,3 +109,37 @@ def test_runtime_metrics_rejects_boolean_latency_values(
 
     with pytest.raises(ValueError, match='latency'):
         getattr(metrics, method_name)(latency)
+
+
+def test_runtime_metrics_report_latest_asr_window_and_rtf() -> None:
+    metrics = RuntimeMetrics(max_samples=2)
+    assert (metrics.snapshot().asr_window_seconds, metrics.snapshot().asr_rtf) == (None, None)
+
+    metrics.record_asr_window(8.0, 1.0)
+    metrics.record_asr_window(4.0, 0.5)
+
+    snapshot = metrics.snapshot()
+    assert (snapshot.asr_window_seconds, snapshot.asr_rtf) == (4.0, 0.5)
+
+
+@pytest.mark.parametrize(
+    ('window_seconds', 'rtf', 'name'),
+    ((-1.0, 0.5, 'window_seconds'), (4.0, float('nan'), 'rtf'), (True, 0.5, 'window_seconds')),
+)
+def test_runtime_metrics_name_the_invalid_asr_window_field(
+    window_seconds: float, rtf: float, name: str
+) -> None:
+    metrics = RuntimeMetrics(max_samples=1)
+
+    with pytest.raises(ValueError, match=f'^{name} must be'):
+        metrics.record_asr_window(window_seconds, rtf)
+    assert metrics.snapshot().asr_window_seconds is None
+
+
+def test_runtime_metrics_count_cancelled_requests() -> None:
+    metrics = RuntimeMetrics(max_samples=2)
+
+    metrics.record_cancelled_request()
+    metrics.record_cancelled_request()
+
+    assert metrics.snapshot().cancelled_requests == 2
@@ -0,0 +1,26 @@
+import pytest
+
+from real_time_captions.profiles import runtime_profile
+
+
+def test_built_in_profiles_trade_update_rate_for_context() -> None:
+    fast = runtime_profile('fast')
+    balanced = runtime_profile('balanced')
+    quality = runtime_profile('quality')
+
+    assert 0.35 <= fast.update_interval < balanced.update_interval
+    assert balanced.update_interval < quality.update_interval <= 1.0
+    assert fast.context_seconds < balanced.context_seconds
+    assert balanced.context_seconds < quality.context_seconds
+
+
+def test_lighter_profiles_store_context_audio_as_int16() -> None:
+    assert runtime_profile('fast').audio_dtype == 'int16'
+    assert runtime_profile('balanced').audio_dtype == 'int16'
+    assert runtime_profile('quality').audio_dtype == 'float32'
+
+
+@pytest.mark.parametrize('name', ['custom', 'turbo'])
+def test_custom_and_unknown_profiles_have_no_built_in_values(name: str) -> None:
+    with pytest.raises(ValueError, match='no built-in runtime profile'):
+        runtime_profile(name)
@@ -0,0 +1,255 @@
+from threading import Event, Lock
+
+import numpy as np
+import pytest
+
+from real_time_captions.contracts import (
+    AsrHypothesis,
+    CaptionSnapshot,
+    InferenceRequest,
+    TargetLanguage,
+    Word,
+)
+from real_time_captions.core import RealtimeCaptionCore
+from real_time_captions.sessions import SessionManager
+from tests.fakes import FakeTranslationBackend
+
+
+class SharedAsrBackend:
+    def __init__(self) -> None:
+        self.release = Event()
+        self.release.set()
+        self.calls: list[tuple[str, int]] = []
+        self.active = 0
+        self.peak = 0
+        self.manager: SessionManager | None = None
+        self.resubmit_until = 0
+        self._lock = Lock()
+
+    def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+        with self._lock:
+            self.calls.append((request.session_id, request.sequence))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            resubmit = len(self.calls) < self.resubmit_until
+        try:
+            assert self.release.wait(timeout=5)
+            if resubmit and self.manager is not None:
+                self.manager.submit_audio(
+                    request.session_id,
+                    np.ones(2, dtype=np.float32),
+                    request.audio_end + 0.2,
+                )
+        finally:
+            with self._lock:
+                self.active -= 1
+        return AsrHypothesis(
+            request.session_id,
+            request.sequence,
+            (Word('Ahoj', 0.0, 0.2),),
+            'cs',
+            1.0,
+            request.audio_end,
+        )
+
+
+def make_core(session_id: str, asr: SharedAsrBackend) -> RealtimeCaptionCore:
+    return RealtimeCaptionCore(
+        session_id=session_id,
+        asr=asr,
+        translator=FakeTranslationBackend({}),
+        target=TargetLanguage.NATIVE,
+        sample_rate=10,
+        context_seconds=2,
+    )
+
+
+def wait_for_calls(asr: SharedAsrBackend, count: int) -> None:
+    for _ in range(500):
+        with asr._lock:
+            if len(asr.calls) >= count and asr.active == 0:
+                return
+        Event().wait(0.01)
+    raise AssertionError('backend calls did not arrive')
+
+
+def wait_for_started(asr: SharedAsrBackend, count: int) -> None:
+    for _ in range(500):
+        with asr._lock:
+            if len(asr.calls) >= count:
+                return
+        Event().wait(0.01)
+    raise AssertionError('backend calls did not start')
+
+
+def test_pool_bounds_concurrent_backend_calls_across_sessions() -> None:
+    asr = SharedAsrBackend()
+    asr.release.clear()
+    delivered: list[CaptionSnapshot] = []
+    manager = SessionManager(2, on_snapshot=delivered.append)
+    for session_id in ('a', 'b', 'c', 'd'):
+        manager.add_session(make_core(session_id, asr))
+    manager.start()
+    try:
+        for session_id in ('a', 'b', 'c', 'd'):
+            manager.submit_audio(
+                session_id, np.ones(2, dtype=np.float32), audio_end=0.2
+            )
+        Event().wait(0.05)
+        asr.release.set()
+        wait_for_calls(asr, 4)
+    finally:
+        manager.stop(timeout=5)
+
+    assert asr.peak == 2
+    assert sorted(session_id for session_id, _ in asr.calls) == [
+        'a', 'b', 'c', 'd'
+    ]
+    assert sorted(snapshot.session_id for snapshot in delivered) == [
+        'a', 'b', 'c', 'd'
+    ]
+
+
+def test_chatty_session_cannot_starve_a_quiet_one() -> None:
+    asr = SharedAsrBackend()
+    asr.release.clear()
+    manager = SessionManager(1)
+    manager.add_session(make_core('chatty', asr))
+    manager.add_session(make_core('quiet', asr))
+    manager.start()
+    try:
+        manager.submit_audio('chatty', np.ones(2, dtype=np.float32), 0.2)
+        wait_for_started(asr, 1)
+        for index in range(2, 10):
+            manager.submit_audio(
+                'chatty', np.ones(2, dtype=np.float32), index / 5
+            )
+        manager.submit_audio('quiet', np.ones(2, dtype=np.float32), 0.2)
+        assert manager.queue_depth('chatty') == 2
+        assert manager.queue_depth('quiet') == 1
+        asr.release.set()
+        wait_for_calls(asr, 3)
+    finally:
+        manager.stop(timeout=5)
+
+    assert asr.calls == [('chatty', 1), ('quiet', 1), ('chatty', 9)]
+    assert manager.queue_depths() == {'chatty': 0, 'quiet': 0}
+
+
+def test_busy_pool_never_decodes_a_window_superseded_while_queued() -> None:
+    asr = SharedAsrBackend()
+    asr.release.clear()
+    manager = SessionManager(1)
+    manager.add_session(make_core('a', asr))
+    manager.add_session(make_core('b', asr))
+    manager.start()
+    try:
+        manager.submit_audio('a', np.ones(2, dtype=np.float32), 0.2)
+        wait_for_started(asr, 1)
+        for index in range(1, 11):
+            manager.submit_audio('b', np.ones(2, dtype=np.float32), index / 5)
+        assert manager.queue_depth('b') == 1
+        asr.release.set()
+        wait_for_calls(asr, 2)
+    finally:
+        manager.stop(timeout=5)
+
+    assert asr.calls == [('a', 1), ('b', 10)]
+
+
+def test_weights_share_workers_proportionally() -> None:
+    asr = SharedAsrBackend()
+    asr.resubmit_until = 30
+    manager = SessionManager(1)
+    asr.manager = manager
+    manager.add_session(make_core('heavy', asr), weight=2)
+    manager.add_session(make_core('light', asr), weight=1)
+    manager.submit_audio('heavy', np.ones(2, dtype=np.float32), 0.2)
+    manager.submit_audio('light', np.ones(2, dtype=np.float32), 0.2)
+    manager.start()
+    try:
+        wait_for_calls(asr, 30)
+    finally:
+        manager.stop(timeout=5)
+
+    served = [session_id for session_id, _ in asr.calls[:30]]
+    assert abs(served.count('heavy') - 2 * served.count('light')) <= 2
+
+
+def test_finalize_waits_for_hosted_session_work() -> None:
+    asr = SharedAsrBackend()
+    manager = SessionManager(1)
+    manager.add_session(make_core('s1', asr))
+    manager.start()
+    try:
+        manager.submit_audio('s1', np.ones(2, dtype=np.float32), 0.5)
+        finalized = manager.finalize('s1')
+    finally:
+        manager.stop(timeout=5)
+
+    assert finalized.source_committed == 'Ahoj'
+    assert manager.snapshot('s1') == finalized
+
+
+def test_backend_failure_is_kept_for_the_host_without_on_error() -> None:
+    class FailingAsrBackend(SharedAsrBackend):
+        def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+            super().transcribe(request)
+            raise RuntimeError('model crashed')
+
+    asr = FailingAsrBackend()
+    manager = SessionManager(1)
+    manager.add_session(make_core('s1', asr))
+    manager.start()
+    try:
+        manager.submit_audio('s1', np.ones(2, dtype=np.float32), 0.5)
+        wait_for_calls(asr, 1)
+        manager.finalize('s1')
+    finally:
+        manager.stop(timeout=5)
+
+    error = manager.take_error('s1')
+    assert isinstance(error, RuntimeError) and str(error) == 'model crashed'
+    assert manager.take_error('s1') is None
+
+
+def test_manager_rejects_invalid_sessions_and_configuration() -> None:
+    asr = SharedAsrBackend()
+    manager = SessionManager(1)
+    manager.add_session(make_core('s1', asr))
+
+    with pytest.raises(ValueError, match='workers'):
+        SessionManager(0)
+    with pytest.raises(ValueError, match='weight'):
+        manager.add_session(make_core('s2', asr), weight=0)
+    with pytest.raises(ValueError, match='already hosted'):
+        manager.add_session(make_core('s1', asr))
+    with pytest.raises(KeyError, match='unknown session'):
+        manager.queue_depth('missing')
+    assert manager.remove_session('s1').session_id == 's1'
+    assert manager.session_ids == ()
+
+
+def test_backend_errors_are_reported_per_session() -> None:
+    class FailingAsrBackend:
+        def transcribe(self, request: InferenceRequest) -> AsrHypothesis:
+            raise RuntimeError('asr failed')
+
+    errors: list[tuple[str, str]] = []
+    finished = Event()
+
+    def on_error(session_id: str, error: Exception) -> None:
+        errors.append((session_id, str(error)))
+        finished.set()
+
+    manager = SessionManager(1, on_error=on_error)
+    manager.add_session(make_core('s1', FailingAsrBackend()))  # type: ignore[arg-type]
+    manager.start()
+    try:
+        manager.submit_audio('s1', np.ones(2, dtype=np.float32), 0.5)
+        assert finished.wait(timeout=5)
+    finally:
+        manager.stop(timeout=5)
+
+    assert errors == [('s1', 'asr failed')]
+    assert manager.queue_depth('s1') == 0
@@ -34,6 +34,17 @@ class FakeSource:
     def read(self, timeout: float | None = None) -> AudioFrame | None:
         return self.frames.pop(0) if self.frames else None
 
+    def read_many(
+        self, max_frames: int | None = None, timeout: float | None = None
+    ) -> list[AudioFrame]:
+        frames, self.frames = self.frames, []
+        return frames
+
+    def drain_into(self, frames: list[AudioFrame]) -> int:
+        count = len(self.frames)
+        frames.extend(self.read_many())
+        return count
+
     def stop(self) -> None:
         return None
 
@@ -12,6 +12,7 @@ from real_time_captions.audio.capture import (
     AudioSourceNotFound,
     AudioSourceOpenError,
 )
+from real_time_captions.audio.frame import AudioFrame
 from real_time_captions.contracts import SourceState
 from real_time_captions.platforms.windows.audio.process_source import (
     ProcessAudioSource,
@@ -198,6 +199,49 @@ def test_process_restart_reattaches_with_new_session_only() -> None:
     assert source.read(0) is None
 
 
+def test_bulk_read_drains_frames_and_detects_a_stopped_tap() -> None:
+    clock = Clock()
+    factory = FakeFactory(('float32',))
+    source = make_source(
+        ScriptedResolver([ProcessInfo(42, 'Player.exe', PATH)]),
+        factory,
+        clock,
+    )
+    source.start()
+    tap = factory.taps[0]
+    for value in (1.0, 2.0, 3.0):
+        tap.emit(np.full(2, value, dtype=np.float32).tobytes())
+
+    frames = source.read_many(timeout=0)
+    tap.stop_unexpectedly()
+
+    assert [frame.sequence for frame in frames] == [1, 2, 3]
+    assert source.read_many(timeout=0) == []
+    assert source.diagnostics().state is SourceState.RECONNECTING
+
+
+def test_drain_into_appends_frames_and_detects_a_stopped_tap() -> None:
+    clock = Clock()
+    factory = FakeFactory(('float32',))
+    source = make_source(
+        ScriptedResolver([ProcessInfo(42, 'Player.exe', PATH)]),
+        factory,
+        clock,
+    )
+    source.start()
+    tap = factory.taps[0]
+    for value in (1.0, 2.0):
+        tap.emit(np.full(2, value, dtype=np.float32).tobytes())
+    frames: list[AudioFrame] = []
+
+    assert source.drain_into(frames) == 2
+    tap.stop_unexpectedly()
+
+    assert [frame.sequence for frame in frames] == [1, 2]
+    assert source.drain_into(frames) == 0
+    assert source.diagnostics().state is SourceState.RECONNECTING
+
+
 def test_reconnect_exhaustion_is_failed_and_never_falls_back() -> None:
     clock = Clock()
     factory = FakeFactory()
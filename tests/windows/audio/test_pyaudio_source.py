@@ -9,6 +9,8 @@ from real_time_captions.audio.capture import (
     AudioSourceKind,
     AudioSourceOpenError,
 )
+from real_time_captions.audio.frame import AudioFrame
+from real_time_captions.audio.frame_queue import FrameQueue, SpscFrameQueue
 from real_time_captions.contracts import SourceState
 from real_time_captions.platforms.windows.audio.pyaudio_api import WasapiDevice
 from real_time_captions.platforms.windows.audio.pyaudio_source import (
@@ -96,6 +98,7 @@ def source(
     descriptor_id: str = 'default-output',
     kind: AudioSourceKind = AudioSourceKind.SYSTEM,
     queue_seconds: float = 2.0,
+    queue_factory: Callable[[int], FrameQueue] | None = None,
 ) -> WasapiAudioSource:
     return WasapiAudioSource(
         AudioSourceDescriptor(descriptor_id, kind, 'Test source'),
@@ -103,6 +106,7 @@ def source(
         api,
         clock=clock,
         session_id_factory=lambda: 'session-1',
+        queue_factory=queue_factory,
     )
 
 
@@ -140,6 +144,65 @@ def test_queue_overflow_drops_oldest_callback_frame() -> None:
     assert capture.diagnostics().dropped_frames == 1
 
 
+def test_spsc_queue_is_a_drop_in_for_callback_frames() -> None:
+    clock = Clock()
+    api = FakeApi(device(channels=1))
+    capture = source(
+        api, clock, queue_seconds=0.04, queue_factory=SpscFrameQueue
+    )
+    capture.start()
+
+    api.streams[0].emit(np.zeros(1_920, dtype=np.float32).tobytes(), 1_920)
+    api.streams[0].emit(np.ones(1_920, dtype=np.float32).tobytes(), 1_920)
+
+    frame = capture.read(0)
+    assert frame is not None
+    assert frame.sequence == 2
+    assert capture.read(0) is None
+    assert capture.diagnostics().dropped_frames == 1
+
+
+@pytest.mark.parametrize('queue_factory', [None, SpscFrameQueue])
+def test_drain_into_appends_every_queued_frame_to_the_callers_list(
+    queue_factory: Callable[[int], FrameQueue] | None,
+) -> None:
+    clock = Clock()
+    api = FakeApi(device(channels=1))
+    capture = source(api, clock, queue_factory=queue_factory)
+    frames: list[AudioFrame] = []
+    assert capture.drain_into(frames) == 0
+    capture.start()
+
+    for value in (0.0, 1.0, 2.0):
+        chunk = np.full(1_920, value, dtype=np.float32)
+        api.streams[0].emit(chunk.tobytes(), 1_920)
+
+    assert capture.drain_into(frames) == 3
+    assert [frame.sequence for frame in frames] == [1, 2, 3]
+    assert capture.drain_into(frames) == 0
+    assert len(frames) == 3
+
+
+def test_callback_reuses_pooled_buffers_once_frames_are_released() -> None:
+    clock = Clock()
+    api = FakeApi(device(channels=1))
+    capture = source(api, clock)
+    capture.start()
+
+    api.streams[0].emit(np.zeros(1_920, dtype=np.float32).tobytes(), 1_920)
+    first = capture.read(0)
+    assert first is not None
+    slot = first.samples
+    first.release()
+    api.streams[0].emit(np.ones(1_920, dtype=np.float32).tobytes(), 1_920)
+    second = capture.read(0)
+
+    assert second is not None
+    assert np.shares_memory(slot, second.samples)
+    assert len(first.samples) == 0
+    np.testing.assert_array_equal(second.samples, 1.0)
+
+
 def test_stop_is_idempotent_and_rejects_late_callbacks() -> None:
     clock = Clock()
     api = FakeApi(device())